@@ -133,11 +133,18 @@ should_regenerate_topics() {
     # Check for essential topic model files
     local topics_file="$MODELS_DIR/discovered_topics.json"
     local transformer_topics="$MODELS_DIR/transformer_topics.json"
-    local category_embeddings="$MODELS_DIR/category_embeddings.pkl"
+    local category_embeddings="$MODELS_DIR/category_embeddings.npy"
+    local category_embeddings_header="$MODELS_DIR/category_embeddings.json"
     local blog_hash_file="$MODELS_DIR/blog_content_hash.txt"
     
+    # Category embeddings only count when both the matrix and its header were written
+    local has_category_embeddings=false
+    if [ -f "$category_embeddings" ] && [ -f "$category_embeddings_header" ]; then
+        has_category_embeddings=true
+    fi
+    
     # If no topic model files exist, regeneration is needed
-    if [ ! -f "$topics_file" ] && [ ! -f "$transformer_topics" ] && [ ! -f "$category_embeddings" ]; then
+    if [ ! -f "$topics_file" ] && [ ! -f "$transformer_topics" ] && [ "$has_category_embeddings" = false ]; then
         log_info "No topic model files found - regeneration needed"
         return 0
     fi
@@ -623,7 +630,8 @@ except Exception as e:
     transformer_available=false
     traditional_available=false
 
-    if [ -f "$MODELS_DIR/transformer_topics.json" ] || [ -f "$MODELS_DIR/category_embeddings.pkl" ]; then
+    if [ -f "$MODELS_DIR/transformer_topics.json" ] || \
+       { [ -f "$MODELS_DIR/category_embeddings.npy" ] && [ -f "$MODELS_DIR/category_embeddings.json" ]; }; then
         transformer_available=true
     fi
 
@@ -767,11 +775,11 @@ show_usage_instructions() {
     echo "• 📈 Multi-tier reliability with graceful degradation"
     echo ""
     echo "Generated files:"
-    echo "• $MODELS_DIR/category_embeddings.pkl (transformer category embeddings)"
+    echo "• $MODELS_DIR/category_embeddings.npy + .json (transformer category embeddings)"
     echo "• $MODELS_DIR/transformer_topics.json (transformer-discovered topics)"
     echo "• $MODELS_DIR/discovered_topics.json (traditional fallback topics)"
-    echo "• $MODELS_DIR/tfidf_vectorizer.pkl (traditional fallback model)"
-    echo "• $MODELS_DIR/topic_clusters.pkl (traditional fallback model)"
+    echo "• $MODELS_DIR/tfidf_vectorizer.npy + .json (traditional fallback model)"
+    echo "• $MODELS_DIR/topic_clusters.npy + .json (traditional fallback model)"
     echo "• Enhanced blog_metadata.json with unified topic classifications"
     echo ""
     echo "To use the system:"
@@ -16,6 +16,7 @@
 #   --metadata-only      Generate metadata only (skip topic discovery)
 #   --discovery-only     Run topic discovery only (skip metadata generation)
 #   --skip-topics        Generate minimal metadata without any topic processing
+#   --incremental        Regenerate metadata only for posts changed since the last run
 #   --force              Force regeneration even if files are recent
 #   --blog-folder PATH   Custom path to blog folder
 #   --help               Show this help message
@@ -47,6 +48,7 @@ METADATA_ONLY=false
 DISCOVERY_ONLY=false
 SKIP_TOPICS=false
 USE_CACHED_TOPICS=false
+INCREMENTAL=false
 FORCE_REGENERATION=false
 UPDATE_CONFIG=false
 CUSTOM_BLOG_FOLDER=""
@@ -73,6 +75,11 @@ while [[ $# -gt 0 ]]; do
             METADATA_ONLY=true  # Implies metadata-only
             shift
             ;;
+        --incremental)
+            INCREMENTAL=true
+            METADATA_ONLY=true  # Implies metadata-only
+            shift
+            ;;
         --force)
             FORCE_REGENERATION=true
             shift
@@ -106,6 +113,7 @@ if [ "$SHOW_HELP" = true ]; then
     echo "Options:"
     echo "  --metadata-only      Generate metadata only (skip topic discovery)"
     echo "  --discovery-only     Run topic discovery only (skip metadata generation)"
+    echo "  --incremental        Regenerate metadata only for posts changed since the last run"
     echo "  --force              Force regeneration even if files are recent"
     echo "  --update-config      Update topic configuration from blog content analysis"
     echo "  --blog-folder PATH   Custom path to blog folder"
@@ -115,6 +123,7 @@ if [ "$SHOW_HELP" = true ]; then
     echo "  $0                            # Update both topics and metadata"
     echo "  $0 --metadata-only            # Only regenerate metadata (faster)"
     echo "  $0 --discovery-only           # Only discover new topics"
+    echo "  $0 --incremental              # Only reprocess changed posts"
     echo "  $0 --update-config            # Update topic configuration from content"
     echo "  $0 --force                    # Force complete regeneration"
     echo ""
@@ -361,8 +370,13 @@ generate_metadata() {
         log_info "Generating metadata with enhanced topic classification..."
     fi
     
+    if [ "$INCREMENTAL" = true ] && [ "$FORCE_REGENERATION" != true ]; then
+        log_info "Incremental mode - only posts changed since the last run will be reprocessed"
+        python_args="$python_args --incremental"
+    fi
+    
     if output=$(python "$SCRIPTS_DIR/create_blog_metadata.py" $python_args 2>&1); then
-        echo "$output" | grep -E "(Extracted topics|Total posts|Blog metadata creation)" || true
+        echo "$output" | grep -E "(Extracted topics|Total posts|Topic extraction cache|Incremental update|Blog metadata creation)" || true
         
         log_success "Enhanced metadata generation completed"
         
@@ -410,8 +424,8 @@ show_completion_summary() {
     echo "Generated files:"
     if [ "$METADATA_ONLY" != true ] && [ -f "$MODELS_DIR/discovered_topics.json" ]; then
         echo "• $MODELS_DIR/discovered_topics.json"
-        echo "• $MODELS_DIR/tfidf_vectorizer.pkl"
-        echo "• $MODELS_DIR/topic_clusters.pkl"
+        echo "• $MODELS_DIR/tfidf_vectorizer.npy + .json"
+        echo "• $MODELS_DIR/topic_clusters.npy + .json"
     fi
     if [ "$DISCOVERY_ONLY" != true ] && [ -f "$METADATA_FILE" ]; then
         echo "• $METADATA_FILE"
@@ -0,0 +1,207 @@
+"""
+Cluster Selection
+Silhouette-based choice of the number of k-means clusters. Pairwise distances
+are computed once and shared by every candidate k, and candidates can be
+evaluated in parallel worker processes. Sweep results are cached by a hash of
+the feature matrix, so an unchanged corpus never repeats the sweep.
+"""
+
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sklearn.cluster import KMeans
+from scipy import sparse
+from sklearn.metrics import pairwise_distances, silhouette_score
+
+from topic_extraction_cache import hash_bytes
+
+SELECTION_CACHE_FILE_NAME = 'cluster_selection_cache.json'
+# Bump when scoring changes in a way that invalidates cached sweeps
+SELECTION_CACHE_VERSION = 1
+SELECTION_CACHE_MAX_ENTRIES = 16
+
+# Per-sweep data of pool workers, set once per process by _init_sweep_worker
+_SWEEP_CONTEXT = None
+
+
+def compute_distance_matrix(features, metric: str = 'euclidean',
+                            sample_size: Optional[int] = None,
+                            random_state: int = 42) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Return pairwise distances of the rows used for silhouette scoring.
+
+    Corpora larger than sample_size are scored on a fixed random sample of
+    rows, drawn once so every k is compared on the same documents. The row
+    indices of the sample are returned alongside (None when all rows are used).
+    """
+    n_samples = features.shape[0]
+    indices = None
+    if sample_size is not None and n_samples > sample_size:
+        indices = np.random.RandomState(random_state).choice(n_samples, sample_size, replace=False)
+        features = features[indices]
+    return pairwise_distances(features, metric=metric), indices
+
+
+def evaluate_k(features, distances: np.ndarray, indices: Optional[np.ndarray], k: int,
+               random_state: int = 42, n_init: int = 10) -> float:
+    """Fit k-means with k clusters and return its silhouette score."""
+    kmeans = KMeans(n_clusters=k, random_state=random_state, n_init=n_init)
+    cluster_labels = kmeans.fit_predict(features)
+    if indices is not None:
+        cluster_labels = cluster_labels[indices]
+    return silhouette_score(distances, cluster_labels, metric='precomputed')
+
+
+def _init_sweep_worker(context):
+    """Initialize a pool worker with the features and distances of the sweep."""
+    global _SWEEP_CONTEXT
+    _SWEEP_CONTEXT = context
+    try:
+        from threadpoolctl import threadpool_limits
+        # Parallelism comes from the pool; keep each worker's k-means single-threaded
+        threadpool_limits(1)
+    except ImportError:
+        pass
+
+
+def _evaluate_k_worker(k: int, context=None) -> Tuple[int, Optional[float], Optional[str]]:
+    """Score one k, returning the error message instead of raising."""
+    try:
+        return k, evaluate_k(*(context or _SWEEP_CONTEXT), k), None
+    except Exception as e:
+        return k, None, str(e)
+
+
+def select_k(features, k_values: Sequence[int], default_k: int,
+             metric: str = 'euclidean', sample_size: Optional[int] = None,
+             workers: Optional[int] = None,
+             distances: Optional[np.ndarray] = None) -> Tuple[int, float, Dict[int, float]]:
+    """Return (best k, best score, score of every evaluated k).
+
+    Candidates are evaluated in-process unless workers > 1 is passed; pool
+    workers are spawned rather than forked, since callers may already have
+    started threads (PyTorch does) that a forked child would inherit in an
+    unknown state. Every candidate is evaluated, so the result matches a
+    plain sequential sweep.
+    """
+    k_values = list(k_values)
+    if distances is None:
+        distances, indices = compute_distance_matrix(features, metric, sample_size)
+    else:
+        indices = None
+    context = (features, distances, indices)
+
+    workers = max(1, min(workers or 1, len(k_values)))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_sweep_worker, initargs=(context,)) as executor:
+            results: List = list(executor.map(_evaluate_k_worker, k_values))
+    else:
+        results = [_evaluate_k_worker(k, context) for k in k_values]
+
+    best_k, best_score = default_k, -1
+    scores: Dict[int, float] = {}
+    # Results are handled in k order, so ties go to the smaller k as before
+    for k, score, error in results:
+        if error is not None:
+            print(f"Error with k={k}: {error}")
+            continue
+        scores[k] = score
+        print(f"K={k}: silhouette score = {score:.3f}")
+        if score > best_score:
+            best_score = score
+            best_k = k
+
+    return best_k, best_score, scores
+
+
+def hash_features(features) -> str:
+    """Hash the shape, dtype and values of a dense or sparse feature matrix."""
+    if sparse.issparse(features):
+        features = features.tocsr()
+        parts = [features.data, features.indices, features.indptr]
+    else:
+        features = np.ascontiguousarray(features)
+        parts = [features]
+    header = f"{type(features).__name__}:{features.shape}:{features.dtype}".encode('utf-8')
+    return hash_bytes(header + b''.join(np.ascontiguousarray(part).tobytes() for part in parts))
+
+
+class ClusterSelectionCache:
+    """Results of earlier k sweeps, keyed by feature matrix and sweep settings."""
+
+    def __init__(self, models_folder: str):
+        self.cache_path = os.path.join(models_folder, SELECTION_CACHE_FILE_NAME)
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable cluster selection cache {self.cache_path}: {e}")
+            return {}
+        if data.get('version') != SELECTION_CACHE_VERSION:
+            return {}
+        return data.get('entries', {})
+
+    @staticmethod
+    def key_for(features, k_values: Sequence[int], default_k: int, **settings) -> str:
+        parts = [hash_features(features), f"k:{list(k_values)}", f"default:{default_k}"]
+        parts.extend(f"{name}:{settings[name]}" for name in sorted(settings))
+        return hash_bytes('\n'.join(parts).encode('utf-8'))
+
+    def get(self, key: str) -> Optional[Tuple[int, float, Dict[int, float]]]:
+        entry = self._load().get(key)
+        if entry is None:
+            return None
+        scores = {int(k): score for k, score in entry['scores'].items()}
+        return entry['best_k'], entry['best_score'], scores
+
+    def put(self, key: str, result: Tuple[int, float, Dict[int, float]]):
+        """Store a sweep result, keeping only the most recent entries."""
+        best_k, best_score, scores = result
+        # Re-read so entries written by other selectors in this run are kept
+        entries = self._load()
+        entries.pop(key, None)
+        entries[key] = {
+            'best_k': int(best_k),
+            'best_score': float(best_score),
+            'scores': {str(k): float(score) for k, score in scores.items()}
+        }
+        while len(entries) > SELECTION_CACHE_MAX_ENTRIES:
+            del entries[next(iter(entries))]
+
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': SELECTION_CACHE_VERSION, 'entries': entries}, f)
+        os.replace(tmp_path, self.cache_path)
+
+
+def select_k_cached(cache: Optional[ClusterSelectionCache], features, k_values: Sequence[int],
+                    default_k: int, metric: str = 'euclidean', sample_size: Optional[int] = None,
+                    workers: Optional[int] = None) -> Tuple[int, float, Dict[int, float]]:
+    """select_k, reusing the stored result when the same features were swept before."""
+    if cache is None:
+        return select_k(features, k_values, default_k, metric, sample_size, workers)
+
+    k_values = list(k_values)
+    # workers does not change the result, so it is not part of the key
+    key = cache.key_for(features, k_values, default_k, metric=metric,
+                        sample_size=sample_size)
+    result = cache.get(key)
+    if result is not None:
+        print(f"Reusing cached k search for unchanged features (k={result[0]})")
+        return result
+
+    result = select_k(features, k_values, default_k, metric, sample_size, workers)
+    try:
+        cache.put(key, result)
+    except OSError as e:
+        print(f"Warning: Could not save cluster selection cache: {e}")
+    return result
@@ -0,0 +1,150 @@
+"""
+Corpus Snapshot
+Parsed view of every markdown file under blog/ (raw bytes, content hash,
+frontmatter metadata and body) serialized once to topic_models/ and shared by
+metadata generation, topic discovery, config generation and model setup, so a
+full pipeline run parses the corpus once instead of once per stage.
+"""
+
+import copy
+import os
+import pickle
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from post_loader import LoadedPost, iter_post_files, load_post
+from topic_extraction_cache import hash_bytes
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FILE_NAME = 'corpus_snapshot.pkl'
+
+# Snapshots already loaded by this process, keyed by (blog folder, snapshot path)
+_LOADED_SNAPSHOTS: Dict[Tuple[str, str], 'CorpusSnapshot'] = {}
+
+
+def _scan_tree(blog_folder: str) -> List[Tuple[str, str, int, int]]:
+    """Return (relative path, file path, size, mtime) of every markdown file without reading it."""
+    tree = []
+    for path, file_path in iter_post_files(blog_folder):
+        stat = os.stat(file_path)
+        tree.append((path, file_path, stat.st_size, stat.st_mtime_ns))
+    return tree
+
+
+def compute_tree_hash(tree: List[Tuple[str, str, int, int]]) -> str:
+    """Hash the file list and file stats of a scanned tree."""
+    parts = [f"{path}:{size}:{mtime}" for path, _, size, mtime in tree]
+    return hash_bytes('\n'.join(parts).encode('utf-8'))
+
+
+class CorpusSnapshot:
+    """Parsed markdown files of a blog folder, in deterministic walk order."""
+
+    def __init__(self, blog_folder: str, tree_hash: str, entries: 'OrderedDict[str, Dict]'):
+        self.blog_folder = blog_folder
+        self.tree_hash = tree_hash
+        self.entries = entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self.entries
+
+    def get(self, path: str) -> Optional[LoadedPost]:
+        """Return a fresh copy of a parsed post, safe for the caller to modify."""
+        entry = self.entries.get(path)
+        if entry is None:
+            return None
+        return LoadedPost.from_parsed(
+            os.path.join(self.blog_folder, path),
+            entry['raw'],
+            copy.deepcopy(entry['metadata']),
+            entry['content']
+        )
+
+    def iter_posts(self) -> Iterator[Tuple[str, LoadedPost]]:
+        """Yield (relative path, post) like post_loader.iter_posts, without re-parsing."""
+        for path in self.entries:
+            yield path, self.get(path)
+
+    def save(self, snapshot_path: str):
+        os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+        tmp_path = snapshot_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({
+                'version': SNAPSHOT_VERSION,
+                'tree_hash': self.tree_hash,
+                'entries': self.entries
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, snapshot_path)
+
+    @classmethod
+    def read(cls, blog_folder: str, snapshot_path: str) -> Optional['CorpusSnapshot']:
+        """Read a serialized snapshot, returning None if it is missing or unreadable."""
+        try:
+            with open(snapshot_path, 'rb') as f:
+                data = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable corpus snapshot {snapshot_path}: {e}")
+            return None
+
+        if data.get('version') != SNAPSHOT_VERSION:
+            return None
+        return cls(blog_folder, data['tree_hash'], data['entries'])
+
+
+def load_corpus_snapshot(blog_folder: str, models_folder: str) -> CorpusSnapshot:
+    """Return an up-to-date snapshot of blog_folder, parsing only new or changed files.
+
+    The snapshot is kept in memory for the rest of the process and serialized to
+    models_folder for later stages and runs.
+    """
+    snapshot_path = os.path.join(models_folder, SNAPSHOT_FILE_NAME)
+    key = (os.path.abspath(blog_folder), os.path.abspath(snapshot_path))
+
+    tree = _scan_tree(blog_folder)
+    tree_hash = compute_tree_hash(tree)
+    if not tree:
+        # Nothing to share; don't overwrite a snapshot of a real corpus
+        return CorpusSnapshot(blog_folder, tree_hash, OrderedDict())
+
+    previous = _LOADED_SNAPSHOTS.get(key) or CorpusSnapshot.read(blog_folder, snapshot_path)
+    if previous is not None and previous.tree_hash == tree_hash:
+        previous.blog_folder = blog_folder
+        _LOADED_SNAPSHOTS[key] = previous
+        return previous
+
+    # Reuse entries whose file stats are unchanged, parse the rest
+    previous_entries = previous.entries if previous is not None else {}
+    entries = OrderedDict()
+    parsed = 0
+    for path, file_path, size, mtime in tree:
+        entry = previous_entries.get(path)
+        if entry is None or entry['size'] != size or entry['mtime'] != mtime:
+            try:
+                loaded = load_post(file_path)
+            except Exception as e:
+                print(f"Error processing {file_path}: {e}")
+                continue
+            entry = {
+                'size': size,
+                'mtime': mtime,
+                'sha256': hash_bytes(loaded.raw_content),
+                'raw': loaded.raw_content,
+                'metadata': loaded.metadata,
+                'content': loaded.content
+            }
+            parsed += 1
+        entries[path] = entry
+
+    snapshot = CorpusSnapshot(blog_folder, tree_hash, entries)
+    try:
+        snapshot.save(snapshot_path)
+    except OSError as e:
+        print(f"Warning: Could not save corpus snapshot: {e}")
+    _LOADED_SNAPSHOTS[key] = snapshot
+    print(f"Corpus snapshot: {parsed} parsed, {len(entries) - parsed} reused")
+    return snapshot
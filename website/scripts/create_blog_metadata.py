@@ -7,15 +7,18 @@ advanced topic extraction.
 Features:
 - Full blog corpus processing with advanced topic extraction (multiple AI models)
 - Cached-topics mode for fast regeneration using pre-computed models
+- Related posts per post from cached document embeddings
+- Paginated, per-tag, per-category and per-year metadata shards for the frontend
+- Precomputed taxonomy indexes (tags, categories, authors, topics, archives)
 - CI/CD optimization support
 
 Usage:
-    python create_blog_metadata.py [--skip-topics | --use-cached-topics]
+    python create_blog_metadata.py [--skip-topics | --use-cached-topics] [--incremental] [--no-topic-cache]
+                                  [--batch-inference [--batch-size N]] [--workers N]
 
 pip install -r python-requirements.txt
 """
 
-import errno
 import json
 import os
 import re
@@ -23,38 +26,74 @@ import shutil
 from datetime import date, datetime
 import math
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
-import frontmatter
 import yaml
 from dateutil import parser as dateutil_parser
 
-# Import enhanced topic extraction systems
-from topic_discovery import TopicDiscoverySystem
-from enhanced_topic_extraction import EnhancedTopicExtractor
-
-# Import new unified transformer-based extraction
-try:
-    from transformer_topic_extraction import UnifiedTopicExtractor
-    TRANSFORMER_EXTRACTION_AVAILABLE = True
-    print("Transformer-based topic extraction available")
-    # Global transformer extractor instance to avoid repeated model loading
-    _TRANSFORMER_EXTRACTOR = None
-    # Global flag to indicate skip mode
-    _SKIP_TOPICS_MODE = False
-except ImportError as e:
-    TRANSFORMER_EXTRACTION_AVAILABLE = False
-    print(f"Transformer-based topic extraction not available: {e}")
-    print("Will use traditional method as fallback")
-    _TRANSFORMER_EXTRACTOR = None
+# Topic discovery, extraction and embedding modules pull in numpy, scikit-learn,
+# NLTK and (optionally) PyTorch; they are imported by the code paths that use
+# them so --skip-topics runs never load them
+from topic_extraction_cache import TopicExtractionCache, compute_extraction_fingerprint
+from metadata_manifest import MetadataManifest, compute_pipeline_fingerprint
+from metadata_shards import write_metadata_shards
+from json_output import write_json, write_json_list
+from post_loader import load_post
+from taxonomy_index import build_taxonomy_index
+from corpus_snapshot import load_corpus_snapshot
+from output_sync import sync_tree
+from text_matching import CategoryIndex, EntityMatcher, KeywordAutomaton
+from text_normalizer import normalize_text
+
+# Unified transformer-based extraction, imported on first use by transformer_extraction_available()
+UnifiedTopicExtractor = None
+TRANSFORMER_EXTRACTION_AVAILABLE = None
+# Global transformer extractor instance to avoid repeated model loading
+_TRANSFORMER_EXTRACTOR = None
+# Global flag to indicate skip mode
+_SKIP_TOPICS_MODE = False
 
 POSTS_LIST_FILE_JSON = "website/public/blogdata/metadata/blog_metadata.json"
 SERIES_LIST_FILE_JSON = "website/public/blogdata/metadata/series_metadata.json"
+METADATA_SHARDS_FOLDER = "website/public/blogdata/metadata/shards"
+TAXONOMY_INDEX_FILE_JSON = "website/public/blogdata/metadata/taxonomy_index.json"
 SERIES_DEFINITIONS_FILE = "blog/metadata/series-definitions.yaml"
 POSTS_DIST_FOLDER = "website/public/blogdata"
 POSTS_FOLDER = "blog"
+METADATA_MANIFEST_FILE = "website/config/topic_models/metadata_manifest.json"
+
+# Files and folders generated into POSTS_DIST_FOLDER that syncing blog posts must not delete
+GENERATED_OUTPUT_FILES = [POSTS_LIST_FILE_JSON, SERIES_LIST_FILE_JSON, TAXONOMY_INDEX_FILE_JSON, METADATA_SHARDS_FOLDER]
 
 POST_PATH_STRING = "path"
 
+TRANSFORMER_MODEL_NAME = 'all-MiniLM-L6-v2'
+
+# Model artifacts that influence per-post extraction results
+# (artifact headers carry the checksum of their matrix)
+TOPIC_MODEL_ARTIFACTS = [
+    'category_embeddings.json',
+    'discovered_topics.json',
+    'tfidf_vectorizer.json',
+    'topic_clusters.json'
+]
+
+
+def transformer_extraction_available():
+    """Import the transformer extractor on first call and report whether it can be used."""
+    global UnifiedTopicExtractor, TRANSFORMER_EXTRACTION_AVAILABLE
+    
+    if TRANSFORMER_EXTRACTION_AVAILABLE is None:
+        try:
+            from transformer_topic_extraction import UnifiedTopicExtractor
+            TRANSFORMER_EXTRACTION_AVAILABLE = True
+            print("Transformer-based topic extraction available")
+        except ImportError as e:
+            TRANSFORMER_EXTRACTION_AVAILABLE = False
+            print(f"Transformer-based topic extraction not available: {e}")
+            print("Will use traditional method as fallback")
+    return TRANSFORMER_EXTRACTION_AVAILABLE
+
 
 def get_transformer_extractor(config_folder: str, skip_mode: bool = False):
     """Get cached transformer extractor instance to avoid repeated model loading."""
@@ -65,38 +104,63 @@ def get_transformer_extractor(config_folder: str, skip_mode: bool = False):
         print("⚠️ Attempted to initialize transformer in skip mode - blocked for performance")
         return None
         
-    if TRANSFORMER_EXTRACTION_AVAILABLE and _TRANSFORMER_EXTRACTOR is None:
+    if _TRANSFORMER_EXTRACTOR is None and transformer_extraction_available():
         print("Initializing transformer extractor (one-time setup)...")
-        _TRANSFORMER_EXTRACTOR = UnifiedTopicExtractor(config_folder)
+        _TRANSFORMER_EXTRACTOR = UnifiedTopicExtractor(config_folder, TRANSFORMER_MODEL_NAME)
         print("Transformer extractor ready for reuse")
     return _TRANSFORMER_EXTRACTOR
 
 
+def active_extraction_method():
+    """Return the extraction-method of the highest extraction tier available to this run."""
+    return 'unified-transformer' if transformer_extraction_available() else 'enhanced-hybrid'
+
+
+def _topic_extraction_settings():
+    """Return the config path, model name and artifact paths that drive per-post extraction."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    config_folder = os.path.join(os.path.dirname(script_dir), 'config')
+    models_folder = os.path.join(config_folder, 'topic_models')
+    
+    # The active extraction tier determines which model produced the cached results
+    model_name = TRANSFORMER_MODEL_NAME if active_extraction_method() == 'unified-transformer' else 'enhanced-hybrid'
+    return (
+        os.path.join(config_folder, 'topic-extraction-data.json'),
+        model_name,
+        [os.path.join(models_folder, name) for name in TOPIC_MODEL_ARTIFACTS]
+    )
+
+
+def create_topic_extraction_cache():
+    """Create the content-addressed cache for per-post topic extraction results."""
+    config_path, model_name, artifact_paths = _topic_extraction_settings()
+    models_folder = os.path.dirname(artifact_paths[0])
+    return TopicExtractionCache(models_folder, config_path, model_name, artifact_paths=artifact_paths)
+
+
+def metadata_pipeline_fingerprint(mode):
+    """Fingerprint the settings that make a previous run's post metadata reusable.
+    
+    Minimal-mode metadata carries no extracted topics, so its fingerprint leaves
+    out the extraction settings (and the import that resolves the active model).
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    models_folder = os.path.join(os.path.dirname(script_dir), 'config', 'topic_models')
+    extra_paths = [
+        SERIES_DEFINITIONS_FILE,
+        os.path.abspath(__file__),
+        os.path.join(models_folder, 'transformer_topics.json')
+    ]
+    extraction_fingerprint = ''
+    if mode != 'minimal':
+        extraction_fingerprint = compute_extraction_fingerprint(*_topic_extraction_settings())
+    return compute_pipeline_fingerprint(mode, extraction_fingerprint, extra_paths)
+
+
 def calculate_reading_time(content, words_per_minute=225):
     """Calculate reading time for markdown content."""
-    # Remove YAML frontmatter
-    content_without_frontmatter = re.sub(r'^---\n.*?\n---\n', '', content, flags=re.DOTALL)
-    
-    # Remove HTML tags
-    content_without_html = re.sub(r'<[^>]*>', '', content_without_frontmatter)
-    
-    # Remove markdown formatting
-    content_plain = content_without_html
-    content_plain = re.sub(r'\[([^\]]*)\]\([^)]*\)', r'\1', content_plain)  # Links
-    content_plain = re.sub(r'\*\*([^*]*)\*\*', r'\1', content_plain)  # Bold
-    content_plain = re.sub(r'\*([^*]*)\*', r'\1', content_plain)  # Italic
-    content_plain = re.sub(r'`([^`]*)`', r'\1', content_plain)  # Inline code
-    content_plain = re.sub(r'#{1,6}\s+', '', content_plain)  # Headers
-    content_plain = re.sub(r'>\s+', '', content_plain)  # Blockquotes
-    content_plain = re.sub(r'[-*+]\s+', '', content_plain)  # Lists
-    content_plain = re.sub(r'\d+\.\s+', '', content_plain)  # Numbered lists
-    content_plain = re.sub(r'\n+', ' ', content_plain)  # Newlines
-    content_plain = re.sub(r'\s+', ' ', content_plain)  # Normalize whitespace
-    content_plain = content_plain.strip()
-    
-    # Count words
-    words = [word for word in content_plain.split() if word.strip()]
-    word_count = len(words)
+    # Count words of the plain text (frontmatter, HTML and markdown syntax removed)
+    word_count = normalize_text(content).word_count
     
     # Calculate reading time
     minutes = math.ceil(word_count / words_per_minute)
@@ -136,27 +200,13 @@ _topic_config = load_topic_extraction_config()
 TOPIC_CATEGORIES = _topic_config['topicCategories']
 TECHNICAL_ENTITIES = _topic_config['technicalEntities']
 STOP_WORDS = set(_topic_config['stopWords'])
+CATEGORY_INDEX = CategoryIndex(TOPIC_CATEGORIES)
+ENTITY_MATCHER = EntityMatcher(TECHNICAL_ENTITIES)
 
 
 def clean_content_for_topic_extraction(content):
     """Clean and normalize text content for topic analysis."""
-    # Remove YAML frontmatter
-    content = re.sub(r'^---\n.*?\n---\n', '', content, flags=re.DOTALL)
-    # Remove HTML tags
-    content = re.sub(r'<[^>]*>', '', content)
-    # Remove code blocks
-    content = re.sub(r'```[\s\S]*?```', '', content)
-    # Remove inline code
-    content = re.sub(r'`[^`]*`', '', content)
-    # Convert links to text
-    content = re.sub(r'\[([^\]]*)\]\([^)]*\)', r'\1', content)
-    # Remove markdown formatting
-    content = re.sub(r'[#*_~`]', '', content)
-    # Replace newlines with spaces
-    content = re.sub(r'\n+', ' ', content)
-    # Normalize whitespace
-    content = re.sub(r'\s+', ' ', content)
-    return content.lower().strip()
+    return normalize_text(content).cleaned
 
 
 def extract_keywords(content, max_keywords=20):
@@ -189,30 +239,13 @@ def extract_keywords(content, max_keywords=20):
 
 def categorize_keyword(keyword):
     """Categorize a keyword based on predefined topic categories."""
-    for category, terms in TOPIC_CATEGORIES.items():
-        if any(keyword in term.lower() or term.lower() in keyword for term in terms):
-            return category
-    return 'general'
+    return CATEGORY_INDEX.categorize(keyword)
 
 
 def extract_entities(content):
-    """Extract named entities from content."""
-    entities = set()
-    normalized_content = content.lower()
-    
-    # Extract technical entities
-    for entity_list in TECHNICAL_ENTITIES.values():
-        for entity in entity_list:
-            if entity.lower() in normalized_content:
-                entities.add(entity)
-    
-    # Extract capitalized terms (potential proper nouns)
-    proper_nouns = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', content)
-    for noun in proper_nouns:
-        if len(noun) > 3 and noun.lower() not in STOP_WORDS:
-            entities.add(noun)
-    
-    return list(entities)[:15]  # Limit to top 15 entities
+    """Extract named entities from content, most frequent first."""
+    # Extract technical entities, then capitalized terms (potential proper nouns)
+    return ENTITY_MATCHER.extract(content, STOP_WORDS, limit=15)  # Limit to top 15 entities
 
 
 def assess_content_complexity(content, keywords):
@@ -329,8 +362,68 @@ def load_cached_topics():
     return cached_topics
 
 
+class CachedTopicIndex:
+    """Keywords of all cached topics compiled once into a single automaton."""
+    
+    def __init__(self, cached_topics):
+        self.cached_topics = cached_topics
+        self.topics = []
+        patterns = []
+        for topic_id in sorted(cached_topics.keys()):  # Sort for deterministic iteration
+            topic_data = cached_topics[topic_id]
+            
+            # Process keywords (handle both string and dict formats)
+            processed_keywords = []
+            for keyword in topic_data.get('keywords', []) or []:
+                if isinstance(keyword, str):
+                    processed_keywords.append(keyword)
+                elif isinstance(keyword, dict) and 'term' in keyword:
+                    processed_keywords.append(keyword['term'])
+            
+            # Sort keywords for deterministic processing
+            keywords = [(keyword, keyword.lower()) for keyword in sorted(processed_keywords)]
+            patterns.extend(keyword_lower for _, keyword_lower in keywords)
+            self.topics.append((topic_id, keywords, topic_data.get('weight', 1.0)))
+        
+        self.automaton = KeywordAutomaton(patterns)
+    
+    def __len__(self):
+        return len(self.cached_topics)
+    
+    def score_topics(self, content_lower, title_lower):
+        """Score every topic by its keyword occurrences, with title matches weighted higher."""
+        pattern_ids = self.automaton.pattern_ids
+        title_counts = self.automaton.count(title_lower)
+        content_counts = self.automaton.count(content_lower)
+        
+        topic_scores = {}
+        for topic_id, keywords, weight in self.topics:
+            score = 0
+            matched_keywords = []
+            for keyword, keyword_lower in keywords:
+                pattern_id = pattern_ids[keyword_lower]
+                matches = title_counts[pattern_id] * 3 + content_counts[pattern_id]
+                if matches > 0:
+                    matched_keywords.append(keyword)
+                    score += matches
+            
+            if score > 0:
+                # Sort matched keywords for consistent output
+                matched_keywords.sort()
+                topic_scores[topic_id] = {
+                    'score': score,
+                    'matched_keywords': matched_keywords,
+                    'weight': weight
+                }
+        return topic_scores
+
+
 def extract_topics_from_cached_data(content, title, cached_topics):
-    """Extract topics for a blog post using pre-computed topic data."""
+    """Extract topics for a blog post using pre-computed topic data.
+    
+    cached_topics is the output of load_cached_topics(), ideally already
+    compiled into a CachedTopicIndex so keywords are not re-processed per post.
+    """
     if not cached_topics:
         print(f"No cached topics available for '{title}' - using fallback")
         return {
@@ -340,46 +433,11 @@ def extract_topics_from_cached_data(content, title, cached_topics):
             'classification-method': 'none'
         }
     
-    # Simple keyword matching against cached topics
-    content_lower = content.lower()
-    title_lower = title.lower()
-    combined_text = f"{title_lower} {content_lower}"
+    if not isinstance(cached_topics, CachedTopicIndex):
+        cached_topics = CachedTopicIndex(cached_topics)
     
-    topic_scores = {}
-    
-    # Score topics based on keyword matches (deterministic order)
-    for topic_id in sorted(cached_topics.keys()):  # Sort for deterministic iteration
-        topic_data = cached_topics[topic_id]
-        keywords = topic_data.get('keywords', [])
-        score = 0
-        matched_keywords = []
-        
-        # Process keywords (handle both string and dict formats)
-        processed_keywords = []
-        for keyword in keywords or []:
-            if isinstance(keyword, str):
-                processed_keywords.append(keyword)
-            elif isinstance(keyword, dict) and 'term' in keyword:
-                processed_keywords.append(keyword['term'])
-        
-        # Sort keywords for deterministic processing
-        for keyword in sorted(processed_keywords):
-            keyword_lower = keyword.lower()
-            # Count occurrences, with title matches weighted higher
-            title_matches = title_lower.count(keyword_lower) * 3
-            content_matches = content_lower.count(keyword_lower)
-            if title_matches + content_matches > 0:
-                matched_keywords.append(keyword)
-                score += title_matches + content_matches
-        
-        if score > 0:
-            # Sort matched keywords for consistent output
-            matched_keywords.sort()
-            topic_scores[topic_id] = {
-                'score': score,
-                'matched_keywords': matched_keywords,
-                'weight': topic_data.get('weight', 1.0)
-            }
+    # Keyword matching against cached topics in a single pass over title and content
+    topic_scores = cached_topics.score_topics(content.lower(), title.lower())
     
     # Determine primary and secondary topics
     if not topic_scores:
@@ -422,7 +480,7 @@ def extract_topics_from_content(content, title='', use_enhanced=True, prefer_tra
         }
     
     # Try transformer-based extraction first if available and preferred
-    if use_enhanced and prefer_transformer and TRANSFORMER_EXTRACTION_AVAILABLE:
+    if use_enhanced and prefer_transformer and transformer_extraction_available():
         try:
             print(f"Using transformer-based topic extraction for: {title[:50]}...")
             extractor = get_transformer_extractor(config_folder, skip_mode=skip_mode)
@@ -440,7 +498,8 @@ def extract_topics_from_content(content, title='', use_enhanced=True, prefer_tra
     if use_enhanced:
         try:
             print(f"Using enhanced topic extraction for: {title[:50]}...")
-            extractor = EnhancedTopicExtractor(config_folder)
+            from enhanced_topic_extraction import get_shared_extractor
+            extractor = get_shared_extractor(config_folder)
             result = extractor.extract_topics_enhanced(content, title)
             
             # Add enhanced method indicator
@@ -521,11 +580,331 @@ def find_files():
     return result
 
 
-def create_posts_list(files, run_topic_discovery=True, skip_per_post_extraction=False, use_cached_topics=False):
-    """Creates the list of posts with enhanced topic extraction."""
+def extract_topics_batched(loaded_posts, topic_cache, batch_size):
+    """Run transformer extraction for every post that needs it in corpus-wide batches.
+    
+    loaded_posts maps post paths to posts loaded with post_loader.load_post.
+    Returns post path -> topic data; posts missing from the result are extracted
+    one at a time by the regular per-post path.
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    config_folder = os.path.join(os.path.dirname(script_dir), 'config')
+    
+    try:
+        extractor = get_transformer_extractor(config_folder)
+        if extractor is None:
+            return {}
+        
+        # Phase 1: gather the documents of all posts whose topics are not cached
+        pending_paths = []
+        documents = []
+        for path, loaded in loaded_posts.items():
+            if loaded.metadata.get("published", False) is not True:
+                continue
+            if topic_cache and loaded.raw_content in topic_cache:
+                continue
+            pending_paths.append(path)
+            documents.append((loaded.text, loaded.title))
+        
+        if not documents:
+            return {}
+        
+        # Phase 2: batched inference over the whole corpus, fanned back out per post
+        print(f"Running batched transformer extraction for {len(documents)} posts (batch size {batch_size})...")
+        results = extractor.extract_topics_batch(documents, batch_size=batch_size)
+    except Exception as e:
+        print(f"Batched topic extraction failed, extracting posts one at a time: {e}")
+        return {}
+    
+    batched_topics = {}
+    for path, topic_data in zip(pending_paths, results):
+        topic_data['extraction-method'] = 'unified-transformer'
+        batched_topics[path] = topic_data
+    return batched_topics
+
+
+def attach_related_posts(posts, loaded_posts):
+    """Add the most similar posts, by document embedding, to each post's metadata.
+    
+    loaded_posts maps the path of every post to its loaded file. Embeddings are
+    shared with transformer topic discovery, so the sentence model is only
+    loaded when a post changed since either stage last ran.
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    config_folder = os.path.join(os.path.dirname(script_dir), 'config')
+    models_folder = os.path.join(config_folder, 'topic_models')
+    
+    try:
+        from document_embedding_store import DISCOVERY, DocumentEmbeddingStore, discovery_text
+        from related_posts import RelatedPostsIndex
+        
+        if _TRANSFORMER_EXTRACTOR is not None:
+            store = _TRANSFORMER_EXTRACTOR.document_store
+        else:
+            store = DocumentEmbeddingStore(models_folder, TRANSFORMER_MODEL_NAME)
+        
+        def encode(texts):
+            print(f"Generating embeddings for {len(texts)} of {len(posts)} posts...")
+            return get_transformer_extractor(config_folder).sentence_model.encode(texts, show_progress_bar=True)
+        
+        paths = [post[POST_PATH_STRING] for post in posts]
+        embeddings = store.embed(
+            DISCOVERY,
+            [discovery_text(loaded_posts[path].title, loaded_posts[path].content) for path in paths],
+            encode,
+            # Keyed like topic discovery, which walks the blog folder
+            keys=[path.replace('/', os.sep) for path in paths]
+        )
+        # Classification entries of the same store are pruned, if at all, once extraction is saved
+        store.save(prune=False)
+        
+        related_index = RelatedPostsIndex(models_folder)
+        related_index.update(paths, embeddings)
+        related_index.save()
+    except Exception as e:
+        print(f"Related posts could not be computed: {e}")
+        return
+    
+    for post in posts:
+        post['related-posts'] = related_index.get(post[POST_PATH_STRING])
+    print(f"Related posts: {related_index.summary()}")
+
+
+def process_post(path, file_path, context):
+    """Build the metadata of a single post.
+    
+    context holds the per-run settings shared by all posts (see
+    create_posts_list). Returns None for unpublished posts, otherwise
+    (metadata, raw_content, topic_source, extracted_topics) where topic_source
+    is 'cache' or 'extracted' when the topic extraction cache was consulted and
+    extracted_topics holds newly extracted topic data to store in it.
+    """
+    series_definitions = context['series_definitions']
+    cached_topics_data = context['cached_topics_data']
+    use_cached_topics = context['use_cached_topics']
+    skip_per_post_extraction = context['skip_per_post_extraction']
+    topic_cache = context['topic_cache']
+    batched_topics = context['batched_topics']
+    topic_source = None
+    extracted_topics = None
+    
+    # Frontmatter and raw content come from the same single read of the file
+    loaded = context['loaded_posts'].get(path) or load_post(file_path)
+    post = loaded.post
+    post[POST_PATH_STRING] = path
+    if post.get("published", False) is not True:
+        return None
+    
+    # Validate and process tags with defaults
+    tags = post.metadata.get('tags', post.get('tags', []))
+    if not tags or not isinstance(tags, list):
+        print(f"Warning: Missing or invalid tags for post '{post.metadata.get('title', 'Unknown')}', using default")
+        tags = ['General']
+    newTags = get_data_with_url_slug(tags)
+    post['tags'] = newTags
+    
+    # Validate and process categories with defaults  
+    categories = post.metadata.get('categories', post.get('categories', []))
+    if not categories or not isinstance(categories, list):
+        print(f"Warning: Missing or invalid categories for post '{post.metadata.get('title', 'Unknown')}', using default")
+        categories = ['Technology']
+    newCategories = get_data_with_url_slug(categories)
+    post['categories'] = newCategories
+    
+    # Validate and process authors with defaults
+    authors = post.metadata.get('authors', post.get('authors', []))
+    if not authors or not isinstance(authors, list):
+        print(f"Warning: Missing or invalid authors for post '{post.metadata.get('title', 'Unknown')}', using default")
+        authors = ['Manas Talukdar']
+    newAuthors = get_data_with_url_slug(authors)
+    post['authors'] = newAuthors
+    
+    # Validate and process post-format with defaults
+    post_format = post.metadata.get('post-format', post.get('post-format', 'standard'))
+    if not post_format or not isinstance(post_format, str):
+        print(f"Warning: Missing or invalid post-format for post '{post.metadata.get('title', 'Unknown')}', using default")
+        post_format = 'standard'
+    newPostFormat = get_data_with_url_slug(post_format)
+    post['post-format'] = newPostFormat
+    # Parse dates with consistent timezone handling
+    newPublishedDate = dateutil_parser.parse(str(post['first-published-on']))
+    if newPublishedDate.tzinfo is None:
+        # Ensure all dates have consistent timezone info (or lack thereof)
+        newPublishedDate = newPublishedDate.replace(tzinfo=None)
+    post['first-published-on'] = newPublishedDate
+    
+    newUpdatedDate = dateutil_parser.parse(str(post['last-updated-on']))
+    if newUpdatedDate.tzinfo is None:
+        newUpdatedDate = newUpdatedDate.replace(tzinfo=None)
+    post['last-updated-on'] = newUpdatedDate
+    
+    # Calculate reading time
+    raw_content = loaded.raw_content
+    content = loaded.text
+    reading_time = calculate_reading_time(content)
+    post['reading-time'] = reading_time
+    
+    # Extract topics from content using enhanced method (skip if requested for performance)
+    if use_cached_topics and cached_topics_data:
+        # Use pre-computed cached topics (fast and accurate)
+        topic_data = extract_topics_from_cached_data(content, post.metadata.get('title', ''), cached_topics_data)
+        print(f"Using cached topics for '{post.metadata.get('title', '')}': {topic_data['topic-primary']} (cached)")
+    elif not skip_per_post_extraction:
+        topic_data = topic_cache.peek(raw_content) if topic_cache else None
+        if topic_data is not None:
+            topic_source = 'cache'
+            print(f"Using cached extraction for '{post.metadata.get('title', '')}' (content unchanged)")
+        else:
+            topic_source = 'extracted'
+            topic_data = batched_topics.get(path)
+            if topic_data is None:
+                topic_data = extract_topics_from_content(content, post.metadata.get('title', ''), use_enhanced=True)
+            extracted_topics = topic_data
+    else:
+        # Skip expensive topic extraction and use minimal fallback
+        print(f"Skipping topic extraction for '{post.metadata.get('title', '')}' (minimal mode)")
+        topic_data = {
+            'topic-primary': 'general',  
+            'topic-secondary': [],
+            'extraction-method': 'minimal',
+            'classification-method': 'static'
+        }
+        
+    # Apply topic data to post
+    try:
+        # Add topic data to post metadata
+        for key, value in topic_data.items():
+            post.metadata[key] = value
+        
+        method = topic_data.get('classification-method', 'unknown')
+        print(f"Extracted topics for '{post.metadata.get('title', 'Unknown')}': {topic_data['topic-primary']} ({method})")
+    except Exception as e:
+        print(f"Error extracting topics for '{post.metadata.get('title', 'Unknown')}': {e}")
+        # Add default topic data if extraction fails
+        default_topic_data = {
+            'topic-primary': 'general-technology',
+            'topic-secondary': [],
+            'content-entities': [],
+            'topic-confidence': 0.0,
+            'related-concepts': [],
+            'content-complexity': 'intermediate',
+            'target-audience': ['general-tech-audience'],
+            'classification-method': 'fallback'
+        }
+        for key, value in default_topic_data.items():
+            post.metadata[key] = value
+    
+    # Handle series information
+    if 'series' in post.metadata:
+        series_info = post.metadata['series']
+        if isinstance(series_info, dict):
+            # Check if using new simplified format (slug + part)
+            if 'slug' in series_info:
+                # New format: get series info from definitions
+                series_slug = series_info['slug']
+                if series_slug in series_definitions:
+                    series_def = series_definitions[series_slug]
+                    series_name = series_def['name']
+                    series_description = series_def['description']
+                else:
+                    print(f"Warning: Series '{series_slug}' not found in definitions")
+                    series_name = series_slug.replace('-', ' ').title()
+                    series_description = ''
+            else:
+                # Old format: series info is inline
+                series_name = series_info.get('name', '')
+                series_slug = process_item_for_url_slug(series_name)['url-slug']
+                series_description = series_info.get('description', '')
+            
+            post['series'] = {
+                'name': series_name,
+                'url-slug': series_slug,
+                'part': series_info.get('part', None),
+                'description': series_description
+            }
+    
+    # Validate and fix post metadata before adding to final data
+    validated_metadata = validate_post_metadata(post.metadata)
+    post.metadata = validated_metadata
+    
+    return post.metadata, raw_content, topic_source, extracted_topics
+
+
+# Per-run settings of pool workers, set once per process by _init_post_worker
+_POST_WORKER_CONTEXT = None
+
+
+def _init_post_worker(context):
+    """Initialize a pool worker; extractors are created lazily on first use."""
+    global _POST_WORKER_CONTEXT, _SKIP_TOPICS_MODE
+    _POST_WORKER_CONTEXT = context
+    _SKIP_TOPICS_MODE = context['skip_topics_mode']
+
+
+def _take_worker_cache_updates():
+    """Return the extractor cache entries this process created since its last post."""
+    from enhanced_topic_extraction import take_shared_extractor_cache_updates
+    updates = {'enhanced': take_shared_extractor_cache_updates()}
+    if _TRANSFORMER_EXTRACTOR is not None:
+        updates['transformer'] = _TRANSFORMER_EXTRACTOR.take_cache_updates()
+    return updates
+
+
+def _merge_worker_cache_updates(updates):
+    """Merge a worker's extractor cache entries into this process's extractors, which save them."""
+    from enhanced_topic_extraction import merge_shared_extractor_cache_updates
+    merge_shared_extractor_cache_updates(updates['enhanced'])
+    if 'transformer' in updates:
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        config_folder = os.path.join(os.path.dirname(script_dir), 'config')
+        extractor = get_transformer_extractor(config_folder)
+        if extractor is not None:
+            extractor.merge_cache_updates(updates['transformer'])
+
+
+def _process_post_worker(item):
+    result = process_post(item[0], item[1], _POST_WORKER_CONTEXT)
+    cache_updates = None
+    if not _POST_WORKER_CONTEXT['use_cached_topics'] and not _POST_WORKER_CONTEXT['skip_per_post_extraction']:
+        # A worker's extractor caches are lost when the pool shuts down, so their new entries travel with the result
+        cache_updates = _take_worker_cache_updates()
+    return result, cache_updates
+
+
+def process_posts(items, context, workers=1):
+    """Process posts serially or in a process pool, returning results in input order.
+    
+    Cache entries that pool workers' extractors create are merged into this
+    process's extractors, so they are saved as if the posts were processed here.
+    """
+    if workers <= 1 or len(items) <= 1:
+        return [process_post(path, file_path, context) for path, file_path in items]
+    
+    print(f"Processing {len(items)} posts with {workers} worker processes...")
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_post_worker, initargs=(context,)) as executor:
+        # map yields results in submission order, keeping the merge deterministic
+        for result, cache_updates in executor.map(_process_post_worker, items):
+            if cache_updates:
+                _merge_worker_cache_updates(cache_updates)
+            results.append(result)
+    return results
+
+
+def create_posts_list(files, run_topic_discovery=True, skip_per_post_extraction=False, use_cached_topics=False,
+                      use_topic_cache=True, previous_posts=None, batch_inference=False, batch_size=32,
+                      workers=1):
+    """Creates the list of posts with enhanced topic extraction.
+    
+    previous_posts maps post paths to metadata generated by an earlier run;
+    those posts are reused as-is instead of being processed again.
+    With batch_inference, transformer extraction for all posts runs up front
+    in batches of batch_size instead of one post at a time.
+    With workers > 1, posts are processed in that many worker processes.
+    """
     count = 0
     data_all = []
-    series_data = {}
+    previous_posts = previous_posts or {}
     
     # Load cached topics if we're using cached mode
     cached_topics_data = {}
@@ -534,6 +913,8 @@ def create_posts_list(files, run_topic_discovery=True, skip_per_post_extraction=
         cached_topics_data = load_cached_topics()
         if cached_topics_data:
             print(f"✅ Loaded {len(cached_topics_data)} cached topics - using for all posts")
+            # Compile topic keywords once for all posts
+            cached_topics_data = CachedTopicIndex(cached_topics_data)
         else:
             print("⚠️ No cached topics found - falling back to skip mode")
             skip_per_post_extraction = True
@@ -547,184 +928,185 @@ def create_posts_list(files, run_topic_discovery=True, skip_per_post_extraction=
             blog_folder = os.path.join(os.path.dirname(script_dir), 'blog')
             config_folder = os.path.join(os.path.dirname(script_dir), 'config')
             
+            from topic_discovery import TopicDiscoverySystem
+            from enhanced_topic_extraction import clear_shared_extractors
             discovery_system = TopicDiscoverySystem(blog_folder, config_folder)
             discovered_topics = discovery_system.discover_topics()
             print(f"Topic discovery completed: {len(discovered_topics.get('discoveredTopics', {}))} topics found")
+            # Discovery may have rewritten the models shared extractors loaded
+            clear_shared_extractors()
         except Exception as e:
             print(f"Topic discovery failed: {e}. Proceeding with static extraction only.")
     
+    # Reuse stored extraction results for posts whose content has not changed
+    topic_cache = None
+    cacheable_method = None
+    if use_topic_cache and not use_cached_topics and not skip_per_post_extraction:
+        topic_cache = create_topic_extraction_cache()
+        # Results of a fallback tier are not stored, so those posts are retried next run
+        cacheable_method = active_extraction_method()
+    
+    # Parsed posts come from the corpus snapshot shared with the other pipeline stages
+    snapshot = load_corpus_snapshot(POSTS_FOLDER, os.path.dirname(METADATA_MANIFEST_FILE))
+    loaded_posts = {}
+    for path, file_path in files.items():
+        if path not in previous_posts:
+            loaded = snapshot.get(path.replace('/', os.sep))
+            loaded_posts[path] = loaded if loaded is not None else load_post(file_path)
+    
+    batched_topics = {}
+    if batch_inference and not use_cached_topics and not skip_per_post_extraction and transformer_extraction_available():
+        batched_topics = extract_topics_batched(loaded_posts, topic_cache, batch_size)
+    
     # Load series definitions from central file
     series_definitions = load_series_definitions()
     
+    context = {
+        'series_definitions': series_definitions,
+        'cached_topics_data': cached_topics_data,
+        'use_cached_topics': use_cached_topics,
+        'skip_per_post_extraction': skip_per_post_extraction,
+        'topic_cache': topic_cache,
+        'batched_topics': batched_topics,
+        'loaded_posts': loaded_posts,
+        'skip_topics_mode': _SKIP_TOPICS_MODE
+    }
+    pending_items = [item for item in files.items() if item[0] not in previous_posts]
+    results = dict(zip([path for path, _ in pending_items], process_posts(pending_items, context, workers)))
+    
     for item in files.items():
-        post = frontmatter.load(item[1])
-        post[POST_PATH_STRING] = item[0]
-        if post.get("published", False) is True:
+        if item[0] in previous_posts:
             count = count + 1
-            # Validate and process tags with defaults
-            tags = post.metadata.get('tags', post.get('tags', []))
-            if not tags or not isinstance(tags, list):
-                print(f"Warning: Missing or invalid tags for post '{post.metadata.get('title', 'Unknown')}', using default")
-                tags = ['General']
-            newTags = get_data_with_url_slug(tags)
-            post['tags'] = newTags
-            
-            # Validate and process categories with defaults  
-            categories = post.metadata.get('categories', post.get('categories', []))
-            if not categories or not isinstance(categories, list):
-                print(f"Warning: Missing or invalid categories for post '{post.metadata.get('title', 'Unknown')}', using default")
-                categories = ['Technology']
-            newCategories = get_data_with_url_slug(categories)
-            post['categories'] = newCategories
-            
-            # Validate and process authors with defaults
-            authors = post.metadata.get('authors', post.get('authors', []))
-            if not authors or not isinstance(authors, list):
-                print(f"Warning: Missing or invalid authors for post '{post.metadata.get('title', 'Unknown')}', using default")
-                authors = ['Manas Talukdar']
-            newAuthors = get_data_with_url_slug(authors)
-            post['authors'] = newAuthors
-            
-            # Validate and process post-format with defaults
-            post_format = post.metadata.get('post-format', post.get('post-format', 'standard'))
-            if not post_format or not isinstance(post_format, str):
-                print(f"Warning: Missing or invalid post-format for post '{post.metadata.get('title', 'Unknown')}', using default")
-                post_format = 'standard'
-            newPostFormat = get_data_with_url_slug(post_format)
-            post['post-format'] = newPostFormat
-            # Parse dates with consistent timezone handling
-            newPublishedDate = dateutil_parser.parse(str(post['first-published-on']))
-            if newPublishedDate.tzinfo is None:
-                # Ensure all dates have consistent timezone info (or lack thereof)
-                newPublishedDate = newPublishedDate.replace(tzinfo=None)
-            post['first-published-on'] = newPublishedDate
-            
-            newUpdatedDate = dateutil_parser.parse(str(post['last-updated-on']))
-            if newUpdatedDate.tzinfo is None:
-                newUpdatedDate = newUpdatedDate.replace(tzinfo=None)
-            post['last-updated-on'] = newUpdatedDate
-            
-            # Calculate reading time
-            with open(item[1], 'r', encoding='utf-8') as f:
-                content = f.read()
-            reading_time = calculate_reading_time(content)
-            post['reading-time'] = reading_time
-            
-            # Extract topics from content using enhanced method (skip if requested for performance)
-            if use_cached_topics and cached_topics_data:
-                # Use pre-computed cached topics (fast and accurate)
-                topic_data = extract_topics_from_cached_data(content, post.metadata.get('title', ''), cached_topics_data)
-                print(f"Using cached topics for '{post.metadata.get('title', '')}': {topic_data['topic-primary']} (cached)")
-            elif not skip_per_post_extraction:
-                topic_data = extract_topics_from_content(content, post.metadata.get('title', ''), use_enhanced=True)
-            else:
-                # Skip expensive topic extraction and use minimal fallback
-                print(f"Skipping topic extraction for '{post.metadata.get('title', '')}' (minimal mode)")
-                topic_data = {
-                    'topic-primary': 'general',  
-                    'topic-secondary': [],
-                    'extraction-method': 'minimal',
-                    'classification-method': 'static'
-                }
-                
-            # Apply topic data to post
-            try:
-                # Add topic data to post metadata
-                for key, value in topic_data.items():
-                    post.metadata[key] = value
-                
-                method = topic_data.get('classification-method', 'unknown')
-                print(f"Extracted topics for '{post.metadata.get('title', 'Unknown')}': {topic_data['topic-primary']} ({method})")
-            except Exception as e:
-                print(f"Error extracting topics for '{post.metadata.get('title', 'Unknown')}': {e}")
-                # Add default topic data if extraction fails
-                default_topic_data = {
-                    'topic-primary': 'general-technology',
-                    'topic-secondary': [],
-                    'content-entities': [],
-                    'topic-confidence': 0.0,
-                    'related-concepts': [],
-                    'content-complexity': 'intermediate',
-                    'target-audience': ['general-tech-audience'],
-                    'classification-method': 'fallback'
-                }
-                for key, value in default_topic_data.items():
-                    post.metadata[key] = value
-            
-            # Handle series information
-            if 'series' in post.metadata:
-                series_info = post.metadata['series']
-                if isinstance(series_info, dict):
-                    # Check if using new simplified format (slug + part)
-                    if 'slug' in series_info:
-                        # New format: get series info from definitions
-                        series_slug = series_info['slug']
-                        if series_slug in series_definitions:
-                            series_def = series_definitions[series_slug]
-                            series_name = series_def['name']
-                            series_description = series_def['description']
-                        else:
-                            print(f"Warning: Series '{series_slug}' not found in definitions")
-                            series_name = series_slug.replace('-', ' ').title()
-                            series_description = ''
-                    else:
-                        # Old format: series info is inline
-                        series_name = series_info.get('name', '')
-                        series_slug = process_item_for_url_slug(series_name)['url-slug']
-                        series_description = series_info.get('description', '')
-                    
-                    post['series'] = {
-                        'name': series_name,
-                        'url-slug': series_slug,
-                        'part': series_info.get('part', None),
-                        'description': series_description
-                    }
-                    
-                    # Build series metadata
-                    if series_slug not in series_data:
-                        series_data[series_slug] = {
-                            'name': series_name,
-                            'url-slug': series_slug,
-                            'description': series_description,
-                            'posts': []
-                        }
-                    
-                    series_data[series_slug]['posts'].append({
-                        'title': post['title'],
-                        'url-slug': post['url-slug'],
-                        'path': post[POST_PATH_STRING],
-                        'first-published-on': post['first-published-on'],
-                        'part': series_info.get('part', None),
-                        'excerpt': post.get('excerpt', ''),
-                        'reading-time': reading_time
-                    })
-            
-            # Validate and fix post metadata before adding to final data
-            validated_metadata = validate_post_metadata(post.metadata)
-            post.metadata = validated_metadata
-            
-            data_all.append(post.metadata)
+            data_all.append(previous_posts[item[0]])
+            continue
+        
+        result = results[item[0]]
+        if result is None:
+            continue
+        count = count + 1
+        metadata, raw_content, topic_source, extracted_topics = result
+        if topic_cache and topic_source:
+            topic_cache.record_lookup(raw_content, hit=topic_source == 'cache')
+            if extracted_topics is not None and extracted_topics.get('extraction-method') == cacheable_method:
+                topic_cache.put(raw_content, extracted_topics)
+        data_all.append(metadata)
     
     print(f"Total posts: {count}")
+    if not use_cached_topics and not skip_per_post_extraction and transformer_extraction_available():
+        related_sources = {}
+        for post in data_all:
+            path = post[POST_PATH_STRING]
+            loaded = loaded_posts.get(path) or snapshot.get(path.replace('/', os.sep))
+            related_sources[path] = loaded if loaded is not None else load_post(files[path])
+        attach_related_posts(data_all, related_sources)
+    if topic_cache:
+        # Entries of reused posts were not looked up, so only prune on full runs
+        topic_cache.save(prune=not previous_posts)
+        print(f"Topic extraction cache: {topic_cache.summary()}")
+    # Posts served from the topic cache skip tokenization and classification, so their
+    # token lists and embeddings only count as stale on full re-extractions
+    prune_extractor_caches = not previous_posts and not (topic_cache and topic_cache.hits)
+    if _TRANSFORMER_EXTRACTOR is not None:
+        _TRANSFORMER_EXTRACTOR.save_keyword_cache()
+        _TRANSFORMER_EXTRACTOR.save_document_embeddings(prune=prune_extractor_caches)
+    if not use_cached_topics and not skip_per_post_extraction:
+        from enhanced_topic_extraction import save_shared_extractor_caches
+        save_shared_extractor_caches(prune=prune_extractor_caches)
+    
+    # Build series metadata in file order, before posts are sorted by date
+    series_data = collect_series_data(data_all)
     data_all.sort(key=extract_time, reverse=True)
     
-    # Save posts metadata with deterministic formatting
-    json_data = json.dumps(data_all, default=json_serial, sort_keys=True, separators=(',', ':'))
-    # https://stackoverflow.com/a/12517490
-    dir = os.path.dirname(POSTS_LIST_FILE_JSON)
-    if not os.path.exists(dir):
-        try:
-            os.makedirs(dir)
-            print(f"Created directory {dir}")
-        except OSError as exc:  # Guard against race condition
-            if exc.errno != errno.EEXIST:
-                raise
-    file_to_update_json = open(POSTS_LIST_FILE_JSON, "w+")
-    file_to_update_json.write(json_data)
-    file_to_update_json.close()
+    # Stream posts metadata to disk with deterministic formatting
+    write_json_list(POSTS_LIST_FILE_JSON, data_all, default=json_serial)
+    
+    # Split the same metadata into content-addressed shards for on-demand fetching
+    shard_stats = write_metadata_shards(data_all, METADATA_SHARDS_FOLDER, default=json_serial)
+    print(f"Metadata shards: {shard_stats.summary()}")
+    
+    # Term -> post paths lookups for the tag, category, author, topic and archive pages
+    write_json(TAXONOMY_INDEX_FILE_JSON, build_taxonomy_index(data_all))
     
     # Save series metadata
     create_series_metadata(series_data)
+    
+    # Record the processed files so the next run can update incrementally
+    if skip_per_post_extraction:
+        mode = 'minimal'
+    elif use_cached_topics:
+        mode = 'cached-topics'
+    else:
+        mode = 'full'
+    manifest = MetadataManifest(METADATA_MANIFEST_FILE, metadata_pipeline_fingerprint(mode))
+    manifest.update(files, POSTS_LIST_FILE_JSON)
+    manifest.save()
+
+
+def collect_series_data(posts):
+    """Group series posts by series slug from processed post metadata."""
+    series_data = {}
+    
+    for post in posts:
+        series_info = post.get('series')
+        if not isinstance(series_info, dict) or 'url-slug' not in series_info:
+            continue
+        
+        series_slug = series_info['url-slug']
+        if series_slug not in series_data:
+            series_data[series_slug] = {
+                'name': series_info['name'],
+                'url-slug': series_slug,
+                'description': series_info['description'],
+                'posts': []
+            }
+        
+        series_data[series_slug]['posts'].append({
+            'title': post['title'],
+            'url-slug': post['url-slug'],
+            'path': post[POST_PATH_STRING],
+            'first-published-on': post['first-published-on'],
+            'part': series_info.get('part', None),
+            'excerpt': post.get('excerpt', ''),
+            'reading-time': post['reading-time']
+        })
+    
+    return series_data
+
+
+def load_incremental_state(files, mode):
+    """Load reusable post metadata for posts unchanged since the previous run.
+    
+    Must be called before the new metadata is written. Returns None when a
+    full rebuild is required.
+    """
+    manifest = MetadataManifest.load(METADATA_MANIFEST_FILE, metadata_pipeline_fingerprint(mode))
+    if manifest is None:
+        print("⚠️ No compatible manifest from a previous run - performing full rebuild")
+        return None
+    if not manifest.output_matches(POSTS_LIST_FILE_JSON):
+        print("⚠️ Existing metadata does not match the manifest - performing full rebuild")
+        return None
+    
+    diff = manifest.diff(files)
+    print(f"🔄 Incremental update: {diff.summary()}")
+    
+    with open(POSTS_LIST_FILE_JSON, 'r', encoding='utf-8') as f:
+        existing_posts = json.load(f)
+    existing_by_path = {post[POST_PATH_STRING]: post for post in existing_posts}
+    
+    previous_posts = {}
+    for path in diff.unchanged:
+        post = existing_by_path.get(path)
+        if post is None:
+            # Unpublished posts have no metadata entry
+            continue
+        # Restore the date fields used for sorting to their parsed form
+        for field in ('first-published-on', 'last-updated-on'):
+            if isinstance(post.get(field), str):
+                post[field] = datetime.fromisoformat(post[field])
+        previous_posts[path] = post
+    
+    return previous_posts
 
 
 def create_series_metadata(series_data):
@@ -751,38 +1133,29 @@ def create_series_metadata(series_data):
     series_list.sort(key=lambda x: x['first_published'] if x['first_published'] else datetime.min, reverse=True)
     
     # Save series metadata with deterministic formatting
-    json_data = json.dumps(series_list, default=json_serial, sort_keys=True, separators=(',', ':'))
-    dir = os.path.dirname(SERIES_LIST_FILE_JSON)
-    if not os.path.exists(dir):
-        try:
-            os.makedirs(dir)
-            print(f"Created directory {dir}")
-        except OSError as exc:
-            if exc.errno != errno.EEXIST:
-                raise
-    
-    with open(SERIES_LIST_FILE_JSON, "w+") as file:
-        file.write(json_data)
+    write_json_list(SERIES_LIST_FILE_JSON, series_list, default=json_serial)
     
     print(f"Total series: {len(series_list)}")
 
 
 def copy_blog_posts(src, dest):
+    """Sync blog posts into dest, rewriting only files that changed since the last run."""
     try:
-        shutil.copytree(src,
-                        dest,
-                        ignore=shutil.ignore_patterns('*.gitkeep', 'drafts'))
-    except OSError as e:
-        # If the error was caused because the source wasn't a directory
-        if e.errno == errno.ENOTDIR:
+        if not os.path.isdir(src):
             shutil.copy(src, dest)
-        else:
-            print('Directory not copied. Error: %s' % e)
+            return
+        stats = sync_tree(src,
+                          dest,
+                          ignore=shutil.ignore_patterns('*.gitkeep', 'drafts'),
+                          preserve=[os.path.relpath(path, dest) for path in GENERATED_OUTPUT_FILES])
+        print(f"Synced blog posts: {stats.summary()}")
+    except OSError as e:
+        print('Directory not copied. Error: %s' % e)
 
 
 def initialize():
-    if os.path.exists(POSTS_DIST_FOLDER):
-        shutil.rmtree(POSTS_DIST_FOLDER)
+    """Ensure the output folder exists; previous output is kept for incremental sync."""
+    os.makedirs(POSTS_DIST_FOLDER, exist_ok=True)
 
 
 def ignore_function(ignore):
@@ -871,16 +1244,22 @@ def check_cached_metadata_validity():
     """Check if cached metadata is still valid and can be reused."""
     metadata_file = POSTS_LIST_FILE_JSON
     
-    # Check if metadata file exists
-    if not os.path.exists(metadata_file):
+    # Check if metadata files exist (they survive the incremental output sync)
+    if not os.path.exists(metadata_file) or not os.path.exists(SERIES_LIST_FILE_JSON):
         return False
     
     try:
         # Get metadata file modification time
         metadata_mtime = os.path.getmtime(metadata_file)
         
+        if os.path.exists(SERIES_DEFINITIONS_FILE) and os.path.getmtime(SERIES_DEFINITIONS_FILE) > metadata_mtime:
+            return False
+        
         # Check if any blog post is newer than metadata
         for root, dirs, files in os.walk(POSTS_FOLDER):
+            # Adding, removing or renaming a post changes its parent directory's mtime
+            if os.path.getmtime(root) > metadata_mtime:
+                return False
             for file in files:
                 if file.lower().endswith('.md'):
                     blog_file_path = os.path.join(root, file)
@@ -940,16 +1319,23 @@ def validate_post_metadata(post):
     return post
 
 
-def main(run_topic_discovery=True):
+def main(run_topic_discovery=True, use_topic_cache=True, incremental=False, batch_inference=False, batch_size=32,
+         workers=1):
     """main method with enhanced topic extraction."""
     global _SKIP_TOPICS_MODE
     
     # Set global skip mode flag only for true skip scenarios
     _SKIP_TOPICS_MODE = False  # Reset, will be set conditionally
     
+    files = find_files()
+    
+    # Read the previous run's metadata before it is regenerated
+    previous_posts = None
+    if incremental:
+        previous_posts = load_incremental_state(files, 'full' if run_topic_discovery else 'minimal')
+    
     # Always ensure blog posts are copied and basic setup is done
     initialize()
-    files = find_files()
     copy_blog_posts(POSTS_FOLDER, POSTS_DIST_FOLDER)
     
     # Check if we're in true skip mode (no topics at all)
@@ -963,27 +1349,36 @@ def main(run_topic_discovery=True):
         else:
             print("⚠️ Cached metadata not valid or missing - generating minimal metadata without topics")
             # Generate basic metadata without topic processing
-            create_posts_list(files, run_topic_discovery=False, skip_per_post_extraction=True)
+            create_posts_list(files, run_topic_discovery=False, skip_per_post_extraction=True,
+                              previous_posts=previous_posts, workers=workers)
             print("\nBlog metadata creation completed (minimal mode - no topic processing)!")
             return
     
     # Normal mode: Run topic discovery and/or use cached topic models
-    create_posts_list(files, run_topic_discovery=run_topic_discovery, skip_per_post_extraction=False, use_cached_topics=False)
+    # (incremental updates never rerun corpus-wide discovery)
+    create_posts_list(files, run_topic_discovery=run_topic_discovery and not incremental, skip_per_post_extraction=False,
+                      use_cached_topics=False, use_topic_cache=use_topic_cache, previous_posts=previous_posts,
+                      batch_inference=batch_inference, batch_size=batch_size, workers=workers)
     
     print("\nBlog metadata creation completed with enhanced topic extraction!")
 
 
-def main_cached_topics():
+def main_cached_topics(incremental=False, workers=1):
     """Main method for generating metadata using cached topic models."""
+    files = find_files()
+    
+    # Read the previous run's metadata before it is regenerated
+    previous_posts = load_incremental_state(files, 'cached-topics') if incremental else None
+    
     # Always ensure blog posts are copied and basic setup is done
     initialize()
-    files = find_files()
     copy_blog_posts(POSTS_FOLDER, POSTS_DIST_FOLDER)
     
     print("🔍 Using cached topics mode - loading pre-computed topic models...")
     
     # Generate metadata using cached topics (no topic discovery)
-    create_posts_list(files, run_topic_discovery=False, skip_per_post_extraction=False, use_cached_topics=True)
+    create_posts_list(files, run_topic_discovery=False, skip_per_post_extraction=False, use_cached_topics=True,
+                      previous_posts=previous_posts, workers=workers)
     
     print("\nBlog metadata creation completed using cached topics!")
 
@@ -996,6 +1391,11 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description="Generate blog metadata")
     parser.add_argument('--skip-topics', action='store_true', help='Skip topic extraction (faster, minimal metadata)')
     parser.add_argument('--use-cached-topics', action='store_true', help='Use cached topic models for fast topic extraction')
+    parser.add_argument('--incremental', action='store_true', help='Only regenerate metadata for posts changed since the last run')
+    parser.add_argument('--no-topic-cache', action='store_true', help='Ignore the per-post topic extraction cache and re-extract every post')
+    parser.add_argument('--batch-inference', action='store_true', help='Encode all posts in corpus-wide transformer batches before building metadata')
+    parser.add_argument('--batch-size', type=int, default=32, help='Batch size for --batch-inference (default: 32)')
+    parser.add_argument('--workers', type=int, default=1, help='Number of worker processes for per-post processing (default: 1)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
 
     # Parse arguments, but also support legacy --skip-topics flag for backward compatibility
@@ -1009,9 +1409,11 @@ if __name__ == '__main__':
         run_topic_discovery = not args.skip_topics
         if args.skip_topics:
             print("Running with --skip-topics: minimal metadata generation without topic processing")
-            main(run_topic_discovery=run_topic_discovery)
+            main(run_topic_discovery=run_topic_discovery, incremental=args.incremental, workers=args.workers)
         elif args.use_cached_topics:
             print("Running with --use-cached-topics: using pre-computed topic models for fast extraction")
-            main_cached_topics()
+            main_cached_topics(incremental=args.incremental, workers=args.workers)
         else:
-            main(run_topic_discovery=run_topic_discovery)
+            main(run_topic_discovery=run_topic_discovery, use_topic_cache=not args.no_topic_cache,
+                 incremental=args.incremental, batch_inference=args.batch_inference,
+                 batch_size=max(1, args.batch_size), workers=args.workers)
@@ -0,0 +1,222 @@
+"""
+Document Embedding Store
+Sentence-transformer embeddings of whole documents, persisted between runs
+as a memory-mapped float32 matrix plus a JSON index. Entries are keyed by
+post path (or, when no path is known, by content hash) and validated against
+the hash of the embedded text, so unchanged posts are never re-encoded by
+topic discovery, semantic classification or similarity features.
+"""
+
+import json
+import os
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from text_normalizer import normalize_text
+from topic_extraction_cache import hash_bytes
+
+STORE_VERSION = 1
+MATRIX_FILE_NAME = 'document_embeddings.npy'
+INDEX_FILE_NAME = 'document_embeddings.json'
+
+# Namespaces for the different texts embedded per post
+DISCOVERY = 'discovery'
+CLASSIFICATION = 'classification'
+
+
+def hash_text(text: str) -> str:
+    return hash_bytes(text.encode('utf-8'))
+
+
+def discovery_text(title: str, content: str) -> str:
+    """Text of a post embedded under the DISCOVERY namespace."""
+    return normalize_text(f"{title} {content}").alnum
+
+
+class DocumentEmbeddingStore:
+    """(namespace, key) -> (text hash, embedding) store backed by a .npy memory map."""
+
+    def __init__(self, models_folder: str, model_name: str, max_entries: int = 20000):
+        self.matrix_path = os.path.join(models_folder, MATRIX_FILE_NAME)
+        self.index_path = os.path.join(models_folder, INDEX_FILE_NAME)
+        self.max_entries = max_entries
+        self.fingerprint = hash_bytes(f"model:{model_name}".encode('utf-8'))
+
+        # (namespace, key) -> [embedding row index or in-memory vector, text hash]
+        self._entries: 'OrderedDict[Tuple[str, str], list]' = OrderedDict()
+        self._matrix: Optional[np.ndarray] = None
+        self._dirty = False
+        # Entries looked up or stored during this run, and since the last take_updates call
+        self.used_keys = set()
+        self._unreported_keys = set()
+        self._new_keys = set()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self):
+        """Memory-map the persisted matrix if it was built with the same model."""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') != STORE_VERSION or index.get('fingerprint') != self.fingerprint:
+                print("Document embedding store is stale (model changed) - rebuilding")
+                return
+            self._matrix = np.load(self.matrix_path, mmap_mode='r')
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable document embedding store: {e}")
+            return
+
+        entries = index.get('entries', [])
+        if len(entries) != self._matrix.shape[0]:
+            print("Warning: Document embedding index does not match matrix - rebuilding")
+            self._matrix = None
+            return
+
+        # Persisted in least- to most-recently used order
+        for row, (namespace, key, text_hash) in enumerate(entries):
+            self._entries[(namespace, key)] = [row, text_hash]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _vector(self, entry: list) -> np.ndarray:
+        value = entry[0]
+        if isinstance(value, (int, np.integer)):
+            return np.asarray(self._matrix[value], dtype=np.float32)
+        return value
+
+    def get(self, namespace: str, text: str, key: Optional[str] = None) -> Optional[np.ndarray]:
+        """Return the stored embedding of text, if it was embedded before under this key."""
+        text_hash = hash_text(text)
+        entry = self._entries.get((namespace, key or text_hash))
+        if entry is None or entry[1] != text_hash:
+            return None
+        self._entries.move_to_end((namespace, key or text_hash))
+        self.used_keys.add((namespace, key or text_hash))
+        self._unreported_keys.add((namespace, key or text_hash))
+        return self._vector(entry)
+
+    def put(self, namespace: str, text: str, embedding: np.ndarray, key: Optional[str] = None):
+        """Store the embedding of text, replacing any older version under the same key."""
+        text_hash = hash_text(text)
+        self._put((namespace, key or text_hash), embedding, text_hash)
+
+    def _put(self, store_key: Tuple[str, str], embedding: np.ndarray, text_hash: str):
+        self._entries[store_key] = [np.asarray(embedding, dtype=np.float32), text_hash]
+        self._entries.move_to_end(store_key)
+        self.used_keys.add(store_key)
+        self._unreported_keys.add(store_key)
+        self._new_keys.add(store_key)
+        self._dirty = True
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def take_updates(self) -> Dict:
+        """Return the entries stored and keys used since the last call, e.g. in a worker process."""
+        updates = {
+            'entries': {store_key: (self._vector(self._entries[store_key]), self._entries[store_key][1])
+                        for store_key in self._new_keys if store_key in self._entries},
+            'used_keys': self._unreported_keys
+        }
+        self._new_keys = set()
+        self._unreported_keys = set()
+        return updates
+
+    def merge_updates(self, updates: Dict):
+        """Add entries and used keys taken from another instance of this store."""
+        for store_key in sorted(updates['entries']):
+            embedding, text_hash = updates['entries'][store_key]
+            self._put(store_key, embedding, text_hash)
+        for store_key in updates['used_keys']:
+            if store_key in self._entries:
+                self._entries.move_to_end(store_key)
+        self.used_keys.update(updates['used_keys'])
+
+    def embed(self, namespace: str, texts: Sequence[str],
+              encode: Callable[[List[str]], np.ndarray],
+              keys: Optional[Sequence[Optional[str]]] = None) -> np.ndarray:
+        """Return embeddings of texts in order, encoding only those not stored yet.
+
+        Missing texts are passed to encode in a single call, in input order.
+        """
+        keys = keys if keys is not None else [None] * len(texts)
+        vectors: List[Optional[np.ndarray]] = []
+        missing = []
+        for i, (text, key) in enumerate(zip(texts, keys)):
+            vector = self.get(namespace, text, key)
+            if vector is None:
+                missing.append(i)
+            vectors.append(vector)
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            new_embeddings = np.asarray(encode([texts[i] for i in missing]), dtype=np.float32)
+            for i, embedding in zip(missing, new_embeddings):
+                self.put(namespace, texts[i], embedding, keys[i])
+                vectors[i] = embedding
+
+        if not vectors:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.stack(vectors)
+
+    def iter_vectors(self, namespace: str) -> Iterator[Tuple[str, np.ndarray]]:
+        """Yield (key, embedding) for every stored document of a namespace."""
+        for (entry_namespace, key), entry in self._entries.items():
+            if entry_namespace == namespace:
+                yield key, self._vector(entry)
+
+    def summary(self) -> str:
+        return f"{self.hits} reused, {self.misses} encoded ({len(self._entries)} stored)"
+
+    def save(self, prune: bool = True):
+        """Persist the store in LRU order as a float32 matrix plus JSON index.
+
+        With prune, entries of namespaces used in this run that were not
+        themselves used are dropped; namespaces this run never touched are kept.
+        """
+        if prune:
+            used_namespaces = {namespace for namespace, _ in self.used_keys}
+            stale_keys = [store_key for store_key in self._entries
+                          if store_key[0] in used_namespaces and store_key not in self.used_keys]
+            for store_key in stale_keys:
+                del self._entries[store_key]
+            if stale_keys:
+                self._dirty = True
+
+        if not self._dirty:
+            return
+
+        keys = list(self._entries)
+        if keys:
+            matrix = np.stack([self._vector(self._entries[key]) for key in keys]).astype(np.float32)
+        else:
+            matrix = np.zeros((0, 0), dtype=np.float32)
+        entries = [[namespace, key, self._entries[(namespace, key)][1]] for namespace, key in keys]
+
+        # Release the memory map before replacing the file it points to
+        self._matrix = None
+        os.makedirs(os.path.dirname(self.matrix_path), exist_ok=True)
+        tmp_matrix_path = self.matrix_path + '.tmp.npy'
+        np.save(tmp_matrix_path, matrix)
+        os.replace(tmp_matrix_path, self.matrix_path)
+
+        tmp_index_path = self.index_path + '.tmp'
+        with open(tmp_index_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': STORE_VERSION,
+                'fingerprint': self.fingerprint,
+                'entries': entries
+            }, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_index_path, self.index_path)
+
+        # Keep serving the persisted rows from the fresh memory map
+        self._matrix = np.load(self.matrix_path, mmap_mode='r')
+        for row, key in enumerate(keys):
+            self._entries[key][0] = row
+        self._dirty = False
@@ -8,6 +8,7 @@ import json
 import os
 import pickle
 import re
+import time
 from collections import defaultdict, Counter
 from typing import Dict, List, Tuple, Any, Optional
 
@@ -20,26 +21,54 @@ from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
 from nltk.stem import PorterStemmer
 
+from model_artifacts import TFIDF_VECTORIZER, TOPIC_CLUSTERS, artifact_paths, load_cluster_centers, load_tfidf_vectorizer
+from stemming_tokenizer import StemmingTokenizer, TokenCache
+from text_matching import CategoryIndex, EntityMatcher
+from text_normalizer import normalize_text
+
 
 class EnhancedTopicExtractor:
     def __init__(self, config_folder: str):
         self.config_folder = config_folder
         self.models_folder = os.path.join(config_folder, 'topic_models')
         
+        # Seconds spent loading each artifact, for diagnosing startup cost
+        self.load_metrics: Dict[str, float] = {}
+        start_time = time.perf_counter()
+        
         # Initialize NLTK components
         self.stemmer = PorterStemmer()
         
         # Load configurations
-        self.static_config = self._load_static_config()
-        self.dynamic_topics = self._load_dynamic_topics()
+        self.static_config = self._timed_load('static_config', self._load_static_config)
+        self.dynamic_topics = self._timed_load('dynamic_topics', self._load_dynamic_topics)
+        self.category_index = CategoryIndex(self.static_config.get('topicCategories', {}))
+        self.entity_matcher = EntityMatcher(self.static_config.get('technicalEntities', {}))
         
         # Load trained models
-        self.vectorizer = self._load_vectorizer()
-        self.clustering_model = self._load_clustering_model()
+        self.vectorizer = self._timed_load('vectorizer', self._load_vectorizer)
+        self.clustering_model = self._timed_load('clustering_model', self._load_clustering_model)
+        self.token_cache = self._timed_load('token_cache', self._load_token_cache)
+        # (preprocessed text, cluster id, distances) of the last post run through the dynamic models
+        self._last_dynamic_prediction = None
         
         # Initialize stop words
-        self.stop_words = set(stopwords.words('english'))
-        self.stop_words.update(self.static_config.get('stopWords', []))
+        self.stop_words = self._timed_load('stop_words', self._load_stop_words)
+        
+        self.load_metrics['total'] = time.perf_counter() - start_time
+    
+    def _timed_load(self, name: str, loader):
+        """Run a loader and record how long it took in load_metrics."""
+        start_time = time.perf_counter()
+        result = loader()
+        self.load_metrics[name] = time.perf_counter() - start_time
+        return result
+    
+    def _load_stop_words(self) -> set:
+        """Build the stop word set from NLTK and the static config."""
+        stop_words = set(stopwords.words('english'))
+        stop_words.update(self.static_config.get('stopWords', []))
+        return stop_words
     
     def _load_static_config(self) -> Dict:
         """Load existing static topic extraction configuration."""
@@ -61,44 +90,66 @@ class EnhancedTopicExtractor:
             print(f"Warning: Dynamic topics not found at {topics_path}")
             return {'discoveredTopics': {}, 'topicStats': {}, 'documentAssignments': []}
     
-    def _load_vectorizer(self) -> Optional[TfidfVectorizer]:
-        """Load trained TF-IDF vectorizer."""
-        vectorizer_path = os.path.join(self.models_folder, 'tfidf_vectorizer.pkl')
+    def _load_legacy_pickle(self, file_name: str):
+        """Load a model pickled by older versions, before models were stored as artifacts."""
+        legacy_path = os.path.join(self.models_folder, file_name)
         try:
-            with open(vectorizer_path, 'rb') as f:
-                return pickle.load(f)
+            with open(legacy_path, 'rb') as f:
+                model = pickle.load(f)
         except FileNotFoundError:
-            print(f"Warning: Vectorizer not found at {vectorizer_path}")
             return None
+        print(f"Info: Using legacy model {legacy_path} until topic discovery runs again")
+        return model
+    
+    def _load_vectorizer(self) -> Optional[TfidfVectorizer]:
+        """Load trained TF-IDF vectorizer."""
+        vectorizer = load_tfidf_vectorizer(self.models_folder)
+        if vectorizer is None:
+            vectorizer = self._load_legacy_pickle('tfidf_vectorizer.pkl')
+        if vectorizer is None:
+            print(f"Warning: Vectorizer not found at {artifact_paths(self.models_folder, TFIDF_VECTORIZER)[1]}")
+        return vectorizer
     
     def _load_clustering_model(self):
-        """Load trained clustering model."""
-        clustering_path = os.path.join(self.models_folder, 'topic_clusters.pkl')
+        """Load trained clustering model (anything with KMeans' predict and transform)."""
+        clustering_model = load_cluster_centers(self.models_folder)
+        if clustering_model is None:
+            clustering_model = self._load_legacy_pickle('topic_clusters.pkl')
+        if clustering_model is None:
+            print(f"Warning: Clustering model not found at {artifact_paths(self.models_folder, TOPIC_CLUSTERS)[1]}")
+        return clustering_model
+    
+    def _load_token_cache(self) -> Optional[TokenCache]:
+        """Create the token cache for vectorizers trained with a StemmingTokenizer."""
+        tokenizer = getattr(self.vectorizer, 'tokenizer', None)
+        if not isinstance(tokenizer, StemmingTokenizer):
+            # Older vectorizers can only tokenize text themselves
+            return None
+        return TokenCache(self.models_folder, tokenizer)
+    
+    def save_token_cache(self, prune: bool = True):
+        """Persist the token cache for the next run."""
+        if self.token_cache is None:
+            return
         try:
-            with open(clustering_path, 'rb') as f:
-                return pickle.load(f)
-        except FileNotFoundError:
-            print(f"Warning: Clustering model not found at {clustering_path}")
+            self.token_cache.save(prune=prune)
+        except OSError as e:
+            print(f"Warning: Could not save token cache: {e}")
+    
+    def take_cache_updates(self) -> Optional[Dict]:
+        """Return the token cache entries created since the last call, for merging elsewhere."""
+        if self.token_cache is None:
             return None
+        return self.token_cache.take_updates()
+    
+    def merge_cache_updates(self, updates: Optional[Dict]):
+        """Merge token cache entries taken from an extractor in another process."""
+        if self.token_cache is not None and updates:
+            self.token_cache.merge_updates(updates)
     
     def preprocess_text(self, text: str) -> str:
         """Clean and preprocess text for analysis."""
-        # Remove YAML frontmatter
-        text = re.sub(r'^---\n.*?\n---\n', '', text, flags=re.DOTALL)
-        # Remove HTML tags
-        text = re.sub(r'<[^>]*>', '', text)
-        # Remove code blocks
-        text = re.sub(r'```[\s\S]*?```', '', text)
-        text = re.sub(r'`[^`]*`', '', text)
-        # Convert links to text
-        text = re.sub(r'\[([^\]]*)\]\([^)]*\)', r'\1', text)
-        # Remove markdown formatting
-        text = re.sub(r'[#*_~`]', '', text)
-        # Remove special characters
-        text = re.sub(r'[^a-zA-Z0-9\s]', ' ', text)
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
-        return text.lower().strip()
+        return normalize_text(text).alnum_lower
     
     def tokenize_and_stem(self, text: str) -> List[str]:
         """Tokenize text and apply stemming."""
@@ -143,29 +194,38 @@ class EnhancedTopicExtractor:
     
     def categorize_keyword_static(self, keyword: str) -> str:
         """Categorize a keyword using static topic categories."""
-        topic_categories = self.static_config.get('topicCategories', {})
+        return self.category_index.categorize(keyword)
+    
+    def _predict_cluster(self, content: str, title: str = '') -> Tuple[int, np.ndarray]:
+        """Return the predicted cluster and cluster distances of a post.
         
-        for category, terms in topic_categories.items():
-            if any(keyword in term.lower() or term.lower() in keyword for term in terms):
-                return category
-        return 'general'
+        The TF-IDF vector is computed once per post and shared by dynamic keyword
+        extraction and dynamic classification.
+        """
+        combined_text = f"{title} {title} {content}"
+        preprocessed_text = self.preprocess_text(combined_text)
+        
+        last = self._last_dynamic_prediction
+        if last is not None and last[0] == preprocessed_text:
+            return last[1], last[2]
+        
+        # Cached token lists skip tokenization and stemming entirely
+        document = self.token_cache.get(preprocessed_text) if self.token_cache else preprocessed_text
+        tfidf_vector = self.vectorizer.transform([document])
+        predicted_cluster = self.clustering_model.predict(tfidf_vector)[0]
+        distances = self.clustering_model.transform(tfidf_vector)[0]
+        
+        self._last_dynamic_prediction = (preprocessed_text, predicted_cluster, distances)
+        return predicted_cluster, distances
     
     def extract_keywords_dynamic(self, content: str, title: str = '') -> List[Dict]:
         """Extract keywords using dynamic topic discovery."""
         if not self.vectorizer or not self.clustering_model:
             return []
         
-        # Prepare text for vectorization
-        combined_text = f"{title} {title} {content}"
-        preprocessed_text = self.preprocess_text(combined_text)
-        
         try:
-            # Transform text using trained vectorizer
-            tfidf_vector = self.vectorizer.transform([preprocessed_text])
-            
-            # Predict topic cluster
-            predicted_cluster = self.clustering_model.predict(tfidf_vector)[0]
-            distances = self.clustering_model.transform(tfidf_vector)[0]
+            # Predict topic cluster using trained vectorizer and clustering model
+            predicted_cluster, distances = self._predict_cluster(content, title)
             
             # Calculate confidence
             distance_to_center = distances[predicted_cluster]
@@ -250,13 +310,8 @@ class EnhancedTopicExtractor:
         if not self.vectorizer or not self.clustering_model:
             return None, 0.0, {}
         
-        combined_text = f"{title} {title} {content}"
-        preprocessed_text = self.preprocess_text(combined_text)
-        
         try:
-            tfidf_vector = self.vectorizer.transform([preprocessed_text])
-            predicted_cluster = self.clustering_model.predict(tfidf_vector)[0]
-            distances = self.clustering_model.transform(tfidf_vector)[0]
+            predicted_cluster, distances = self._predict_cluster(content, title)
             
             distance_to_center = distances[predicted_cluster]
             confidence = 1.0 / (1.0 + distance_to_center)
@@ -280,23 +335,8 @@ class EnhancedTopicExtractor:
     
     def extract_entities(self, content: str) -> List[str]:
         """Extract named entities from content using both static and dynamic methods."""
-        entities = set()
-        normalized_content = content.lower()
-        
-        # Static entity extraction
-        technical_entities = self.static_config.get('technicalEntities', {})
-        for entity_list in technical_entities.values():
-            for entity in entity_list:
-                if entity.lower() in normalized_content:
-                    entities.add(entity)
-        
-        # Extract proper nouns
-        proper_nouns = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', content)
-        for noun in proper_nouns:
-            if len(noun) > 3 and noun.lower() not in self.stop_words:
-                entities.add(noun)
-        
-        return list(entities)[:15]
+        # Static entities from config, then proper nouns
+        return self.entity_matcher.extract(content, self.stop_words)
     
     def assess_content_complexity(self, content: str, keywords: List[Dict]) -> str:
         """Assess content complexity using enhanced metrics."""
@@ -459,6 +499,63 @@ def create_enhanced_extractor(config_folder: str) -> EnhancedTopicExtractor:
     return EnhancedTopicExtractor(config_folder)
 
 
+# Process-wide extractors keyed by config folder, so configs, stop words and
+# pickled models are loaded once and shared by every post
+_SHARED_EXTRACTORS: Dict[str, EnhancedTopicExtractor] = {}
+_SHARED_EXTRACTOR_ERRORS: Dict[str, Exception] = {}
+
+
+def get_shared_extractor(config_folder: str) -> EnhancedTopicExtractor:
+    """Return the shared extractor for a config folder, creating it on first use.
+    
+    A failed initialization is remembered and re-raised on later calls rather
+    than retried for every post.
+    """
+    key = os.path.abspath(config_folder)
+    if key in _SHARED_EXTRACTOR_ERRORS:
+        raise _SHARED_EXTRACTOR_ERRORS[key]
+    
+    if key not in _SHARED_EXTRACTORS:
+        try:
+            extractor = EnhancedTopicExtractor(config_folder)
+        except Exception as e:
+            _SHARED_EXTRACTOR_ERRORS[key] = e
+            raise
+        _SHARED_EXTRACTORS[key] = extractor
+        metrics = ', '.join(f"{name}={seconds * 1000:.1f}ms" for name, seconds in extractor.load_metrics.items())
+        print(f"Enhanced extractor loaded ({metrics})")
+    
+    return _SHARED_EXTRACTORS[key]
+
+
+def save_shared_extractor_caches(prune: bool = True):
+    """Persist the caches of every shared extractor created in this process."""
+    for extractor in _SHARED_EXTRACTORS.values():
+        extractor.save_token_cache(prune=prune)
+
+
+def take_shared_extractor_cache_updates() -> Dict[str, Dict]:
+    """Return the new cache entries of every shared extractor, keyed by config folder."""
+    updates = {}
+    for key, extractor in _SHARED_EXTRACTORS.items():
+        extractor_updates = extractor.take_cache_updates()
+        if extractor_updates:
+            updates[key] = extractor_updates
+    return updates
+
+
+def merge_shared_extractor_cache_updates(updates: Dict[str, Dict]):
+    """Merge cache entries taken from shared extractors of another process into this one's."""
+    for key, extractor_updates in updates.items():
+        get_shared_extractor(key).merge_cache_updates(extractor_updates)
+
+
+def clear_shared_extractors():
+    """Drop shared extractors, e.g. after topic models were regenerated."""
+    _SHARED_EXTRACTORS.clear()
+    _SHARED_EXTRACTOR_ERRORS.clear()
+
+
 # Standalone testing function
 def test_extraction(config_folder: str, sample_content: str, sample_title: str = ''):
     """Test the enhanced topic extraction on sample content."""
@@ -12,12 +12,14 @@ import sys
 from collections import defaultdict, Counter
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Any
-import frontmatter
 import nltk
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
 from nltk.stem import PorterStemmer
 
+from corpus_snapshot import load_corpus_snapshot
+from post_loader import load_post
+
 
 class TopicConfigGenerator:
     def __init__(self, blog_folder: str = "blog", config_folder: str = "website/config"):
@@ -61,12 +63,14 @@ class TopicConfigGenerator:
         """Analyze all blog content to extract technical terms and patterns."""
         print("Analyzing blog content for dynamic configuration generation...")
         
+        # Parsed posts are shared with the other pipeline stages through the corpus snapshot
+        snapshot = load_corpus_snapshot(str(self.blog_folder), str(self.config_folder / 'topic_models'))
+        
         post_count = 0
         for md_file in self.blog_folder.rglob("*.md"):
             try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    post = frontmatter.load(f)
-                    
+                post = snapshot.get(os.path.relpath(md_file, self.blog_folder)) or load_post(str(md_file))
+                
                 # Skip drafts
                 if not post.metadata.get('published', True):
                     continue
@@ -0,0 +1,58 @@
+"""
+JSON Output
+Streams generated metadata lists to disk one item at a time. Each item is
+encoded straight into a temporary file next to the target, which then
+atomically replaces it, so the full JSON text is never held in memory and an
+interrupted run leaves the previous file intact. Other generated JSON
+documents are written through the same temporary file and rename.
+"""
+
+import json
+import os
+from typing import Callable, Iterable, Optional
+
+
+def _replace_from_tmp(path: str, write: Callable):
+    """Call write with a text file at path + '.tmp', then move it over path."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Never leave a partial file behind; the previous output stays in place
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_json(path: str, data, default: Optional[Callable] = None,
+               sort_keys: bool = True, separators=(',', ':')):
+    """Atomically write data as compact, deterministic JSON."""
+    encoder = json.JSONEncoder(default=default, sort_keys=sort_keys, separators=separators)
+    _replace_from_tmp(path, lambda f: f.writelines(encoder.iterencode(data)))
+
+
+def write_json_list(path: str, items: Iterable, default: Optional[Callable] = None,
+                    sort_keys: bool = True, separators=(',', ':')) -> int:
+    """Write items as a JSON array, byte-identical to json.dumps(list(items), ...).
+
+    Returns the number of items written.
+    """
+    encoder = json.JSONEncoder(default=default, sort_keys=sort_keys, separators=separators)
+    item_separator = separators[0]
+    count = 0
+
+    def write(f):
+        nonlocal count
+        f.write('[')
+        for item in items:
+            if count:
+                f.write(item_separator)
+            f.writelines(encoder.iterencode(item))
+            count += 1
+        f.write(']')
+
+    _replace_from_tmp(path, write)
+    return count
@@ -0,0 +1,171 @@
+"""
+Keyword Embedding Cache
+Bounded LRU cache of keyword embeddings and keyword categories shared across
+posts and persisted between runs as a memory-mapped matrix, so that recurring
+vocabulary is only ever encoded by the sentence transformer once.
+"""
+
+import json
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from topic_extraction_cache import hash_bytes, hash_file
+
+CACHE_VERSION = 1
+MATRIX_FILE_NAME = 'keyword_embeddings.npy'
+INDEX_FILE_NAME = 'keyword_embeddings.json'
+
+
+class KeywordEmbeddingCache:
+    """LRU keyword -> (embedding, category) cache backed by a .npy memory map."""
+
+    def __init__(self, models_folder: str, model_name: str, category_embeddings_path: str,
+                 max_entries: int = 50000, dtype: str = 'float16'):
+        self.matrix_path = os.path.join(models_folder, MATRIX_FILE_NAME)
+        self.index_path = os.path.join(models_folder, INDEX_FILE_NAME)
+        self.max_entries = max_entries
+        self.dtype = np.dtype(dtype)
+        # Embeddings depend on the model, categories also on the category embeddings
+        self.fingerprint = hash_bytes(
+            f"model:{model_name}\ncategories:{hash_file(category_embeddings_path)}".encode('utf-8')
+        )
+
+        # keyword -> [embedding row index or in-memory vector, category or None]
+        self._entries: 'OrderedDict[str, list]' = OrderedDict()
+        self._matrix: Optional[np.ndarray] = None
+        self._dirty = False
+        # Keywords stored since the last take_updates call
+        self._updated = set()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self):
+        """Memory-map the persisted matrix if it was built with the same model and categories."""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') != CACHE_VERSION or index.get('fingerprint') != self.fingerprint:
+                print("Keyword embedding cache is stale (model or categories changed) - rebuilding")
+                return
+            self._matrix = np.load(self.matrix_path, mmap_mode='r')
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable keyword embedding cache: {e}")
+            return
+
+        keywords = index.get('keywords', [])
+        categories = index.get('categories', [])
+        if len(keywords) != self._matrix.shape[0] or len(categories) != len(keywords):
+            print("Warning: Keyword embedding cache index does not match matrix - rebuilding")
+            self._matrix = None
+            return
+
+        # Persisted in least- to most-recently used order
+        for row, (keyword, category) in enumerate(zip(keywords, categories)):
+            self._entries[keyword] = [row, category]
+        print(f"Loaded {len(self._entries)} cached keyword embeddings")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _touch(self, keyword: str) -> Optional[list]:
+        entry = self._entries.get(keyword)
+        if entry is not None:
+            self._entries.move_to_end(keyword)
+        return entry
+
+    def _vector(self, entry: list) -> np.ndarray:
+        value = entry[0]
+        if isinstance(value, (int, np.integer)):
+            return np.asarray(self._matrix[value], dtype=np.float32)
+        return value
+
+    def get_category(self, keyword: str) -> Optional[str]:
+        """Return the cached category for a keyword, if known."""
+        entry = self._touch(keyword)
+        if entry is None or entry[1] is None:
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def get_embeddings(self, keywords: List[str]) -> Tuple[Dict[str, np.ndarray], List[str]]:
+        """Split keywords into cached embeddings and keywords that still need encoding."""
+        found, missing = {}, []
+        for keyword in keywords:
+            entry = self._touch(keyword)
+            if entry is None:
+                missing.append(keyword)
+            else:
+                found[keyword] = self._vector(entry)
+        self.misses += len(missing)
+        return found, missing
+
+    def put(self, keyword: str, embedding: np.ndarray, category: Optional[str] = None):
+        """Store a keyword embedding and optionally its category."""
+        entry = self._entries.get(keyword)
+        vector = np.asarray(embedding, dtype=np.float32)
+        if entry is None:
+            self._entries[keyword] = [vector, category]
+        else:
+            entry[0] = vector
+            if category is not None:
+                entry[1] = category
+            self._entries.move_to_end(keyword)
+        self._updated.add(keyword)
+        self._dirty = True
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def take_updates(self) -> Dict[str, Tuple[np.ndarray, Optional[str]]]:
+        """Return keyword -> (embedding, category) stored since the last call, e.g. in a worker process."""
+        updates = {keyword: (self._vector(self._entries[keyword]), self._entries[keyword][1])
+                   for keyword in self._updated if keyword in self._entries}
+        self._updated = set()
+        return updates
+
+    def merge_updates(self, updates: Dict[str, Tuple[np.ndarray, Optional[str]]]):
+        """Store keywords taken from another instance of this cache."""
+        for keyword in sorted(updates):
+            embedding, category = updates[keyword]
+            self.put(keyword, embedding, category)
+
+    def save(self):
+        """Persist the cache in LRU order as a compact matrix plus JSON index."""
+        if not self._dirty:
+            return
+
+        keywords = list(self._entries)
+        if keywords:
+            matrix = np.stack([self._vector(self._entries[keyword]) for keyword in keywords]).astype(self.dtype)
+        else:
+            matrix = np.zeros((0, 0), dtype=self.dtype)
+        categories = [self._entries[keyword][1] for keyword in keywords]
+
+        # Release the memory map before replacing the file it points to
+        self._matrix = None
+        os.makedirs(os.path.dirname(self.matrix_path), exist_ok=True)
+        tmp_matrix_path = self.matrix_path + '.tmp.npy'
+        np.save(tmp_matrix_path, matrix)
+        os.replace(tmp_matrix_path, self.matrix_path)
+
+        tmp_index_path = self.index_path + '.tmp'
+        with open(tmp_index_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': CACHE_VERSION,
+                'fingerprint': self.fingerprint,
+                'dtype': self.dtype.name,
+                'keywords': keywords,
+                'categories': categories
+            }, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_index_path, self.index_path)
+
+        # Keep serving the persisted rows from the fresh memory map
+        self._matrix = np.load(self.matrix_path, mmap_mode='r')
+        for row, keyword in enumerate(keywords):
+            self._entries[keyword][0] = row
+        self._dirty = False
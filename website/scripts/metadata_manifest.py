@@ -0,0 +1,125 @@
+"""
+Metadata Manifest
+Records the (path, mtime, size, content hash) of every blog post processed by a
+metadata run so that the next run can detect added, modified and deleted posts
+and regenerate metadata for the changed posts only.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+from topic_extraction_cache import hash_bytes, hash_file
+
+MANIFEST_VERSION = 1
+
+
+class ManifestDiff:
+    """Result of comparing the current post files against a previous manifest."""
+
+    def __init__(self, added: List[str], modified: List[str], deleted: List[str], unchanged: List[str]):
+        self.added = added
+        self.modified = modified
+        self.deleted = deleted
+        self.unchanged = unchanged
+
+    @property
+    def changed(self) -> List[str]:
+        """Posts that need their metadata recomputed."""
+        return self.added + self.modified
+
+    def has_changes(self) -> bool:
+        return bool(self.added or self.modified or self.deleted)
+
+    def summary(self) -> str:
+        return (f"{len(self.added)} added, {len(self.modified)} modified, "
+                f"{len(self.deleted)} deleted, {len(self.unchanged)} unchanged")
+
+
+class MetadataManifest:
+    """Per-post file state recorded by the previous metadata run."""
+
+    def __init__(self, manifest_path: str, fingerprint: str):
+        self.manifest_path = manifest_path
+        self.fingerprint = fingerprint
+        self.entries: Dict[str, Dict] = {}
+        self.output_hash: Optional[str] = None
+
+    @classmethod
+    def load(cls, manifest_path: str, fingerprint: str) -> Optional['MetadataManifest']:
+        """Load a manifest, returning None if it is missing or was built with different settings."""
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable metadata manifest {manifest_path}: {e}")
+            return None
+
+        if data.get('version') != MANIFEST_VERSION or data.get('fingerprint') != fingerprint:
+            return None
+
+        manifest = cls(manifest_path, fingerprint)
+        manifest.entries = data.get('posts', {})
+        manifest.output_hash = data.get('output_hash')
+        return manifest
+
+    @staticmethod
+    def _stat_entry(file_path: str, previous: Optional[Dict] = None) -> Dict:
+        """Build a manifest entry, reusing the previous hash when mtime and size match."""
+        stat = os.stat(file_path)
+        entry = {'mtime': stat.st_mtime_ns, 'size': stat.st_size}
+        if previous and previous.get('mtime') == entry['mtime'] and previous.get('size') == entry['size']:
+            entry['sha256'] = previous['sha256']
+        else:
+            entry['sha256'] = hash_file(file_path)
+        return entry
+
+    def diff(self, files: Dict[str, str]) -> ManifestDiff:
+        """Compare the current post files (path -> file path) against this manifest."""
+        added, modified, unchanged = [], [], []
+        for path, file_path in files.items():
+            previous = self.entries.get(path)
+            if previous is None:
+                added.append(path)
+                continue
+            current = self._stat_entry(file_path, previous)
+            if current['sha256'] == previous['sha256']:
+                unchanged.append(path)
+            else:
+                modified.append(path)
+        deleted = sorted(set(self.entries) - set(files))
+        return ManifestDiff(added, modified, deleted, unchanged)
+
+    def update(self, files: Dict[str, str], output_path: str):
+        """Record the current post files and the hash of the metadata file they produced."""
+        self.entries = {
+            path: self._stat_entry(file_path, self.entries.get(path))
+            for path, file_path in files.items()
+        }
+        self.output_hash = hash_file(output_path)
+
+    def output_matches(self, output_path: str) -> bool:
+        """Check that the metadata file on disk is the one this manifest describes."""
+        return self.output_hash is not None and hash_file(output_path) == self.output_hash
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': MANIFEST_VERSION,
+                'fingerprint': self.fingerprint,
+                'output_hash': self.output_hash,
+                'posts': self.entries
+            }, f, sort_keys=True, separators=(',', ':'))
+        os.replace(tmp_path, self.manifest_path)
+
+
+def compute_pipeline_fingerprint(mode: str, extraction_fingerprint: str, extra_paths: List[str]) -> str:
+    """Fingerprint the settings that make previously generated post metadata reusable."""
+    parts = [f"mode:{mode}", f"extraction:{extraction_fingerprint}"]
+    for path in sorted(extra_paths):
+        parts.append(f"{os.path.basename(path)}:{hash_file(path)}")
+    return hash_bytes('\n'.join(parts).encode('utf-8'))
@@ -0,0 +1,127 @@
+"""
+Metadata Shards
+Splits the generated post metadata into small files the frontend can fetch
+on demand: a lightweight index of every post plus per-page, per-tag,
+per-category and per-year shards. Shard filenames carry a hash of their
+content, so unchanged shards keep their name (and CDN cache entries) across
+runs. A fixed-name manifest maps every shard key to its current file.
+"""
+
+import json
+import os
+from typing import Callable, Dict, List, Optional
+
+from topic_extraction_cache import hash_bytes
+
+SHARDS_VERSION = 1
+SHARD_MANIFEST_FILE_NAME = 'manifest.json'
+DEFAULT_PAGE_SIZE = 20
+
+# Fields of each post kept in the lightweight index
+INDEX_FIELDS = ['path', 'title', 'first-published-on', 'url-slug', 'excerpt']
+
+
+class ShardStats:
+    """Counts of what a shard write did."""
+
+    def __init__(self):
+        self.written = 0
+        self.unchanged = 0
+        self.removed = 0
+
+    def summary(self) -> str:
+        return f"{self.written} written, {self.unchanged} unchanged, {self.removed} removed"
+
+
+def _group_by_slug(posts: List[Dict], field: str) -> Dict[str, List[Dict]]:
+    """Group posts by the url-slug of each entry of a list field (tags, categories)."""
+    groups: Dict[str, List[Dict]] = {}
+    for post in posts:
+        seen = set()
+        for item in post.get(field) or []:
+            slug = item.get('url-slug') if isinstance(item, dict) else None
+            if slug and slug not in seen:
+                seen.add(slug)
+                groups.setdefault(slug, []).append(post)
+    return groups
+
+
+def _group_by_year(posts: List[Dict]) -> Dict[str, List[Dict]]:
+    groups: Dict[str, List[Dict]] = {}
+    for post in posts:
+        published = post.get('first-published-on')
+        year = getattr(published, 'year', None) or str(published)[:4]
+        groups.setdefault(str(year), []).append(post)
+    return groups
+
+
+class ShardWriter:
+    """Writes content-addressed JSON shards into one folder and removes stale ones."""
+
+    def __init__(self, shards_folder: str, default: Optional[Callable] = None):
+        self.shards_folder = shards_folder
+        self.default = default
+        self.stats = ShardStats()
+        self.files = set()
+
+    def write(self, name: str, data) -> Dict:
+        """Write data as <name>.<hash>.json unless that file exists, returning its manifest entry."""
+        content = json.dumps(data, default=self.default, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        file_name = f"{name}.{hash_bytes(content)[:12]}.json"
+        file_path = os.path.join(self.shards_folder, file_name)
+        if os.path.exists(file_path):
+            self.stats.unchanged += 1
+        else:
+            tmp_path = file_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, file_path)
+            self.stats.written += 1
+        self.files.add(file_name)
+        return {'file': file_name, 'count': len(data)}
+
+    def remove_stale(self):
+        """Delete shards that the current manifest no longer references."""
+        for file_name in os.listdir(self.shards_folder):
+            if file_name == SHARD_MANIFEST_FILE_NAME or file_name in self.files:
+                continue
+            os.remove(os.path.join(self.shards_folder, file_name))
+            self.stats.removed += 1
+
+
+def write_metadata_shards(posts: List[Dict], shards_folder: str, default: Optional[Callable] = None,
+                          page_size: int = DEFAULT_PAGE_SIZE) -> ShardStats:
+    """Write the index and shards of posts (already in display order) plus their manifest.
+
+    Shards are written before the manifest and stale shards are removed after
+    it, so a reader following the manifest never sees a missing file.
+    """
+    os.makedirs(shards_folder, exist_ok=True)
+    writer = ShardWriter(shards_folder, default)
+
+    index = [{field: post.get(field) for field in INDEX_FIELDS} for post in posts]
+    manifest = {
+        'version': SHARDS_VERSION,
+        'pageSize': page_size,
+        'postCount': len(posts),
+        'index': writer.write('index', index),
+        'pages': [
+            writer.write(f"page-{number}", posts[start:start + page_size])
+            for number, start in enumerate(range(0, len(posts), page_size), 1)
+        ],
+        'tags': {slug: writer.write(f"tag-{slug}", group)
+                 for slug, group in sorted(_group_by_slug(posts, 'tags').items())},
+        'categories': {slug: writer.write(f"category-{slug}", group)
+                       for slug, group in sorted(_group_by_slug(posts, 'categories').items())},
+        'years': {year: writer.write(f"year-{year}", group)
+                  for year, group in sorted(_group_by_year(posts).items())}
+    }
+
+    manifest_path = os.path.join(shards_folder, SHARD_MANIFEST_FILE_NAME)
+    tmp_path = manifest_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, sort_keys=True, separators=(',', ':'))
+    os.replace(tmp_path, manifest_path)
+
+    writer.remove_stale()
+    return writer.stats
@@ -0,0 +1,170 @@
+"""
+Model Artifacts
+Versioned on-disk format for the trained topic models: each artifact is one
+.npy matrix, memory-mapped on load so worker processes share its pages, plus
+a small JSON header with the matrix shape, dtype, SHA-256 checksum and
+whatever the model needs besides the matrix (model name, category list,
+vocabulary). The header is written last, so a half-written artifact never
+validates. Replaces the pickled category embeddings, TF-IDF vectorizer and
+k-means model, which had to be fully unpickled by every process.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import euclidean_distances
+
+from stemming_tokenizer import StemmingTokenizer
+from topic_extraction_cache import hash_bytes, hash_file
+
+ARTIFACT_VERSION = 1
+
+CATEGORY_EMBEDDINGS = 'category_embeddings'
+TFIDF_VECTORIZER = 'tfidf_vectorizer'
+TOPIC_CLUSTERS = 'topic_clusters'
+
+# TfidfVectorizer parameters rebuilt from the tokenizer entry rather than stored as-is
+_VECTORIZER_OBJECT_PARAMS = ('tokenizer', 'preprocessor', 'vocabulary', 'dtype')
+
+
+def artifact_paths(models_folder: str, name: str) -> Tuple[str, str]:
+    """Return the (matrix, header) paths of an artifact."""
+    return os.path.join(models_folder, f"{name}.npy"), os.path.join(models_folder, f"{name}.json")
+
+
+def save_array_artifact(models_folder: str, name: str, array: np.ndarray, header: Dict,
+                        dtype: str = 'float32'):
+    """Write array (converted to dtype) and its header, replacing any previous version."""
+    matrix_path, header_path = artifact_paths(models_folder, name)
+    os.makedirs(models_folder, exist_ok=True)
+    array = np.ascontiguousarray(array, dtype=dtype)
+
+    # Per-process temporary names: pool workers may build the same missing artifact at once
+    tmp_matrix_path = f"{matrix_path}.{os.getpid()}.tmp.npy"
+    np.save(tmp_matrix_path, array)
+    os.replace(tmp_matrix_path, matrix_path)
+
+    header = dict(header)
+    header.update({
+        'version': ARTIFACT_VERSION,
+        'shape': list(array.shape),
+        'dtype': array.dtype.name,
+        'sha256': hash_file(matrix_path)
+    })
+    tmp_header_path = f"{header_path}.{os.getpid()}.tmp"
+    with open(tmp_header_path, 'w', encoding='utf-8') as f:
+        json.dump(header, f, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    os.replace(tmp_header_path, header_path)
+
+
+def load_array_artifact(models_folder: str, name: str,
+                        expected: Optional[Dict] = None) -> Optional[Tuple[np.ndarray, Dict]]:
+    """Memory-map a validated artifact, returning (matrix, header).
+
+    Returns None when the artifact is missing, was written by another format
+    version, has header values differing from expected, or fails its checksum.
+    """
+    matrix_path, header_path = artifact_paths(models_folder, name)
+    try:
+        with open(header_path, 'r', encoding='utf-8') as f:
+            header = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable model artifact header {header_path}: {e}")
+        return None
+
+    if header.get('version') != ARTIFACT_VERSION:
+        return None
+    for key, value in (expected or {}).items():
+        if header.get(key) != value:
+            print(f"Model artifact {name} is stale ({key} changed)")
+            return None
+
+    try:
+        if hash_file(matrix_path) != header.get('sha256'):
+            print(f"Warning: Model artifact {name} failed its checksum - ignoring it")
+            return None
+        matrix = np.load(matrix_path, mmap_mode='r')
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable model artifact {matrix_path}: {e}")
+        return None
+    if list(matrix.shape) != header.get('shape') or matrix.dtype.name != header.get('dtype'):
+        print(f"Warning: Model artifact {name} does not match its header - ignoring it")
+        return None
+    return matrix, header
+
+
+def save_tfidf_vectorizer(models_folder: str, vectorizer: TfidfVectorizer):
+    """Store a fitted vectorizer as its idf weights plus vocabulary, parameters and stop words."""
+    tokenizer = vectorizer.tokenizer
+    if not isinstance(tokenizer, StemmingTokenizer):
+        raise ValueError("Only vectorizers with a StemmingTokenizer can be stored as artifacts")
+
+    params = {key: value for key, value in vectorizer.get_params().items()
+              if key not in _VECTORIZER_OBJECT_PARAMS}
+    params['ngram_range'] = list(params['ngram_range'])
+    save_array_artifact(models_folder, TFIDF_VECTORIZER, vectorizer.idf_, {
+        'params': params,
+        'dtype_name': np.dtype(vectorizer.dtype).name,
+        'stop_words': sorted(tokenizer.stop_words),
+        'vocabulary': vectorizer.get_feature_names_out().tolist()
+    }, dtype='float64')
+
+
+def load_tfidf_vectorizer(models_folder: str) -> Optional[TfidfVectorizer]:
+    """Rebuild a fitted vectorizer whose transform matches the stored one exactly."""
+    artifact = load_array_artifact(models_folder, TFIDF_VECTORIZER)
+    if artifact is None:
+        return None
+    idf, header = artifact
+
+    params = dict(header['params'])
+    params['ngram_range'] = tuple(params['ngram_range'])
+    vectorizer = TfidfVectorizer(
+        tokenizer=StemmingTokenizer(header['stop_words']),
+        preprocessor=StemmingTokenizer.preprocess,
+        vocabulary={term: i for i, term in enumerate(header['vocabulary'])},
+        dtype=np.dtype(header['dtype_name']).type,
+        **params
+    )
+    vectorizer.idf_ = idf
+    return vectorizer
+
+
+class ClusterCenters:
+    """Nearest-centroid predictor with KMeans' predict and transform, rebuilt from its centers."""
+
+    def __init__(self, cluster_centers: np.ndarray):
+        self.cluster_centers_ = cluster_centers
+        self.n_clusters = cluster_centers.shape[0]
+
+    def transform(self, X) -> np.ndarray:
+        """Euclidean distance of every row of X to every center."""
+        return euclidean_distances(X, self.cluster_centers_)
+
+    def predict(self, X) -> np.ndarray:
+        """Index of the nearest center of every row of X."""
+        return self.transform(X).argmin(axis=1)
+
+
+def save_cluster_centers(models_folder: str, kmeans):
+    """Store the centers of a fitted k-means model."""
+    save_array_artifact(models_folder, TOPIC_CLUSTERS, kmeans.cluster_centers_, {
+        'n_clusters': int(kmeans.cluster_centers_.shape[0])
+    }, dtype='float64')
+
+
+def load_cluster_centers(models_folder: str) -> Optional[ClusterCenters]:
+    artifact = load_array_artifact(models_folder, TOPIC_CLUSTERS)
+    if artifact is None:
+        return None
+    return ClusterCenters(artifact[0])
+
+
+def category_source_hash(category_texts: List[str]) -> str:
+    """Identify the category descriptions that category embeddings were computed from."""
+    return hash_bytes('\n'.join(category_texts).encode('utf-8'))
@@ -0,0 +1,141 @@
+"""
+Output Sync
+Mirrors the blog/ tree into website/public/blogdata incrementally: unchanged
+files are left untouched, new or changed files are hard-linked (assets) or
+copied, and only files removed from the source are deleted. Keeps dev rebuilds
+from rewriting every image and waking up the dev server's file watchers.
+"""
+
+import filecmp
+import os
+import shutil
+from typing import Callable, Iterable, Optional, Set
+
+
+class SyncStats:
+    """Counts of what a sync run did."""
+
+    def __init__(self):
+        self.unchanged = 0
+        self.copied = 0
+        self.linked = 0
+        self.deleted = 0
+
+    def summary(self) -> str:
+        return (f"{self.copied} copied, {self.linked} linked, "
+                f"{self.unchanged} unchanged, {self.deleted} deleted")
+
+
+def _is_unchanged(src_path: str, dest_path: str) -> bool:
+    """Check whether dest_path already holds the contents of src_path."""
+    try:
+        dest_stat = os.stat(dest_path)
+    except FileNotFoundError:
+        return False
+    if not os.path.isfile(dest_path):
+        return False
+
+    src_stat = os.stat(src_path)
+    if (src_stat.st_dev, src_stat.st_ino) == (dest_stat.st_dev, dest_stat.st_ino):
+        # Hard link to the source
+        return True
+    if src_stat.st_size != dest_stat.st_size:
+        return False
+    if src_stat.st_mtime_ns == dest_stat.st_mtime_ns:
+        return True
+    # Same size but different mtime (e.g. after a fresh checkout): compare contents
+    if not filecmp.cmp(src_path, dest_path, shallow=False):
+        return False
+    # Carry the source mtime over so the next sync matches on the stat check alone
+    shutil.copystat(src_path, dest_path)
+    return True
+
+
+def _place_file(src_path: str, dest_path: str, link: bool) -> bool:
+    """Atomically put src_path at dest_path, returning True if it was hard-linked."""
+    if os.path.isdir(dest_path) and not os.path.islink(dest_path):
+        shutil.rmtree(dest_path)
+
+    tmp_path = dest_path + '.sync-tmp'
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+
+    linked = False
+    if link:
+        try:
+            os.link(src_path, tmp_path)
+            linked = True
+        except OSError:
+            # Cross-device or unsupported filesystem: fall back to copying
+            pass
+    if not linked:
+        shutil.copy2(src_path, tmp_path)
+    os.replace(tmp_path, dest_path)
+    return linked
+
+
+def sync_tree(src: str, dest: str,
+              ignore: Optional[Callable[[str, list], Set[str]]] = None,
+              preserve: Iterable[str] = (),
+              link_assets: bool = True,
+              copy_extensions: Iterable[str] = ('.md',)) -> SyncStats:
+    """Make dest mirror src, touching only files that differ.
+
+    ignore has the same signature as shutil.copytree's ignore argument.
+    preserve lists dest-relative paths of generated files (or folders, with
+    everything in them) that must survive even though they have no source
+    counterpart. Files with copy_extensions are
+    always copied; other files (images and other assets) are hard-linked when
+    link_assets is set and the filesystem allows it.
+    """
+    stats = SyncStats()
+    preserved = {os.path.normpath(path) for path in preserve}
+    preserved_prefixes = tuple(path + os.sep for path in preserved)
+    copy_extensions = tuple(ext.lower() for ext in copy_extensions)
+    expected = set()
+
+    for root, dirs, files in os.walk(src):
+        ignored = ignore(root, dirs + files) if ignore else set()
+        dirs[:] = sorted(d for d in dirs if d not in ignored)
+
+        rel_root = os.path.relpath(root, src)
+        dest_root = os.path.normpath(os.path.join(dest, rel_root))
+        if os.path.lexists(dest_root) and not os.path.isdir(dest_root):
+            os.remove(dest_root)
+        os.makedirs(dest_root, exist_ok=True)
+        expected.add(os.path.normpath(rel_root))
+
+        for file in sorted(files):
+            if file in ignored:
+                continue
+            rel_path = os.path.normpath(os.path.join(rel_root, file))
+            expected.add(rel_path)
+            src_path = os.path.join(root, file)
+            dest_path = os.path.join(dest, rel_path)
+
+            if _is_unchanged(src_path, dest_path):
+                stats.unchanged += 1
+                continue
+
+            link = link_assets and not file.lower().endswith(copy_extensions)
+            if _place_file(src_path, dest_path, link):
+                stats.linked += 1
+            else:
+                stats.copied += 1
+
+    # Delete only what disappeared from the source, deepest paths first
+    for root, dirs, files in os.walk(dest, topdown=False):
+        rel_root = os.path.relpath(root, dest)
+        for file in files:
+            rel_path = os.path.normpath(os.path.join(rel_root, file))
+            if (rel_path not in expected and rel_path not in preserved and
+                    not rel_path.startswith(preserved_prefixes)):
+                os.remove(os.path.join(root, file))
+                stats.deleted += 1
+        for d in dirs:
+            rel_path = os.path.normpath(os.path.join(rel_root, d))
+            dir_path = os.path.join(root, d)
+            if rel_path not in expected and rel_path not in preserved and not os.listdir(dir_path):
+                os.rmdir(dir_path)
+
+    return stats
@@ -0,0 +1,80 @@
+"""
+Post Loader
+Reads each blog post file once and parses its frontmatter from the in-memory
+text, exposing the raw bytes, the full text, the metadata and the body to
+every consumer (metadata generation, topic discovery and config generation).
+"""
+
+import os
+from typing import Any, Dict, Iterator, Tuple
+
+import frontmatter
+
+
+def decode_post_bytes(raw_content: bytes) -> str:
+    """Decode raw post bytes with the same newline translation as text-mode reads."""
+    return raw_content.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+class LoadedPost:
+    """A blog post read from disk exactly once."""
+
+    def __init__(self, file_path: str, raw_content: bytes):
+        self.file_path = file_path
+        self.raw_content = raw_content
+        self.text = decode_post_bytes(raw_content)
+        self.post = frontmatter.loads(self.text)
+
+    @classmethod
+    def from_parsed(cls, file_path: str, raw_content: bytes, metadata: Dict[str, Any], content: str) -> 'LoadedPost':
+        """Rebuild a post from previously parsed frontmatter without parsing again."""
+        loaded = cls.__new__(cls)
+        loaded.file_path = file_path
+        loaded.raw_content = raw_content
+        loaded.text = decode_post_bytes(raw_content)
+        loaded.post = frontmatter.Post(content)
+        loaded.post.metadata = metadata
+        return loaded
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self.post.metadata
+
+    @property
+    def content(self) -> str:
+        """Post body without frontmatter."""
+        return self.post.content
+
+    @property
+    def title(self) -> str:
+        return self.post.metadata.get('title', '')
+
+
+def load_post(file_path: str) -> LoadedPost:
+    """Read a post file once and parse its frontmatter."""
+    with open(file_path, 'rb') as f:
+        return LoadedPost(file_path, f.read())
+
+
+def iter_post_files(blog_folder: str) -> Iterator[Tuple[str, str]]:
+    """Yield (relative path, file path) for every markdown file in deterministic order."""
+    for root, dirs, files in os.walk(blog_folder):
+        dirs.sort()
+        for file in files:
+            if file.endswith('.md'):
+                file_path = os.path.join(root, file)
+                yield os.path.relpath(file_path, blog_folder), file_path
+
+
+def iter_posts(blog_folder: str) -> Iterator[Tuple[str, LoadedPost]]:
+    """Yield (relative path, post) for every markdown file in deterministic order.
+
+    Files that cannot be read or parsed are reported and skipped.
+    """
+    for path, file_path in iter_post_files(blog_folder):
+        try:
+            loaded = load_post(file_path)
+        except Exception as e:
+            print(f"Error processing {file_path}: {e}")
+            continue
+        yield path, loaded
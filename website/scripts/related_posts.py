@@ -0,0 +1,152 @@
+"""
+Related Posts
+Top-k most similar posts per post, by cosine similarity of document
+embeddings. Similarities are computed as blocked matrix products, so memory
+stays at one block of rows plus k neighbours per post. The result is persisted
+with a hash of every post's embedding; when posts change, only their rows, and
+the rows of posts that listed them as neighbours, are recomputed.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from topic_extraction_cache import hash_bytes
+
+RELATED_POSTS_VERSION = 1
+RELATED_POSTS_FILE_NAME = 'related_posts.json'
+DEFAULT_RELATED_COUNT = 5
+# Rows per similarity block: the block product holds block_size x corpus size scores
+DEFAULT_BLOCK_SIZE = 256
+
+
+def normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length so dot products are cosine similarities."""
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return embeddings / norms
+
+
+def _top_k(scores: np.ndarray, candidates: np.ndarray, k: int) -> List[Tuple[int, float]]:
+    """Return the k best (candidate, score) pairs, best first, ties to the lower candidate."""
+    if len(candidates) > k:
+        # Keep everything tied with the k-th score so tie-breaking stays deterministic
+        threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+        keep = scores >= threshold
+        scores, candidates = scores[keep], candidates[keep]
+    order = np.lexsort((candidates, -scores))[:k]
+    return [(int(candidates[i]), float(scores[i])) for i in order]
+
+
+def top_k_neighbors(embeddings: np.ndarray, k: int, rows: Optional[Sequence[int]] = None,
+                    block_size: int = DEFAULT_BLOCK_SIZE) -> Dict[int, List[Tuple[int, float]]]:
+    """Return row -> [(neighbour row, cosine similarity)] for the given rows (all by default).
+
+    embeddings must be row-normalized. A row is never its own neighbour.
+    """
+    n = embeddings.shape[0]
+    rows = list(range(n)) if rows is None else list(rows)
+    candidates = np.arange(n)
+    neighbors = {}
+    for start in range(0, len(rows), block_size):
+        block = rows[start:start + block_size]
+        similarities = embeddings[block] @ embeddings.T
+        for row, scores in zip(block, similarities):
+            others = candidates != row
+            neighbors[row] = _top_k(scores[others], candidates[others], k)
+    return neighbors
+
+
+class RelatedPostsIndex:
+    """Persisted related-post lists, updated incrementally as embeddings change."""
+
+    def __init__(self, models_folder: str, k: int = DEFAULT_RELATED_COUNT,
+                 block_size: int = DEFAULT_BLOCK_SIZE):
+        self.index_path = os.path.join(models_folder, RELATED_POSTS_FILE_NAME)
+        self.k = k
+        self.block_size = block_size
+        # path -> embedding hash, and path -> [(related path, score)]
+        self.hashes: Dict[str, str] = {}
+        self.related: Dict[str, List[Tuple[str, float]]] = {}
+        self.recomputed = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable related posts index {self.index_path}: {e}")
+            return
+        if data.get('version') != RELATED_POSTS_VERSION or data.get('k') != self.k:
+            return
+        for path, entry in data.get('posts', {}).items():
+            self.hashes[path] = entry['hash']
+            self.related[path] = [(related, score) for related, score in entry['related']]
+
+    def update(self, paths: Sequence[str], embeddings: np.ndarray):
+        """Bring the related lists up to date with the embeddings of the current posts.
+
+        The result is the same as recomputing every list from scratch.
+        """
+        order = sorted(range(len(paths)), key=lambda i: paths[i])
+        paths = [paths[i] for i in order]
+        embeddings = normalize_rows(np.asarray(embeddings)[order]) if len(paths) else np.zeros((0, 0))
+        hashes = {path: hash_bytes(embeddings[i].tobytes()) for i, path in enumerate(paths)}
+
+        changed = {path for path in paths if self.hashes.get(path) != hashes[path]}
+        removed = set(self.hashes) - set(hashes)
+        stale = changed | removed
+        # Lists that named a changed or removed post may need a neighbour from anywhere in the corpus
+        full_rows = [i for i, path in enumerate(paths)
+                     if path in changed or any(related in stale for related, _ in self.related.get(path, ()))]
+        recompute = set(full_rows)
+        merge_rows = [i for i in range(len(paths)) if i not in recompute] if changed else []
+
+        related = {path: self.related[path] for path in paths if path not in changed}
+        for row, neighbors in top_k_neighbors(embeddings, self.k, full_rows, self.block_size).items():
+            related[paths[row]] = [(paths[j], score) for j, score in neighbors]
+
+        if merge_rows:
+            # The other lists are still the best among unchanged posts; only changed posts can enter them
+            changed_rows = np.array([i for i, path in enumerate(paths) if path in changed])
+            row_index = {path: i for i, path in enumerate(paths)}
+            for start in range(0, len(merge_rows), self.block_size):
+                block = merge_rows[start:start + self.block_size]
+                similarities = embeddings[block] @ embeddings[changed_rows].T
+                for row, scores in zip(block, similarities):
+                    current = related[paths[row]]
+                    candidates = np.concatenate([[row_index[path] for path, _ in current], changed_rows])
+                    all_scores = np.concatenate([[score for _, score in current], scores])
+                    related[paths[row]] = [(paths[j], score)
+                                           for j, score in _top_k(all_scores, candidates.astype(int), self.k)]
+
+        self.recomputed = len(full_rows)
+        self.hashes = hashes
+        self.related = related
+
+    def get(self, path: str) -> List[Dict]:
+        """Return the related posts of a post as metadata entries."""
+        return [{'path': related, 'score': round(score, 4)} for related, score in self.related.get(path, [])]
+
+    def summary(self) -> str:
+        return f"{self.recomputed} of {len(self.related)} posts recomputed"
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': RELATED_POSTS_VERSION,
+                'k': self.k,
+                'posts': {
+                    path: {'hash': self.hashes[path], 'related': self.related[path]}
+                    for path in sorted(self.related)
+                }
+            }, f, separators=(',', ':'))
+        os.replace(tmp_path, self.index_path)
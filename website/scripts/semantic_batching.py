@@ -0,0 +1,91 @@
+"""
+Semantic Batching
+Batched operations on sentence-transformer embeddings that only need numpy
+and scikit-learn. The model is passed in as any object with an encode()
+method, so UnifiedTopicExtractor can use these helpers while they stay
+importable, and testable, without PyTorch.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+from sklearn.metrics.pairwise import cosine_similarity
+
+from keyword_embedding_cache import KeywordEmbeddingCache
+
+# Minimum cosine similarity for a keyword to join a category instead of 'general'
+KEYWORD_CATEGORY_THRESHOLD = 0.4
+
+
+def encode_length_sorted(model, texts: List[str], batch_size: int = 32) -> np.ndarray:
+    """Encode texts in batches of similar length, returning embeddings in input order."""
+    embeddings = None
+    # Similar-length batches keep padding (and wasted compute) to a minimum
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    for start in range(0, len(order), batch_size):
+        batch_indices = order[start:start + batch_size]
+        batch_embeddings = model.encode(
+            [texts[i] for i in batch_indices],
+            batch_size=batch_size,
+            convert_to_numpy=True
+        )
+        if embeddings is None:
+            embeddings = np.zeros((len(texts), batch_embeddings.shape[1]), dtype=batch_embeddings.dtype)
+        embeddings[batch_indices] = batch_embeddings
+    return embeddings if embeddings is not None else np.zeros((0, 0), dtype=np.float32)
+
+
+def categorize_keywords(model, keywords: List[str], category_embeddings: np.ndarray,
+                        category_names: List[str],
+                        keyword_cache: Optional[KeywordEmbeddingCache] = None) -> Dict[str, str]:
+    """Categorize many keywords with one batched encode and one similarity matrix.
+
+    Keywords with a cached category skip encoding, and only keywords whose
+    embeddings are not cached are encoded. Keywords stay 'general' when no
+    category is similar enough or encoding fails.
+    """
+    unique_keywords = list(dict.fromkeys(keywords))
+    categories = {keyword: 'general' for keyword in unique_keywords}
+
+    if not unique_keywords or category_embeddings.size == 0:
+        return categories
+
+    # Repeated vocabulary is categorized once and served from the keyword cache
+    pending_keywords = []
+    for keyword in unique_keywords:
+        cached_category = keyword_cache.get_category(keyword) if keyword_cache is not None else None
+        if cached_category is None:
+            pending_keywords.append(keyword)
+        else:
+            categories[keyword] = cached_category
+
+    if not pending_keywords:
+        return categories
+
+    try:
+        # Only encode keywords whose embeddings are not cached, all at once
+        if keyword_cache is not None:
+            cached_embeddings, missing_keywords = keyword_cache.get_embeddings(pending_keywords)
+        else:
+            cached_embeddings, missing_keywords = {}, pending_keywords
+        if missing_keywords:
+            new_embeddings = model.encode(missing_keywords, convert_to_numpy=True)
+            cached_embeddings.update(zip(missing_keywords, new_embeddings))
+        keyword_embeddings = np.array([cached_embeddings[keyword] for keyword in pending_keywords])
+
+        # Find most similar category for every keyword
+        similarities = cosine_similarity(keyword_embeddings, category_embeddings)
+        best_category_indices = np.argmax(similarities, axis=1)
+        best_similarities = similarities[np.arange(len(pending_keywords)), best_category_indices]
+
+        # Only assign to category if similarity is above threshold
+        for keyword, category_idx, similarity in zip(pending_keywords, best_category_indices, best_similarities):
+            if similarity > KEYWORD_CATEGORY_THRESHOLD:
+                categories[keyword] = category_names[category_idx]
+            if keyword_cache is not None:
+                keyword_cache.put(keyword, cached_embeddings[keyword], categories[keyword])
+
+    except Exception:
+        pass
+
+    return categories
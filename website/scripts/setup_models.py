@@ -336,14 +336,26 @@ class ModelSetupHelper:
         # Count markdown files
         md_files = list(blog_path.rglob('*.md'))
         
+        # Parse the corpus into the snapshot shared with later pipeline stages
+        try:
+            from corpus_snapshot import load_corpus_snapshot
+            snapshot = load_corpus_snapshot(str(blog_path), str(self.models_dir))
+        except ImportError as e:
+            logger.debug(f"Corpus snapshot unavailable, reading posts directly: {e}")
+            snapshot = None
+        
         # Count published posts (basic check)
         published_count = 0
         for md_file in md_files:
             try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if 'published: true' in content:
-                        published_count += 1
+                loaded = snapshot.get(os.path.relpath(md_file, blog_path)) if snapshot else None
+                if loaded is not None:
+                    content = loaded.text
+                else:
+                    with open(md_file, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                if 'published: true' in content:
+                    published_count += 1
             except Exception:
                 continue
         
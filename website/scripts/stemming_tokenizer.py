@@ -0,0 +1,217 @@
+"""
+Stemming Tokenizer
+Picklable tokenizer used as the TfidfVectorizer tokenizer hook. Preprocessed
+(alnum-only) text skips NLTK's sentence and punctuation passes, tokens are
+filtered without regexes, and Porter stems are memoized in a word -> stem
+table that is persisted between runs. TokenCache keeps the token lists of
+documents by content hash so unchanged text is never tokenized twice.
+"""
+
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Union
+
+import nltk
+from nltk.stem import PorterStemmer
+from nltk.tokenize import NLTKWordTokenizer, word_tokenize
+
+from topic_extraction_cache import hash_bytes
+
+STEM_TABLE_VERSION = 1
+STEM_TABLE_FILE_NAME = 'stem_table.json'
+TOKEN_CACHE_FILE_NAME = 'token_cache.json'
+CORPUS_TOKENS_FILE_NAME = 'corpus_tokens.json'
+
+
+def _is_preprocessed(text: str) -> bool:
+    """Check whether text holds only ASCII letters, digits and spaces."""
+    letters = text.replace(' ', '')
+    return not letters or (letters.isascii() and letters.isalnum())
+
+
+def split_words(text: str) -> List[str]:
+    """Split text into words exactly like nltk.word_tokenize.
+
+    Text without punctuation only needs the contraction rules ('cannot',
+    'gonna', ...) of NLTK's word tokenizer, so it is split directly.
+    """
+    if not _is_preprocessed(text):
+        return word_tokenize(text)
+
+    text = f" {text} "
+    for regexp in NLTKWordTokenizer.CONTRACTIONS2:
+        text = regexp.sub(r" \1 \2 ", text)
+    for regexp in NLTKWordTokenizer.CONTRACTIONS3:
+        text = regexp.sub(r" \1 \2 ", text)
+    return text.split()
+
+
+class StemmingTokenizer:
+    """Tokenize, drop stop words and short/non-alphanumeric tokens, then stem.
+
+    Instances are callable so they can be passed as a vectorizer tokenizer.
+    Pre-tokenized documents (lists of stems from an earlier call) are returned
+    unchanged, which lets a corpus be tokenized once and reused.
+    """
+
+    def __init__(self, stop_words: Iterable[str], stem_table_path: Optional[str] = None):
+        self.stop_words = set(stop_words)
+        self.stem_table_path = stem_table_path
+        self.stemmer = PorterStemmer()
+        self.stems: Dict[str, str] = self._load_stem_table()
+        self._new_stems = 0
+
+    def _fingerprint(self) -> str:
+        return f"{STEM_TABLE_VERSION}:{nltk.__version__}:{self.stemmer.mode}"
+
+    def fingerprint(self) -> str:
+        """Identify everything that determines this tokenizer's output for a given text."""
+        stop_words = '\n'.join(sorted(self.stop_words)).encode('utf-8')
+        return f"{self._fingerprint()}:{hash_bytes(stop_words)}"
+
+    def _load_stem_table(self) -> Dict[str, str]:
+        if not self.stem_table_path:
+            return {}
+        try:
+            with open(self.stem_table_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable stem table {self.stem_table_path}: {e}")
+            return {}
+        if data.get('fingerprint') != self._fingerprint():
+            return {}
+        return data.get('stems', {})
+
+    def save(self):
+        """Persist the stem table if new words were stemmed since it was loaded."""
+        if not self.stem_table_path or not self._new_stems:
+            return
+        os.makedirs(os.path.dirname(self.stem_table_path), exist_ok=True)
+        tmp_path = self.stem_table_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': self._fingerprint(), 'stems': self.stems}, f, sort_keys=True)
+        os.replace(tmp_path, self.stem_table_path)
+        self._new_stems = 0
+
+    def stem(self, word: str) -> str:
+        stem = self.stems.get(word)
+        if stem is None:
+            stem = self.stemmer.stem(word)
+            self.stems[word] = stem
+            self._new_stems += 1
+        return stem
+
+    def tokenize(self, text: str) -> List[str]:
+        """Tokenize text and apply stemming."""
+        stop_words = self.stop_words
+        filtered_tokens = []
+        for token in split_words(text):
+            token = token.lower()
+            if (len(token) > 2 and
+                    token not in stop_words and
+                    token.isascii() and token.isalnum() and
+                    not token.isdigit()):
+                filtered_tokens.append(self.stem(token))
+        return filtered_tokens
+
+    def __call__(self, document: Union[str, List[str]]) -> List[str]:
+        if isinstance(document, list):
+            return document
+        return self.tokenize(document)
+
+    @staticmethod
+    def preprocess(document: Union[str, List[str]]) -> Union[str, List[str]]:
+        """Vectorizer preprocessor: lowercase text, pass pre-tokenized documents through."""
+        if isinstance(document, list):
+            return document
+        return document.lower()
+
+    def __getstate__(self):
+        # Pickled with the vectorizer: keep the filter, not the run's stem table
+        return {'stop_words': self.stop_words}
+
+    def __setstate__(self, state):
+        self.__init__(state['stop_words'])
+
+
+class TokenCache:
+    """Persistent token lists of documents, keyed by the hash of their text."""
+
+    def __init__(self, models_folder: str, tokenizer: StemmingTokenizer,
+                 file_name: str = TOKEN_CACHE_FILE_NAME):
+        self.cache_path = os.path.join(models_folder, file_name)
+        self.tokenizer = tokenizer
+        self.fingerprint = tokenizer.fingerprint()
+        self.entries = self._load()
+        self.used_keys = set()
+        # Keys created or used since the last take_updates call
+        self._new_keys = set()
+        self._unreported_keys = set()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, List[str]]:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable token cache {self.cache_path}: {e}")
+            return {}
+        if data.get('fingerprint') != self.fingerprint:
+            return {}
+        return data.get('entries', {})
+
+    def get(self, text: str) -> List[str]:
+        """Return the tokens of text as the vectorizer would compute them."""
+        text = StemmingTokenizer.preprocess(text)
+        key = hash_bytes(text.encode('utf-8'))
+        tokens = self.entries.get(key)
+        if tokens is None:
+            tokens = self.tokenizer.tokenize(text)
+            self.entries[key] = tokens
+            self._new_keys.add(key)
+            self._dirty = True
+        self.used_keys.add(key)
+        self._unreported_keys.add(key)
+        return tokens
+
+    def take_updates(self) -> Dict:
+        """Return the entries created and keys used since the last call, e.g. in a worker process."""
+        updates = {
+            'entries': {key: self.entries[key] for key in self._new_keys},
+            'used_keys': self._unreported_keys
+        }
+        self._new_keys = set()
+        self._unreported_keys = set()
+        return updates
+
+    def merge_updates(self, updates: Dict):
+        """Add entries and used keys taken from another instance of this cache."""
+        for key, tokens in updates['entries'].items():
+            if key not in self.entries:
+                self.entries[key] = tokens
+                self._dirty = True
+        self.used_keys.update(updates['used_keys'])
+
+    def save(self, prune: bool = True):
+        """Persist the cache, optionally dropping entries not used in this run."""
+        if prune:
+            stale_keys = set(self.entries) - self.used_keys
+            for key in stale_keys:
+                del self.entries[key]
+            if stale_keys:
+                self._dirty = True
+
+        if not self._dirty:
+            return
+
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': self.fingerprint, 'entries': self.entries},
+                      f, sort_keys=True, separators=(',', ':'))
+        os.replace(tmp_path, self.cache_path)
+        self._dirty = False
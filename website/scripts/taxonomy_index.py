@@ -0,0 +1,69 @@
+"""
+Taxonomy Index
+Inverted indexes from every taxonomy the site lists posts by (tags,
+categories, authors, post formats, primary topic, year and month) to the
+paths of the posts in it, with display names and counts. Built in one pass
+over the generated metadata so taxonomy pages can look a term up directly
+instead of grouping the whole post list in the browser.
+"""
+
+from typing import Dict, List, Optional
+
+TAXONOMY_INDEX_VERSION = 1
+
+# Metadata fields holding lists of {'name', 'url-slug'} terms
+SLUG_LIST_FIELDS = ['tags', 'categories', 'authors']
+
+
+def _add(groups: Dict[str, Dict], key: str, name: str, path: str):
+    group = groups.get(key)
+    if group is None:
+        group = groups[key] = {'name': name, 'count': 0, 'posts': []}
+    group['posts'].append(path)
+    group['count'] += 1
+
+
+def _published_on(post: Dict) -> Optional[str]:
+    """Return the 'YYYY-MM' prefix of the first publication date."""
+    published = post.get('first-published-on')
+    if published is None:
+        return None
+    if hasattr(published, 'strftime'):
+        return published.strftime('%Y-%m')
+    return str(published)[:7]
+
+
+def build_taxonomy_index(posts: List[Dict]) -> Dict:
+    """Map every taxonomy term to the paths of its posts, in the order posts are given.
+
+    A post is listed once per term even if the term appears twice in its metadata.
+    """
+    index = {name: {} for name in SLUG_LIST_FIELDS + ['post-formats', 'topics', 'years', 'months']}
+
+    for post in posts:
+        path = post['path']
+        for field in SLUG_LIST_FIELDS:
+            seen = set()
+            for term in post.get(field) or []:
+                slug = term.get('url-slug') if isinstance(term, dict) else None
+                if slug and slug not in seen:
+                    seen.add(slug)
+                    _add(index[field], slug, term.get('name', slug), path)
+
+        post_format = post.get('post-format')
+        if isinstance(post_format, dict) and post_format.get('url-slug'):
+            _add(index['post-formats'], post_format['url-slug'], post_format.get('name', ''), path)
+
+        topic = post.get('topic-primary')
+        if topic:
+            _add(index['topics'], topic, topic, path)
+
+        published_on = _published_on(post)
+        if published_on:
+            year, month = published_on.split('-')
+            _add(index['years'], year, year, path)
+            _add(index['months'], f"{year}/{month}", f"{year}/{month}", path)
+
+    index['version'] = TAXONOMY_INDEX_VERSION
+    index['postCount'] = len(posts)
+    return index
@@ -0,0 +1,1223 @@
+"""
+Tests for the metadata generation pipeline performance features.
+Covers caching and incremental processing without requiring ML libraries.
+"""
+
+import os
+import sys
+import json
+import shutil
+import subprocess
+import tempfile
+import time
+
+# Add the scripts directory to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Wall-clock budget for a --skip-topics run over a one-post blog, interpreter start-up included
+SKIP_TOPICS_STARTUP_BUDGET_SECONDS = 1.5
+# Modules that only topic discovery and extraction may import
+HEAVY_MODULES = ['numpy', 'scipy', 'sklearn', 'nltk', 'torch', 'sentence_transformers']
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def _write_post(blog_folder, slug, title, day, tags, body, series=None):
+    """Write a published post with the frontmatter create_blog_metadata expects."""
+    lines = ['---', 'published: true', 'tags:'] + [f' - {tag}' for tag in tags] + [
+        'categories:', ' - Technology', 'authors:', ' - "A B"', 'post-format: standard',
+        f'title: {title}', f'url-slug: {slug}',
+        f'first-published-on: 2024-01-{day:02d} 10:00', f'last-updated-on: 2024-02-{day:02d} 10:00'
+    ]
+    if series:
+        lines += ['series:', f' slug: {series}']
+    lines += [f'excerpt: "{title}."', '---', '', body, '']
+    _write(os.path.join(blog_folder, '2024', '01', f'{day:02d}', slug, 'readme.md'), '\n'.join(lines))
+
+
+def _write_sample_blog(root):
+    """Write a small blog of four posts, two of them in a series, under root/blog."""
+    blog_folder = os.path.join(root, 'blog')
+    _write(os.path.join(blog_folder, 'metadata', 'series-definitions.yaml'),
+           'streaming:\n  name: "Streaming"\n  description: "Stream processing"\n')
+    _write_post(blog_folder, 'kafka-basics', 'Kafka Basics', 3, ['Kafka', 'Data Engineering'],
+                'Kafka stores streams of records in partitioned topics.', series='streaming')
+    _write_post(blog_folder, 'flink-windows', 'Flink Windows', 9, ['Flink', 'Data Engineering'],
+                'Flink groups unbounded streams into event-time windows.', series='streaming')
+    _write_post(blog_folder, 'team-rituals', 'Team Rituals', 14, ['Leadership'],
+                'Weekly one-on-ones and retrospectives keep a team aligned.')
+    _write_post(blog_folder, 'vector-search', 'Vector Search', 21, ['Machine Learning', 'Search'],
+                'Embeddings turn documents into vectors for nearest-neighbour search.')
+    return blog_folder
+
+
+def _generate_metadata(root, incremental_mode=None, **kwargs):
+    """Run create_posts_list over root/blog as the scripts do from the repository root.
+
+    With incremental_mode, metadata of posts unchanged since the last run in
+    that mode is reused. Returns the generated files by name, and the number
+    of reused posts.
+    """
+    import create_blog_metadata
+
+    cwd = os.getcwd()
+    os.chdir(root)
+    try:
+        files = create_blog_metadata.find_files()
+        previous_posts = None
+        if incremental_mode:
+            previous_posts = create_blog_metadata.load_incremental_state(files, incremental_mode)
+        create_blog_metadata.create_posts_list(files, run_topic_discovery=False, previous_posts=previous_posts,
+                                               **kwargs)
+        outputs = {}
+        for path in [create_blog_metadata.POSTS_LIST_FILE_JSON, create_blog_metadata.SERIES_LIST_FILE_JSON,
+                     create_blog_metadata.TAXONOMY_INDEX_FILE_JSON,
+                     os.path.join(create_blog_metadata.METADATA_SHARDS_FOLDER, 'manifest.json')]:
+            with open(path, 'rb') as f:
+                outputs[os.path.basename(path)] = f.read()
+    finally:
+        os.chdir(cwd)
+    return outputs, len(previous_posts or {})
+
+
+def _write_topic_models(config_folder):
+    """Train a tiny TF-IDF vectorizer and clustering model and store them as topic model artifacts."""
+    from sklearn.cluster import KMeans
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from model_artifacts import save_cluster_centers, save_tfidf_vectorizer
+    from stemming_tokenizer import StemmingTokenizer
+
+    models_folder = os.path.join(config_folder, 'topic_models')
+    _write(os.path.join(config_folder, 'topic-extraction-data.json'),
+           json.dumps({'topicCategories': {}, 'technicalEntities': {}, 'stopWords': []}))
+    documents = ["stream data pipelines", "train learning models", "stream processing engines",
+                 "learning rate of models", "data pipelines and models"]
+    vectorizer = TfidfVectorizer(tokenizer=StemmingTokenizer({'of', 'and'}),
+                                 preprocessor=StemmingTokenizer.preprocess)
+    features = vectorizer.fit_transform(documents)
+    save_tfidf_vectorizer(models_folder, vectorizer)
+    save_cluster_centers(models_folder, KMeans(n_clusters=2, random_state=42, n_init=10).fit(features))
+    return models_folder
+
+
+def test_topic_extraction_cache():
+    """Test that the extraction cache is keyed by content and config fingerprint."""
+    print("Testing topic extraction cache...")
+
+    from topic_extraction_cache import TopicExtractionCache
+
+    with tempfile.TemporaryDirectory() as tmp:
+        models_folder = os.path.join(tmp, 'topic_models')
+        config_path = os.path.join(tmp, 'topic-extraction-data.json')
+        _write(config_path, json.dumps({'topicCategories': {'data': ['kafka']}}))
+
+        cache = TopicExtractionCache(models_folder, config_path, 'test-model')
+        assert cache.peek(b'post one') is None
+        cache.put(b'post one', {'topic-primary': 'data', 'topic-confidence': 0.5})
+        cache.save()
+
+        # Same content and fingerprint reuses the stored result
+        cache = TopicExtractionCache(models_folder, config_path, 'test-model')
+        assert cache.peek(b'post one') == {'topic-primary': 'data', 'topic-confidence': 0.5}
+        assert cache.peek(b'post one edited') is None
+        print("✓ Unchanged content is served from cache")
+
+        # A different model invalidates every entry
+        cache = TopicExtractionCache(models_folder, config_path, 'other-model')
+        assert cache.peek(b'post one') is None
+        print("✓ Model change invalidates cache")
+
+        # A config change invalidates every entry
+        _write(config_path, json.dumps({'topicCategories': {'data': ['kafka', 'spark']}}))
+        cache = TopicExtractionCache(models_folder, config_path, 'test-model')
+        assert cache.peek(b'post one') is None
+        print("✓ Config change invalidates cache")
+
+    return True
+
+
+def test_fallback_topics_not_cached():
+    """Test that only results of the tier the extraction cache was built for are stored."""
+    print("Testing fallback results stay out of the extraction cache...")
+
+    import create_blog_metadata
+    import enhanced_topic_extraction
+    from topic_extraction_cache import TopicExtractionCache
+
+    class StubTransformer:
+        def __init__(self, error=None):
+            self.error = error
+
+        def extract_topics_unified(self, content, title=''):
+            if self.error:
+                raise self.error
+            return {'topic-primary': title.lower(), 'classification-method': 'transformer'}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_sample_blog(tmp)
+        config_folder = os.path.join(tmp, 'config')
+        models_folder = _write_topic_models(config_folder)
+        config_path = os.path.join(config_folder, 'topic-extraction-data.json')
+
+        def run(transformer):
+            topic_cache = TopicExtractionCache(models_folder, config_path, 'model-a')
+            patched = {
+                'transformer_extraction_available': lambda: True,
+                'get_transformer_extractor': lambda *args, **kwargs: transformer,
+                'create_topic_extraction_cache': lambda: topic_cache,
+                'attach_related_posts': lambda posts, loaded_posts: None,
+            }
+            originals = {name: getattr(create_blog_metadata, name) for name in patched}
+            get_shared_extractor = enhanced_topic_extraction.get_shared_extractor
+            for name, value in patched.items():
+                setattr(create_blog_metadata, name, value)
+            # The enhanced fallback reads the test config instead of the repository's
+            enhanced_topic_extraction.get_shared_extractor = lambda folder: get_shared_extractor(config_folder)
+            try:
+                _generate_metadata(tmp)
+            finally:
+                for name, value in originals.items():
+                    setattr(create_blog_metadata, name, value)
+                enhanced_topic_extraction.get_shared_extractor = get_shared_extractor
+                enhanced_topic_extraction.clear_shared_extractors()
+            return topic_cache
+
+        topic_cache = run(StubTransformer(RuntimeError("model crashed")))
+        assert topic_cache.entries == {} and not os.path.exists(topic_cache.cache_path)
+        print("✓ Posts that fell back after a transformer failure are not cached")
+
+        topic_cache = run(StubTransformer())
+        assert len(topic_cache.entries) == 4
+        assert {entry['extraction-method'] for entry in topic_cache.entries.values()} == {'unified-transformer'}
+        print("✓ Transformer results are cached")
+
+    return True
+
+
+def test_metadata_manifest_diff():
+    """Test that the manifest detects added, modified, deleted and touched posts."""
+    print("Testing metadata manifest diff...")
+
+    from metadata_manifest import MetadataManifest
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = {}
+        for name in ['a', 'b', 'c']:
+            files[f'{name}/readme.md'] = os.path.join(tmp, 'blog', name, 'readme.md')
+            _write(files[f'{name}/readme.md'], f'post {name}')
+        output_path = os.path.join(tmp, 'blog_metadata.json')
+        _write(output_path, '[]')
+
+        manifest_path = os.path.join(tmp, 'manifest.json')
+        manifest = MetadataManifest(manifest_path, 'fingerprint')
+        manifest.update(files, output_path)
+        manifest.save()
+
+        assert MetadataManifest.load(manifest_path, 'other-fingerprint') is None
+        manifest = MetadataManifest.load(manifest_path, 'fingerprint')
+        assert manifest.output_matches(output_path)
+
+        # Modify one post, touch another without changing it, delete and add posts
+        _write(files['a/readme.md'], 'post a edited')
+        os.utime(files['b/readme.md'], ns=(0, 0))
+        del files['c/readme.md']
+        files['d/readme.md'] = os.path.join(tmp, 'blog', 'd', 'readme.md')
+        _write(files['d/readme.md'], 'post d')
+
+        diff = manifest.diff(files)
+        assert diff.added == ['d/readme.md']
+        assert diff.modified == ['a/readme.md']
+        assert diff.deleted == ['c/readme.md']
+        assert diff.unchanged == ['b/readme.md']
+        print(f"✓ Manifest diff: {diff.summary()}")
+
+        _write(output_path, '[{}]')
+        assert not manifest.output_matches(output_path)
+        print("✓ Out-of-band metadata changes are detected")
+
+    return True
+
+
+def test_incremental_generation():
+    """Test that an incremental run after edits and deletions matches a full rebuild."""
+    print("Testing incremental metadata generation...")
+
+    for mode, options in [('minimal', {'skip_per_post_extraction': True}),
+                          ('cached-topics', {'use_cached_topics': True})]:
+        with tempfile.TemporaryDirectory() as tmp:
+            blog_folder = _write_sample_blog(tmp)
+            _generate_metadata(tmp, **options)
+
+            # Edit one post and delete another
+            _write_post(blog_folder, 'kafka-basics', 'Kafka Basics Revisited', 3, ['Kafka', 'Streaming'],
+                        'Kafka keeps partitioned, replicated logs of records.', series='streaming')
+            shutil.rmtree(os.path.join(blog_folder, '2024', '01', '14'))
+
+            incremental, reused = _generate_metadata(tmp, incremental_mode=mode, **options)
+            assert reused == 2, mode
+            shutil.rmtree(os.path.join(tmp, 'website'))
+            full, _ = _generate_metadata(tmp, **options)
+            assert incremental == full, mode
+        print(f"✓ {mode}: incremental run reused 2 posts and matches a full rebuild")
+
+    return True
+
+
+def test_shared_enhanced_extractor():
+    """Test that the enhanced extractor is loaded once and shared."""
+    print("Testing shared enhanced extractor...")
+
+    from enhanced_topic_extraction import get_shared_extractor, clear_shared_extractors
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    config_folder = os.path.join(os.path.dirname(script_dir), 'config')
+
+    clear_shared_extractors()
+    try:
+        extractor = get_shared_extractor(config_folder)
+    except LookupError:
+        print("  NLTK stopwords not installed - skipping shared extractor check")
+        return True
+
+    assert get_shared_extractor(config_folder) is extractor
+    assert 'total' in extractor.load_metrics
+    print(f"✓ Extractor shared across calls (loaded in {extractor.load_metrics['total'] * 1000:.1f}ms)")
+
+    clear_shared_extractors()
+    assert get_shared_extractor(config_folder) is not extractor
+    print("✓ Clearing the registry reloads artifacts")
+
+    return True
+
+
+class _StubEncoder:
+    """Sentence model stand-in: encodes text from a fixed table and records every encode call."""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.calls = []
+
+    def encode(self, texts, **kwargs):
+        import numpy as np
+        self.calls.append(list(texts))
+        return np.array([self.vectors[text] for text in texts], dtype=np.float32)
+
+
+def test_keyword_categorization():
+    """Test that keywords are categorized with one batched encode per post."""
+    print("Testing batched keyword categorization...")
+
+    import numpy as np
+    from keyword_embedding_cache import KeywordEmbeddingCache
+    from semantic_batching import categorize_keywords
+
+    category_embeddings = np.array([[1.0, 0.0], [0.0, 1.0]])
+    category_names = ['data-engineering', 'leadership']
+    model = _StubEncoder({'kafka': [0.9, 0.1], 'mentoring': [0.2, 0.8], 'thing': [-1.0, -1.0]})
+
+    categories = categorize_keywords(model, ['kafka', 'mentoring', 'kafka', 'thing'],
+                                     category_embeddings, category_names)
+    assert categories == {'kafka': 'data-engineering', 'mentoring': 'leadership', 'thing': 'general'}
+    assert model.calls == [['kafka', 'mentoring', 'thing']]
+    print("✓ Unique keywords encoded in a single call")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        category_path = os.path.join(tmp, 'category_embeddings.json')
+        _write(category_path, 'categories')
+        cache = KeywordEmbeddingCache(tmp, 'model-a', category_path)
+        model.calls.clear()
+        first = categorize_keywords(model, ['kafka', 'thing'], category_embeddings, category_names, cache)
+        second = categorize_keywords(model, ['kafka', 'thing', 'mentoring'], category_embeddings, category_names, cache)
+        assert first == {'kafka': 'data-engineering', 'thing': 'general'}
+        assert second['mentoring'] == 'leadership' and second['kafka'] == 'data-engineering'
+        # Cached categories skip encoding; only the new keyword is encoded
+        assert model.calls == [['kafka', 'thing'], ['mentoring']]
+    print("✓ Cached keyword categories are not encoded again")
+
+    # A failing model leaves every keyword in 'general'
+    assert categorize_keywords(_StubEncoder({}), ['kafka'], category_embeddings, category_names) == {'kafka': 'general'}
+
+    return True
+
+
+def test_keyword_embedding_cache():
+    """Test LRU eviction, persistence and invalidation of keyword embeddings."""
+    print("Testing keyword embedding cache...")
+
+    import numpy as np
+    from keyword_embedding_cache import KeywordEmbeddingCache
+
+    with tempfile.TemporaryDirectory() as tmp:
+        models_folder = os.path.join(tmp, 'topic_models')
+        category_path = os.path.join(models_folder, 'category_embeddings.json')
+        _write(category_path, 'categories v1')
+
+        cache = KeywordEmbeddingCache(models_folder, 'test-model', category_path, max_entries=2)
+        cache.put('kafka', np.array([1.0, 0.0]), 'data-engineering')
+        cache.put('spark', np.array([0.0, 1.0]), 'data-engineering')
+        assert cache.get_category('kafka') == 'data-engineering'
+        cache.put('react', np.array([0.5, 0.5]), 'general')
+
+        # 'spark' was least recently used and is evicted
+        found, missing = cache.get_embeddings(['kafka', 'spark', 'react'])
+        assert missing == ['spark']
+        assert np.allclose(found['react'], [0.5, 0.5])
+        print("✓ Least recently used keyword evicted")
+
+        cache.save()
+        cache = KeywordEmbeddingCache(models_folder, 'test-model', category_path, max_entries=2)
+        assert len(cache) == 2
+        assert cache.get_category('react') == 'general'
+        found, missing = cache.get_embeddings(['kafka'])
+        assert not missing and np.allclose(found['kafka'], [1.0, 0.0])
+        print("✓ Embeddings and categories persisted")
+
+        assert len(KeywordEmbeddingCache(models_folder, 'other-model', category_path)) == 0
+        _write(category_path, 'categories v2')
+        assert len(KeywordEmbeddingCache(models_folder, 'test-model', category_path)) == 0
+        print("✓ Model or category embedding change invalidates cache")
+
+    return True
+
+
+def test_batched_inference():
+    """Test length-sorted batch encoding and which posts batched extraction covers."""
+    print("Testing batched inference...")
+
+    import create_blog_metadata
+    from post_loader import load_post
+    from semantic_batching import encode_length_sorted
+    from topic_extraction_cache import TopicExtractionCache
+
+    texts = ['ccc', 'a', 'bbbb', 'dd']
+    model = _StubEncoder({text: [len(text), 0.0] for text in texts})
+    embeddings = encode_length_sorted(model, texts, batch_size=2)
+    # Batches group texts of similar length; embeddings come back in input order
+    assert model.calls == [['a', 'dd'], ['ccc', 'bbbb']]
+    assert embeddings[:, 0].tolist() == [3.0, 1.0, 4.0, 2.0]
+    assert encode_length_sorted(model, [], batch_size=2).shape == (0, 0)
+    print("✓ Texts encoded in length-sorted batches, returned in input order")
+
+    class StubExtractor:
+        def __init__(self):
+            self.documents = []
+
+        def extract_topics_batch(self, documents, batch_size=32):
+            self.documents.extend(documents)
+            return [{'topic-primary': title.lower()} for _, title in documents]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        blog_folder = _write_sample_blog(tmp)
+        files = {}
+        for root, _, names in os.walk(blog_folder):
+            for name in names:
+                if name == 'readme.md':
+                    files[os.path.relpath(root, blog_folder)] = os.path.join(root, name)
+        loaded_posts = {path: load_post(file_path) for path, file_path in sorted(files.items())}
+        loaded_posts['2024/01/14/team-rituals'].metadata['published'] = False
+
+        config_path = os.path.join(tmp, 'topic-extraction-data.json')
+        _write(config_path, '{}')
+        topic_cache = TopicExtractionCache(tmp, config_path, 'model-a')
+        topic_cache.put(loaded_posts['2024/01/21/vector-search'].raw_content, {'topic-primary': 'search'})
+
+        extractor = StubExtractor()
+        previous_extractor = create_blog_metadata._TRANSFORMER_EXTRACTOR
+        create_blog_metadata._TRANSFORMER_EXTRACTOR = extractor
+        try:
+            batched = create_blog_metadata.extract_topics_batched(loaded_posts, topic_cache, batch_size=2)
+        finally:
+            create_blog_metadata._TRANSFORMER_EXTRACTOR = previous_extractor
+
+    # Unpublished posts and posts served from the topic cache are left out of the batch
+    assert [title for _, title in extractor.documents] == ['Kafka Basics', 'Flink Windows']
+    assert batched == {
+        '2024/01/03/kafka-basics': {'topic-primary': 'kafka basics', 'extraction-method': 'unified-transformer'},
+        '2024/01/09/flink-windows': {'topic-primary': 'flink windows', 'extraction-method': 'unified-transformer'}
+    }
+    print("✓ Only uncached published posts are batched, results keyed by post path")
+
+    return True
+
+
+def test_parallel_processing():
+    """Test that --workers output is byte-identical to a serial run."""
+    print("Testing parallel post processing...")
+
+    for mode, options in [('minimal', {'skip_per_post_extraction': True}),
+                          ('cached-topics', {'use_cached_topics': True})]:
+        with tempfile.TemporaryDirectory() as tmp:
+            _write_sample_blog(tmp)
+            serial, _ = _generate_metadata(tmp, workers=1, **options)
+            shutil.rmtree(os.path.join(tmp, 'website'))
+            parallel, _ = _generate_metadata(tmp, workers=2, **options)
+            assert parallel == serial, mode
+        print(f"✓ {mode}: 2 workers match a serial run")
+
+    return True
+
+
+def test_worker_cache_updates():
+    """Test that cache entries created in worker processes are merged and saved by the parent."""
+    print("Testing worker cache updates...")
+
+    import pickle
+    import numpy as np
+    from document_embedding_store import CLASSIFICATION, DocumentEmbeddingStore
+    from enhanced_topic_extraction import (clear_shared_extractors, get_shared_extractor,
+                                           merge_shared_extractor_cache_updates, save_shared_extractor_caches,
+                                           take_shared_extractor_cache_updates)
+    from keyword_embedding_cache import KeywordEmbeddingCache
+    from stemming_tokenizer import TOKEN_CACHE_FILE_NAME
+
+    def ship(updates):
+        # Updates cross the process boundary pickled, like pool results
+        return pickle.loads(pickle.dumps(updates))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_folder = os.path.join(tmp, 'config')
+        models_folder = _write_topic_models(config_folder)
+
+        clear_shared_extractors()
+        try:
+            worker = get_shared_extractor(config_folder)
+        except LookupError:
+            print("  NLTK stopwords not installed - skipping shared extractor check")
+            worker = None
+        if worker is not None:
+            worker.classify_topic_dynamic("Streams of data flow through pipelines", "Streaming")
+            updates = ship(take_shared_extractor_cache_updates())
+            # A fresh registry stands in for the parent, whose extractor never saw the post
+            clear_shared_extractors()
+            merge_shared_extractor_cache_updates(updates)
+            save_shared_extractor_caches(prune=True)
+            clear_shared_extractors()
+            with open(os.path.join(models_folder, TOKEN_CACHE_FILE_NAME), encoding='utf-8') as f:
+                assert len(json.load(f)['entries']) == 1
+            print("✓ Token lists from workers saved by the parent")
+
+        def encode(texts):
+            return np.array([[len(text), 1.0] for text in texts])
+
+        parent_store = DocumentEmbeddingStore(models_folder, 'model-a')
+        worker_store = DocumentEmbeddingStore(models_folder, 'model-a')
+        worker_store.embed(CLASSIFICATION, ["post one", "post two"], encode)
+        parent_store.merge_updates(ship(worker_store.take_updates()))
+        assert worker_store.take_updates() == {'entries': {}, 'used_keys': set()}
+        parent_store.save()
+        assert len(DocumentEmbeddingStore(models_folder, 'model-a')) == 2
+
+        category_path = os.path.join(models_folder, 'category_embeddings.json')
+        _write(category_path, 'categories')
+        parent_cache = KeywordEmbeddingCache(models_folder, 'model-a', category_path)
+        worker_cache = KeywordEmbeddingCache(models_folder, 'model-a', category_path)
+        worker_cache.put('kafka', np.array([1.0, 0.0]), 'data-engineering')
+        parent_cache.merge_updates(ship(worker_cache.take_updates()))
+        parent_cache.save()
+        assert KeywordEmbeddingCache(models_folder, 'model-a', category_path).get_category('kafka') == 'data-engineering'
+        print("✓ Document and keyword embeddings from workers saved by the parent")
+
+    return True
+
+
+def test_post_loader():
+    """Test that single-read loading matches frontmatter.load."""
+    print("Testing post loader...")
+
+    import frontmatter
+    from post_loader import load_post, iter_posts
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = os.path.join(tmp, 'blog', 'post', 'readme.md')
+        os.makedirs(os.path.dirname(file_path))
+        with open(file_path, 'wb') as f:
+            f.write(b'---\r\ntitle: Post\r\npublished: true\r\n---\r\nBody \xc3\xa9\r\n')
+
+        loaded = load_post(file_path)
+        expected = frontmatter.load(file_path)
+        assert loaded.metadata == expected.metadata
+        assert loaded.content == expected.content
+        with open(file_path, 'r', encoding='utf-8') as f:
+            assert loaded.text == f.read()
+        assert loaded.raw_content.startswith(b'---\r\n')
+        print("✓ Metadata, body and text match separate reads")
+
+        paths = [path for path, _ in iter_posts(os.path.join(tmp, 'blog'))]
+        assert paths == [os.path.join('post', 'readme.md')]
+        print("✓ Posts iterated with relative paths")
+
+    return True
+
+
+def test_corpus_snapshot():
+    """Test that the corpus snapshot is shared and only re-parses changed posts."""
+    print("Testing corpus snapshot...")
+
+    import corpus_snapshot
+    from corpus_snapshot import load_corpus_snapshot
+
+    with tempfile.TemporaryDirectory() as tmp:
+        blog_folder = os.path.join(tmp, 'blog')
+        models_folder = os.path.join(tmp, 'topic_models')
+        for name in ['a', 'b']:
+            _write(os.path.join(blog_folder, name, 'readme.md'), f'---\ntitle: {name}\npublished: true\n---\nPost {name}\n')
+
+        snapshot = load_corpus_snapshot(blog_folder, models_folder)
+        assert len(snapshot) == 2
+        post = snapshot.get(os.path.join('a', 'readme.md'))
+        assert post.metadata == {'title': 'a', 'published': True}
+        assert post.content == 'Post a'
+
+        # Callers get copies they can modify freely
+        post.metadata['title'] = 'changed'
+        assert snapshot.get(os.path.join('a', 'readme.md')).title == 'a'
+        assert load_corpus_snapshot(blog_folder, models_folder) is snapshot
+        print("✓ Snapshot shared within the process")
+
+        # A new process reads the serialized snapshot and re-parses only changed files
+        corpus_snapshot._LOADED_SNAPSHOTS.clear()
+        _write(os.path.join(blog_folder, 'b', 'readme.md'), '---\ntitle: b2\npublished: true\n---\nEdited\n')
+        snapshot = load_corpus_snapshot(blog_folder, models_folder)
+        assert [path for path, _ in snapshot.iter_posts()] == [os.path.join('a', 'readme.md'), os.path.join('b', 'readme.md')]
+        assert snapshot.get(os.path.join('b', 'readme.md')).title == 'b2'
+        print("✓ Changed posts re-parsed from serialized snapshot")
+
+    return True
+
+
+def test_output_sync():
+    """Test that syncing output rewrites only changed files and keeps generated ones."""
+    print("Testing output sync...")
+
+    import shutil
+    from output_sync import sync_tree
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, 'blog')
+        dest = os.path.join(tmp, 'blogdata')
+        _write(os.path.join(src, 'a', 'readme.md'), 'post a')
+        _write(os.path.join(src, 'a', 'image.png'), 'image bytes')
+        _write(os.path.join(src, 'b', 'readme.md'), 'post b')
+        _write(os.path.join(src, 'drafts', 'draft.md'), 'draft')
+        ignore = shutil.ignore_patterns('drafts')
+
+        stats = sync_tree(src, dest, ignore=ignore)
+        assert stats.copied + stats.linked == 3
+        assert not os.path.exists(os.path.join(dest, 'drafts'))
+        _write(os.path.join(dest, 'metadata', 'blog_metadata.json'), '[]')
+        _write(os.path.join(dest, 'metadata', 'shards', 'page-1.abc.json'), '[]')
+        preserve = [os.path.join('metadata', 'blog_metadata.json'), os.path.join('metadata', 'shards')]
+        print(f"✓ Initial sync: {stats.summary()}")
+
+        # Nothing changed: no file is rewritten
+        image_stat = os.stat(os.path.join(dest, 'a', 'image.png'))
+        stats = sync_tree(src, dest, ignore=ignore, preserve=preserve)
+        assert stats.unchanged == 3 and stats.copied == stats.linked == stats.deleted == 0
+        assert os.stat(os.path.join(dest, 'a', 'image.png')).st_mtime_ns == image_stat.st_mtime_ns
+        print("✓ Unchanged files left untouched")
+
+        # Same contents with a different mtime are compared once, then matched by stat
+        dest_readme = os.path.join(dest, 'b', 'readme.md')
+        os.utime(dest_readme, ns=(0, 0))
+        stats = sync_tree(src, dest, ignore=ignore, preserve=preserve)
+        assert stats.unchanged == 3 and stats.copied == 0
+        src_readme = os.path.join(src, 'b', 'readme.md')
+        assert os.stat(dest_readme).st_mtime_ns == os.stat(src_readme).st_mtime_ns
+        print("✓ Content matches adopt the source mtime")
+
+        # Edit one post, remove another
+        _write(os.path.join(src, 'a', 'readme.md'), 'post a edited')
+        shutil.rmtree(os.path.join(src, 'b'))
+        stats = sync_tree(src, dest, ignore=ignore, preserve=preserve)
+        assert stats.copied == 1 and stats.deleted == 1
+        with open(os.path.join(dest, 'a', 'readme.md'), encoding='utf-8') as f:
+            assert f.read() == 'post a edited'
+        assert not os.path.exists(os.path.join(dest, 'b'))
+        assert os.path.exists(os.path.join(dest, 'metadata', 'blog_metadata.json'))
+        assert os.path.exists(os.path.join(dest, 'metadata', 'shards', 'page-1.abc.json'))
+        print("✓ Only changed files copied and removed files deleted")
+
+    return True
+
+
+def test_keyword_automaton():
+    """Test that the automaton counts keywords exactly like str.count."""
+    print("Testing keyword automaton...")
+
+    import text_matching
+    from text_matching import KeywordAutomaton
+
+    text = 'data engineering with kafka: kafka streams, database and metadata. aaaa'
+    patterns = ['data', 'kafka', 'data engineering', 'aa', 'ka', 'missing', '']
+    automaton = KeywordAutomaton(patterns + ['data'])
+    assert automaton.patterns == patterns
+
+    expected = [text.count(pattern) for pattern in patterns]
+    assert automaton.count(text) == expected
+
+    # Force the single-pass scan that large vocabularies use
+    original_limit = text_matching.DIRECT_COUNT_MAX_PATTERNS
+    text_matching.DIRECT_COUNT_MAX_PATTERNS = 0
+    try:
+        assert automaton.count(text) == expected
+        assert automaton.count('') == [''.count(pattern) for pattern in patterns]
+    finally:
+        text_matching.DIRECT_COUNT_MAX_PATTERNS = original_limit
+    print(f"✓ Non-overlapping counts match str.count: {expected}")
+
+    return True
+
+
+def test_category_index():
+    """Test that the category index keeps first-category-wins semantics."""
+    print("Testing category index...")
+
+    from text_matching import CategoryIndex
+
+    topic_categories = {
+        'data': ['Kafka', 'data engineering'],
+        'ai': ['machine learning', 'AI'],
+        'cloud': ['aws', 'kafka streams'],
+        'empty': []
+    }
+
+    def scan(keyword):
+        # Reference implementation: the original per-term scan
+        for category, terms in topic_categories.items():
+            if any(keyword in term.lower() or term.lower() in keyword for term in terms):
+                return category
+        return 'general'
+
+    index = CategoryIndex(topic_categories)
+    for keyword in ['kafka', 'streams', 'engineer', 'kafkaesque', 'learning', 'mail',
+                    'awsome', 'rust', 'a', '', 'Kafka']:
+        assert index.categorize(keyword) == scan(keyword), keyword
+    assert index.categorize('streams') == 'cloud'
+    assert index.categorize('mail') == 'ai'
+    assert index.categorize('rust') == 'general'
+    print("✓ Categories match the per-term scan")
+
+    return True
+
+
+def test_entity_matcher():
+    """Test whole-word entity matching, counts and ordering."""
+    print("Testing entity matcher...")
+
+    from text_matching import EntityMatcher
+
+    matcher = EntityMatcher({
+        'technologies': ['Git', 'node.js', 'spring', 'c++'],
+        'frameworks': ['spring boot', 'git']
+    })
+    text = "Spring Boot on Node.js; spring again. GitHub is not git, but C++ is. spring"
+
+    assert matcher.count(text) == {'spring': 3, 'spring boot': 1, 'node.js': 1, 'git': 1, 'c++': 1}
+    assert matcher.match(text) == [('spring', 3), ('Git', 1), ('node.js', 1), ('c++', 1), ('spring boot', 1)]
+    assert matcher.match("gitflow and springs") == []
+    print("✓ Whole-word matches counted and ranked deterministically")
+
+    matcher = EntityMatcher({'ai': ['agents', 'Artificial Intelligence'], 'tools': ['Kafka']})
+    text = "Agents use Artificial Intelligence. Agents call kafka. Agents plan with Flink Streams and Flink Streams."
+    assert matcher.extract(text, stop_words=['with']) == ['agents', 'Artificial Intelligence', 'Kafka', 'Flink Streams']
+    assert matcher.extract(text, limit=2) == ['agents', 'Artificial Intelligence']
+    print("✓ Proper nouns that repeat a matched entity in another case are dropped")
+
+    return True
+
+
+def test_text_normalizer():
+    """Test the shared markdown normalizer variants and memoization."""
+    print("Testing text normalizer...")
+
+    from text_normalizer import normalize_text
+
+    text = "---\ntitle: T\n---\n# Intro\n\nSome **bold** <b>HTML</b> and [a link](http://x.io).\n\n```\ncode here\n```\n- Item `x`\n"
+    normalized = normalize_text(text)
+    assert normalize_text(text) is normalized
+
+    assert normalized.plain == "Intro Some bold HTML and a link. code here Item x"
+    assert normalized.word_count == 11
+    assert normalized.cleaned == "intro some bold html and a link. - item"
+    assert normalized.alnum == "Intro Some bold HTML and a link Item"
+    assert normalized.alnum_lower == "intro some bold html and a link item"
+    print(f"✓ Variants computed once per text ({normalized.word_count} words)")
+
+    return True
+
+
+def test_stemming_tokenizer():
+    """Test the cached stemming tokenizer and its persisted stem table."""
+    print("Testing stemming tokenizer...")
+
+    import pickle
+    from stemming_tokenizer import StemmingTokenizer, split_words
+
+    assert split_words("we cannot stop streaming") == ['we', 'can', 'not', 'stop', 'streaming']
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        table_path = os.path.join(temp_dir, 'topic_models', 'stem_table.json')
+        tokenizer = StemmingTokenizer({'the', 'with'}, table_path)
+        tokens = tokenizer("The pipelines with streaming data 2024 ab")
+        assert tokens == ['pipelin', 'stream', 'data']
+        assert tokenizer(tokens) is tokens
+        tokenizer.save()
+
+        reloaded = StemmingTokenizer({'the', 'with'}, table_path)
+        assert reloaded.stems['streaming'] == 'stream'
+
+        # Pickled with a vectorizer, the tokenizer keeps its filter but not the table
+        restored = pickle.loads(pickle.dumps(tokenizer))
+        assert restored.stems == {} and restored("the streaming") == ['stream']
+    print(f"✓ Stems persisted and reused: {tokens}")
+
+    return True
+
+
+def test_token_cache():
+    """Test that token lists are persisted by content hash and invalidated with the tokenizer."""
+    print("Testing token cache...")
+
+    from stemming_tokenizer import StemmingTokenizer, TokenCache
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        models_folder = os.path.join(temp_dir, 'topic_models')
+        cache = TokenCache(models_folder, StemmingTokenizer({'the'}))
+        tokens = cache.get("The Streaming Pipelines")
+        assert tokens == ['stream', 'pipelin']
+        cache.save()
+
+        class CountingTokenizer(StemmingTokenizer):
+            calls = 0
+
+            def tokenize(self, text):
+                CountingTokenizer.calls += 1
+                return super().tokenize(text)
+
+        reloaded = TokenCache(models_folder, CountingTokenizer({'the'}))
+        assert reloaded.get("the streaming pipelines") == tokens
+        assert CountingTokenizer.calls == 0
+
+        # Different stop words tokenize differently, so the cache starts over
+        assert TokenCache(models_folder, StemmingTokenizer(set())).entries == {}
+    print("✓ Token lists reused across runs without re-tokenizing")
+
+    return True
+
+
+def test_shared_cluster_prediction():
+    """Test that dynamic keywords and classification share one TF-IDF prediction per post."""
+    print("Testing shared cluster prediction...")
+
+    from enhanced_topic_extraction import EnhancedTopicExtractor
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_folder = os.path.join(tmp, 'config')
+        _write_topic_models(config_folder)
+        try:
+            extractor = EnhancedTopicExtractor(config_folder)
+        except LookupError:
+            print("  NLTK stopwords not installed - skipping shared prediction check")
+            return True
+
+        transformed = []
+        transform = extractor.vectorizer.transform
+
+        def counting_transform(documents):
+            transformed.append(documents)
+            return transform(documents)
+
+        extractor.vectorizer.transform = counting_transform
+        content, title = "Stream processing engines run data pipelines", "Streaming"
+        extractor.extract_keywords_dynamic(content, title)
+        label, _, details = extractor.classify_topic_dynamic(content, title)
+        assert len(transformed) == 1
+        # Cached token lists reach the vectorizer instead of raw text
+        assert isinstance(transformed[0][0], list)
+
+        # The shared prediction is the one the models give for the post
+        text = extractor.preprocess_text(f"{title} {title} {content}")
+        expected = int(extractor.clustering_model.predict(transform([text]))[0])
+        assert details['cluster_id'] == expected and label == f'cluster-{expected}'
+        print("✓ One TF-IDF transform shared by keywords and classification")
+
+        extractor.classify_topic_dynamic("Learning rate of models", "Training")
+        assert len(transformed) == 2
+        print("✓ A different post is predicted again")
+
+    return True
+
+
+def test_cluster_selection():
+    """Test that the shared-distance k sweep matches a plain sequential sweep."""
+    print("Testing cluster selection...")
+
+    import numpy as np
+    from sklearn.cluster import KMeans
+    from sklearn.metrics import silhouette_score
+    from cluster_selection import select_k
+
+    rng = np.random.RandomState(0)
+    centers = rng.uniform(-10, 10, size=(4, 5))
+    features = np.vstack([center + rng.normal(size=(15, 5)) for center in centers])
+
+    expected = {}
+    for k in range(2, 8):
+        labels = KMeans(n_clusters=k, random_state=42, n_init=10).fit_predict(features)
+        expected[k] = silhouette_score(features, labels)
+
+    for workers in (1, 2):
+        best_k, best_score, scores = select_k(features, range(2, 8), default_k=5, workers=workers)
+        assert best_k == max(expected, key=expected.get) == 4
+        assert all(abs(scores[k] - expected[k]) < 1e-9 for k in expected)
+    print(f"✓ Chose k={best_k} with shared distances, in-process and in parallel")
+
+    import cluster_selection
+    from cluster_selection import ClusterSelectionCache, select_k_cached
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ClusterSelectionCache(os.path.join(temp_dir, 'topic_models'))
+        first = select_k_cached(cache, features, range(2, 8), default_k=5, workers=1)
+
+        # An unchanged matrix must not be swept again
+        original_select_k = cluster_selection.select_k
+        cluster_selection.select_k = None
+        try:
+            assert select_k_cached(cache, features.copy(), range(2, 8), default_k=5, workers=2) == first
+        finally:
+            cluster_selection.select_k = original_select_k
+
+        changed = select_k_cached(cache, features[:-1], range(2, 8), default_k=5, workers=1)
+        assert changed[2] != first[2]
+    print("✓ Sweep results reused for unchanged features")
+
+    return True
+
+
+def test_document_embedding_store():
+    """Test that document embeddings are reused until the text or model changes."""
+    print("Testing document embedding store...")
+
+    import numpy as np
+    from document_embedding_store import CLASSIFICATION, DISCOVERY, DocumentEmbeddingStore
+
+    encoded = []
+
+    def encode(texts):
+        encoded.extend(texts)
+        return np.array([[len(text), 1.0] for text in texts])
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = DocumentEmbeddingStore(temp_dir, 'model-a')
+        first = store.embed(DISCOVERY, ["one", "three"], encode, keys=['a.md', 'b.md'])
+        assert first.tolist() == [[3.0, 1.0], [5.0, 1.0]]
+        store.save()
+
+        reloaded = DocumentEmbeddingStore(temp_dir, 'model-a')
+        encoded.clear()
+        second = reloaded.embed(DISCOVERY, ["one", "three!"], encode, keys=['a.md', 'b.md'])
+        # Only the edited post is encoded again, in a single batch
+        assert encoded == ["three!"]
+        assert second.tolist() == [[3.0, 1.0], [6.0, 1.0]]
+        assert dict(reloaded.iter_vectors(DISCOVERY))['b.md'].tolist() == [6.0, 1.0]
+
+        # Content-keyed entries of an edited post are pruned; untouched namespaces are kept
+        reloaded.embed(CLASSIFICATION, ["post one", "post two"], encode)
+        reloaded.save()
+        store = DocumentEmbeddingStore(temp_dir, 'model-a')
+        store.embed(CLASSIFICATION, ["post one", "post two edited"], encode)
+        store.save()
+        store = DocumentEmbeddingStore(temp_dir, 'model-a')
+        assert len(list(store.iter_vectors(CLASSIFICATION))) == 2
+        assert sorted(dict(store.iter_vectors(DISCOVERY))) == ['a.md', 'b.md']
+        store.embed(CLASSIFICATION, ["post three"], encode)
+        store.save(prune=False)
+        assert len(DocumentEmbeddingStore(temp_dir, 'model-a')) == 5
+
+        # A different model starts from an empty store
+        assert len(DocumentEmbeddingStore(temp_dir, 'model-b')) == 0
+    print("✓ Document embeddings reused across runs for unchanged posts, stale ones pruned")
+
+    return True
+
+
+def test_related_posts():
+    """Test that incremental related-post updates match a full recomputation."""
+    print("Testing related posts...")
+
+    import numpy as np
+    from related_posts import RelatedPostsIndex, normalize_rows, top_k_neighbors
+
+    rng = np.random.RandomState(0)
+    paths = [f"post-{i:02d}.md" for i in range(40)]
+    embeddings = rng.randn(40, 8)
+
+    def expected(paths, embeddings):
+        neighbors = top_k_neighbors(normalize_rows(embeddings), 3, block_size=7)
+        return {path: [paths[j] for j, _ in neighbors[i]] for i, path in enumerate(paths)}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        index = RelatedPostsIndex(temp_dir, k=3, block_size=7)
+        index.update(paths, embeddings)
+        index.save()
+        assert all(path not in [related for related, _ in index.related[path]] for path in paths)
+
+        # Edit one post and delete another, then update from the saved index
+        embeddings = embeddings.copy()
+        embeddings[5] = embeddings[6] + 0.01
+        paths, embeddings = paths[:-1], embeddings[:-1]
+        reloaded = RelatedPostsIndex(temp_dir, k=3, block_size=7)
+        reloaded.update(paths, embeddings)
+        assert reloaded.recomputed < len(paths)
+        assert {path: [related for related, _ in reloaded.related[path]] for path in paths} == \
+            expected(paths, embeddings)
+        assert reloaded.get('post-06.md')[0]['path'] == 'post-05.md'
+    print("✓ Only affected posts recomputed, with the same result as a full pass")
+
+    return True
+
+
+def test_json_output():
+    """Test that streamed JSON lists match json.dumps and failed writes keep the old file."""
+    print("Testing JSON output...")
+
+    from datetime import datetime
+    from json_output import write_json_list
+
+    def serialize(obj):
+        return obj.isoformat()
+
+    items = [{'title': 'Caf\u00e9', 'date': datetime(2024, 1, 2), 'tags': ['a', 'b']}, {'b': 1, 'a': None}]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'metadata', 'posts.json')
+        for value in (items, []):
+            assert write_json_list(path, iter(value), default=serialize) == len(value)
+            with open(path, 'rb') as f:
+                expected = json.dumps(value, default=serialize, sort_keys=True, separators=(',', ':'))
+                assert f.read() == expected.encode('utf-8')
+
+        def failing():
+            yield items[0]
+            raise RuntimeError("interrupted")
+
+        try:
+            write_json_list(path, failing(), default=serialize)
+            assert False, "expected the write to fail"
+        except RuntimeError:
+            pass
+        with open(path, 'r', encoding='utf-8') as f:
+            assert json.load(f) == []
+        assert os.listdir(os.path.dirname(path)) == ['posts.json']
+    print("✓ Streamed output is byte-identical and interrupted writes leave no partial file")
+
+    return True
+
+
+def test_metadata_shards():
+    """Test that shards are content-addressed and only changed shards are rewritten."""
+    print("Testing metadata shards...")
+
+    from datetime import datetime
+    from metadata_shards import SHARD_MANIFEST_FILE_NAME, write_metadata_shards
+
+    def post(i, tag, year):
+        return {
+            'path': f"{year}/post-{i}/readme.md", 'title': f"Post {i}", 'url-slug': f"post-{i}", 'excerpt': '',
+            'first-published-on': datetime(year, 1, i + 1), 'topic-primary': 'general',
+            'tags': [{'name': tag, 'url-slug': tag.lower()}], 'categories': [{'name': 'Tech', 'url-slug': 'tech'}]
+        }
+
+    def serialize(obj):
+        return obj.isoformat()
+
+    posts = [post(i, 'AI' if i % 2 else 'Data', 2024 if i < 3 else 2023) for i in range(5)]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        stats = write_metadata_shards(posts, temp_dir, default=serialize, page_size=2)
+        with open(os.path.join(temp_dir, SHARD_MANIFEST_FILE_NAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        assert [page['count'] for page in manifest['pages']] == [2, 2, 1]
+        assert sorted(manifest['tags']) == ['ai', 'data'] and manifest['tags']['ai']['count'] == 2
+        assert manifest['years']['2023']['count'] == 2 and manifest['categories']['tech']['count'] == 5
+        with open(os.path.join(temp_dir, manifest['index']['file']), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        assert index[0] == {'path': '2024/post-0/readme.md', 'title': 'Post 0', 'url-slug': 'post-0',
+                            'excerpt': '', 'first-published-on': '2024-01-01T00:00:00'}
+        assert stats.written == 1 + 3 + 2 + 1 + 2
+
+        # Retitle the last post: only the shards containing it change names
+        posts[4]['title'] = 'Post 4 (updated)'
+        stats = write_metadata_shards(posts, temp_dir, default=serialize, page_size=2)
+        assert (stats.written, stats.removed) == (5, 5)
+        assert len(os.listdir(temp_dir)) == stats.written + stats.unchanged + 1
+    print("✓ Unchanged shards keep their names and stale shards are removed")
+
+    return True
+
+
+def test_taxonomy_index():
+    """Test that taxonomy terms map to their posts with counts, once per post."""
+    print("Testing taxonomy index...")
+
+    from datetime import datetime
+    from taxonomy_index import build_taxonomy_index
+
+    ai = {'name': 'AI', 'url-slug': 'ai'}
+    posts = [
+        {'path': 'b.md', 'tags': [ai, ai], 'categories': [{'name': 'Tech', 'url-slug': 'tech'}],
+         'authors': [{'name': 'A B', 'url-slug': 'a-b'}], 'post-format': {'name': 'link', 'url-slug': 'link'},
+         'topic-primary': 'machine-learning', 'first-published-on': datetime(2024, 3, 9)},
+        {'path': 'a.md', 'tags': [ai, {'name': 'Data', 'url-slug': 'data'}], 'categories': [],
+         'authors': [{'name': 'A B', 'url-slug': 'a-b'}], 'topic-primary': 'general',
+         'first-published-on': '2023-11-02T00:00:00'},
+    ]
+    index = build_taxonomy_index(posts)
+    assert index['tags']['ai'] == {'name': 'AI', 'count': 2, 'posts': ['b.md', 'a.md']}
+    assert index['tags']['data']['posts'] == ['a.md']
+    assert index['categories'] == {'tech': {'name': 'Tech', 'count': 1, 'posts': ['b.md']}}
+    assert index['authors']['a-b']['count'] == 2
+    assert index['post-formats']['link']['posts'] == ['b.md']
+    assert sorted(index['topics']) == ['general', 'machine-learning']
+    assert sorted(index['years']) == ['2023', '2024']
+    assert index['months']['2024/03']['posts'] == ['b.md'] and index['postCount'] == 2
+    print("✓ Terms indexed in post order with counts")
+
+    return True
+
+
+def test_model_artifacts():
+    """Test that model artifacts round-trip, validate and reproduce the fitted models."""
+    print("Testing model artifacts...")
+
+    import numpy as np
+    from sklearn.cluster import KMeans
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from model_artifacts import (artifact_paths, load_array_artifact, load_cluster_centers, load_tfidf_vectorizer,
+                                 save_array_artifact, save_cluster_centers, save_tfidf_vectorizer)
+    from stemming_tokenizer import StemmingTokenizer
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        embeddings = np.arange(6, dtype=np.float32).reshape(2, 3)
+        save_array_artifact(temp_dir, 'categories', embeddings, {'model': 'model-a', 'categories': ['a', 'b']})
+        matrix, header = load_array_artifact(temp_dir, 'categories', expected={'model': 'model-a'})
+        assert isinstance(matrix, np.memmap) and np.array_equal(matrix, embeddings)
+        assert header['categories'] == ['a', 'b'] and header['shape'] == [2, 3]
+        assert load_array_artifact(temp_dir, 'categories', expected={'model': 'model-b'}) is None
+
+        # A matrix that no longer matches its header checksum is rejected
+        np.save(artifact_paths(temp_dir, 'categories')[0], embeddings * 2)
+        assert load_array_artifact(temp_dir, 'categories') is None
+
+        documents = ["stream data pipelines", "train learning models", "stream processing engines",
+                     "learning rate of models", "data pipelines and models"]
+        vectorizer = TfidfVectorizer(ngram_range=(1, 2), tokenizer=StemmingTokenizer({'of', 'and'}),
+                                     preprocessor=StemmingTokenizer.preprocess)
+        features = vectorizer.fit_transform(documents)
+        kmeans = KMeans(n_clusters=2, random_state=42, n_init=10).fit(features)
+        save_tfidf_vectorizer(temp_dir, vectorizer)
+        save_cluster_centers(temp_dir, kmeans)
+
+        query = ["Streaming data into learning models"]
+        restored = load_tfidf_vectorizer(temp_dir)
+        assert (restored.transform(query) != vectorizer.transform(query)).nnz == 0
+        clusters = load_cluster_centers(temp_dir)
+        assert np.array_equal(clusters.transform(features), kmeans.transform(features))
+        assert np.array_equal(clusters.predict(features), kmeans.predict(features))
+    print("✓ Artifacts validated by checksum and reproduce the vectorizer and clusters")
+
+    return True
+
+
+def test_skip_topics_startup():
+    """Test that a --skip-topics run imports no ML libraries and stays within its time budget."""
+    print("Testing --skip-topics start-up...")
+
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'create_blog_metadata.py')
+    with tempfile.TemporaryDirectory() as tmp:
+        _write(os.path.join(tmp, 'blog', '2024', '01', '02', 'hello', 'readme.md'),
+               "---\npublished: true\ntags: [Python]\ncategories: [Tech]\nauthors: [A B]\n"
+               "post-format: standard\ntitle: Hello\nurl-slug: hello\nfirst-published-on: 2024-01-02\n"
+               "last-updated-on: 2024-01-03 10:00\nexcerpt: Hello.\n---\nHello world.\n")
+
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-X', 'importtime', script, '--skip-topics'],
+                                cwd=tmp, capture_output=True, text=True)
+        elapsed = time.perf_counter() - start
+        assert result.returncode == 0, result.stdout + result.stderr
+
+        # -X importtime lists every imported module on stderr as "... | <indent><name>"
+        imported = {line.rsplit('|', 1)[1].strip().split('.')[0]
+                    for line in result.stderr.splitlines() if line.startswith('import time:')}
+        assert not imported & set(HEAVY_MODULES), sorted(imported & set(HEAVY_MODULES))
+        with open(os.path.join(tmp, 'website', 'public', 'blogdata', 'metadata', 'blog_metadata.json')) as f:
+            assert [post['title'] for post in json.load(f)] == ['Hello']
+        assert elapsed < SKIP_TOPICS_STARTUP_BUDGET_SECONDS, f"{elapsed:.2f}s"
+    print(f"✓ Metadata generated in {elapsed:.2f}s without importing ML libraries")
+
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("Metadata Pipeline Tests")
+    print("=" * 40)
+
+    tests = [
+        ("Topic Extraction Cache", test_topic_extraction_cache),
+        ("Fallback Topics Not Cached", test_fallback_topics_not_cached),
+        ("Metadata Manifest Diff", test_metadata_manifest_diff),
+        ("Incremental Generation", test_incremental_generation),
+        ("Shared Enhanced Extractor", test_shared_enhanced_extractor),
+        ("Keyword Categorization", test_keyword_categorization),
+        ("Keyword Embedding Cache", test_keyword_embedding_cache),
+        ("Batched Inference", test_batched_inference),
+        ("Parallel Processing", test_parallel_processing),
+        ("Worker Cache Updates", test_worker_cache_updates),
+        ("Post Loader", test_post_loader),
+        ("Corpus Snapshot", test_corpus_snapshot),
+        ("Output Sync", test_output_sync),
+        ("Keyword Automaton", test_keyword_automaton),
+        ("Category Index", test_category_index),
+        ("Entity Matcher", test_entity_matcher),
+        ("Text Normalizer", test_text_normalizer),
+        ("Stemming Tokenizer", test_stemming_tokenizer),
+        ("Token Cache", test_token_cache),
+        ("Shared Cluster Prediction", test_shared_cluster_prediction),
+        ("Cluster Selection", test_cluster_selection),
+        ("Document Embedding Store", test_document_embedding_store),
+        ("Related Posts", test_related_posts),
+        ("JSON Output", test_json_output),
+        ("Metadata Shards", test_metadata_shards),
+        ("Taxonomy Index", test_taxonomy_index),
+        ("Model Artifacts", test_model_artifacts),
+        ("Skip-Topics Start-up", test_skip_topics_startup),
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n{test_name}:")
+        print("-" * len(test_name))
+
+        try:
+            if test_func():
+                passed += 1
+                print(f"✓ {test_name} PASSED")
+            else:
+                print(f"✗ {test_name} FAILED")
+        except Exception as e:
+            print(f"✗ {test_name} ERROR: {e}")
+
+    print("\n" + "=" * 40)
+    print(f"Test Results: {passed}/{total} tests passed")
+
+    return passed == total
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -53,6 +53,12 @@ def test_transformer_extraction():
         print(f"✓ Related Concepts: {', '.join(result['related-concepts'][:5])}")
         print(f"✓ Keyword Count: {result['keyword-count']} (transformer: {result['transformer-keywords']})")
         
+        # Corpus-wide batched inference should classify the same way
+        batch_results = extractor.extract_topics_batch([(sample_content, sample_title), ('', 'Empty Post')], batch_size=2)
+        assert len(batch_results) == 2
+        assert batch_results[0]['topic-primary'] == result['topic-primary']
+        print(f"✓ Batched extraction agrees: {batch_results[0]['topic-primary']}")
+        
         return True
         
     except ImportError as e:
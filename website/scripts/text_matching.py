@@ -0,0 +1,230 @@
+"""
+Text Matching
+Multi-pattern substring matching compiled once and reused for every post.
+KeywordAutomaton is an Aho-Corasick automaton that finds all keyword
+occurrences in a single pass over the text, so matching cost depends on the
+text length rather than on the number of keywords. CategoryIndex builds on it
+to categorize keywords against topicCategories without scanning every term,
+and EntityMatcher finds whole-word technical entities in one tokenized pass.
+"""
+
+import re
+from collections import Counter, deque
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+_WORD_PATTERN = re.compile(r'\w+')
+# Capitalized words and runs of them, taken as potential proper nouns
+_PROPER_NOUN_PATTERN = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+
+# Up to this many patterns, one C-level str.count per pattern beats a Python-level scan
+DIRECT_COUNT_MAX_PATTERNS = 100
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over a fixed set of patterns.
+
+    Patterns are matched exactly as given; callers normalize case beforehand.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        # Deduplicate while keeping first-seen order; pattern ids index this list
+        self.patterns: List[str] = list(dict.fromkeys(patterns))
+        self.pattern_ids: Dict[str, int] = {pattern: i for i, pattern in enumerate(self.patterns)}
+        self._build()
+
+    def _build(self):
+        """Build the trie, then resolve failure links into a full transition table."""
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for pattern_id, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(pattern_id)
+
+        # Breadth-first: each state inherits the transitions and outputs of its failure state
+        fail = [0] * len(goto)
+        transitions: List[Dict[str, int]] = [dict(goto[0])] + [None] * (len(goto) - 1)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            transitions[state] = dict(transitions[fail[state]])
+            transitions[state].update(goto[state])
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            for char, next_state in goto[state].items():
+                fail[next_state] = transitions[fail[state]].get(char, 0)
+                queue.append(next_state)
+
+        self._transitions = transitions
+        self._outputs = [tuple(output) for output in outputs]
+        self._lengths = [len(pattern) for pattern in self.patterns]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield (start, pattern id) for every occurrence, overlapping ones included, by end position."""
+        transitions = self._transitions
+        outputs = self._outputs
+        lengths = self._lengths
+        state = 0
+        for end, char in enumerate(text, 1):
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                for pattern_id in outputs[state]:
+                    yield end - lengths[pattern_id], pattern_id
+
+    def count(self, text: str) -> List[int]:
+        """Count non-overlapping occurrences of every pattern, like str.count."""
+        if len(self.patterns) <= DIRECT_COUNT_MAX_PATTERNS:
+            return [text.count(pattern) for pattern in self.patterns]
+
+        counts = [0] * len(self.patterns)
+        next_allowed = [0] * len(self.patterns)
+        for start, pattern_id in self.iter_matches(text):
+            # Matches of one pattern arrive in order; keep the leftmost non-overlapping ones
+            if start >= next_allowed[pattern_id]:
+                counts[pattern_id] += 1
+                next_allowed[pattern_id] = start + self._lengths[pattern_id]
+        for pattern_id, length in enumerate(self._lengths):
+            if length == 0:
+                counts[pattern_id] = len(text) + 1
+        return counts
+
+
+class CategoryIndex:
+    """Keyword to category lookup compiled once from topicCategories.
+
+    A keyword belongs to the first category (in config order) with a term that
+    contains the keyword or is contained in it, compared against the lowercased
+    term; keywords matching nothing are 'general'. Substrings of terms answer
+    "keyword in term", an automaton over the terms answers "term in keyword",
+    and results are memoized per keyword.
+    """
+
+    def __init__(self, topic_categories: Mapping[str, Iterable[str]], default: str = 'general'):
+        self.categories: List[str] = list(topic_categories)
+        self.default = default
+
+        # Lowest category rank of every term and of every substring of a term
+        term_ranks: Dict[str, int] = {}
+        self._substring_ranks: Dict[str, int] = {}
+        for rank, terms in enumerate(topic_categories.values()):
+            for term in terms:
+                term = term.lower()
+                term_ranks.setdefault(term, rank)
+                for start in range(len(term) + 1):
+                    for end in range(start, len(term) + 1):
+                        self._substring_ranks.setdefault(term[start:end], rank)
+
+        # An empty term is contained in every keyword
+        self._floor_rank: Optional[int] = term_ranks.get('')
+        self._automaton = KeywordAutomaton(term for term in term_ranks if term)
+        self._pattern_ranks = [term_ranks[term] for term in self._automaton.patterns]
+        self._memo: Dict[str, str] = {}
+
+    def _best_rank(self, keyword: str) -> Optional[int]:
+        ranks = [self._pattern_ranks[pattern_id] for _, pattern_id in self._automaton.iter_matches(keyword)]
+        for rank in (self._substring_ranks.get(keyword), self._floor_rank):
+            if rank is not None:
+                ranks.append(rank)
+        return min(ranks) if ranks else None
+
+    def categorize(self, keyword: str) -> str:
+        """Return the category of keyword, or the default if no term matches."""
+        category = self._memo.get(keyword)
+        if category is None:
+            rank = self._best_rank(keyword)
+            category = self.default if rank is None else self.categories[rank]
+            self._memo[keyword] = category
+        return category
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+class EntityMatcher:
+    """Whole-word, case-insensitive matcher for the technicalEntities config.
+
+    Entities are indexed by their first word, so a post is scanned once per
+    word rather than once per entity. A match may not be glued to surrounding
+    word characters: 'git' matches "git rebase" but not "github".
+    """
+
+    def __init__(self, technical_entities: Mapping[str, Iterable[str]]):
+        # Lowercased entity -> spelling of its first occurrence in the config
+        self.entities: Dict[str, str] = {}
+        for entity_list in technical_entities.values():
+            for entity in entity_list:
+                if entity.strip():
+                    self.entities.setdefault(entity.lower(), entity)
+        self._order = {entity: i for i, entity in enumerate(self.entities)}
+
+        self._by_head: Dict[str, List[str]] = {}
+        # Entities that start with punctuation (e.g. '.net') are found with str.find
+        self._unanchored: List[str] = []
+        for entity in self.entities:
+            head = _WORD_PATTERN.match(entity)
+            if head:
+                self._by_head.setdefault(head.group(), []).append(entity)
+            else:
+                self._unanchored.append(entity)
+
+    def _is_whole_word(self, text: str, entity: str, start: int) -> bool:
+        end = start + len(entity)
+        if start > 0 and _is_word_char(entity[0]) and _is_word_char(text[start - 1]):
+            return False
+        if end < len(text) and _is_word_char(entity[-1]) and _is_word_char(text[end]):
+            return False
+        return True
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Count whole-word occurrences of each entity found in text, keyed by lowercased entity."""
+        text = text.lower()
+        counts: Dict[str, int] = {}
+        by_head = self._by_head
+        for word in _WORD_PATTERN.finditer(text):
+            candidates = by_head.get(word.group())
+            if not candidates:
+                continue
+            start = word.start()
+            for entity in candidates:
+                if text.startswith(entity, start) and self._is_whole_word(text, entity, start):
+                    counts[entity] = counts.get(entity, 0) + 1
+
+        for entity in self._unanchored:
+            start = text.find(entity)
+            while start != -1:
+                if self._is_whole_word(text, entity, start):
+                    counts[entity] = counts.get(entity, 0) + 1
+                start = text.find(entity, start + 1)
+        return counts
+
+    def match(self, text: str) -> List[Tuple[str, int]]:
+        """Return (entity, occurrences) pairs, most frequent first, ties in config order."""
+        counts = self.count(text)
+        ranked = sorted(counts, key=lambda entity: (-counts[entity], self._order[entity]))
+        return [(self.entities[entity], counts[entity]) for entity in ranked]
+
+    def extract(self, text: str, stop_words: Iterable[str] = (), limit: int = 15) -> List[str]:
+        """Return matched entities, then proper nouns of text, each most frequent first.
+
+        Entities keep their config spelling, and a proper noun that only differs
+        in case from a matched entity (e.g. "Agents" for 'agents') is dropped.
+        """
+        entities = [entity for entity, _ in self.match(text)]
+        seen = {entity.lower() for entity in entities}
+        stop_words = set(stop_words)
+        proper_nouns = Counter(noun for noun in _PROPER_NOUN_PATTERN.findall(text)
+                               if len(noun) > 3 and noun.lower() not in stop_words)
+        for noun, _ in proper_nouns.most_common():
+            if noun.lower() not in seen:
+                seen.add(noun.lower())
+                entities.append(noun)
+        return entities[:limit]
@@ -0,0 +1,124 @@
+"""
+Text Normalizer
+Shared markdown normalization for reading time, keyword extraction and the
+topic models. Frontmatter and HTML are stripped once per text and every
+derived variant (plain text with word count, lowercase-cleaned, alnum-only) is
+computed at most once from that shared intermediate. Results are memoized per
+text, so stages that normalize the same post within a run share the work.
+"""
+
+import re
+from collections import OrderedDict
+from typing import Optional
+
+_FRONTMATTER = re.compile(r'^---\n.*?\n---\n', re.DOTALL)
+_HTML_TAG = re.compile(r'<[^>]*>')
+_CODE_BLOCK = re.compile(r'```[\s\S]*?```')
+_INLINE_CODE = re.compile(r'`[^`]*`')
+_LINK = re.compile(r'\[([^\]]*)\]\([^)]*\)')
+_MARKDOWN_CHARS = re.compile(r'[#*_~`]')
+_NON_ALNUM = re.compile(r'[^a-zA-Z0-9\s]')
+_WHITESPACE = re.compile(r'\s+')
+
+# Reading-time pass: markup is unwrapped rather than dropped, so its words still count
+_PLAIN_SUBSTITUTIONS = [
+    (_LINK, r'\1'),                          # Links
+    (re.compile(r'\*\*([^*]*)\*\*'), r'\1'),  # Bold
+    (re.compile(r'\*([^*]*)\*'), r'\1'),      # Italic
+    (re.compile(r'`([^`]*)`'), r'\1'),        # Inline code
+    (re.compile(r'#{1,6}\s+'), ''),           # Headers
+    (re.compile(r'>\s+'), ''),                # Blockquotes
+    (re.compile(r'[-*+]\s+'), ''),            # Lists
+    (re.compile(r'\d+\.\s+'), ''),            # Numbered lists
+]
+
+# Number of distinct texts whose normalized forms are kept in memory
+MEMO_MAX_ENTRIES = 256
+
+
+class NormalizedText:
+    """Normalized variants of one markdown text, each computed on first use."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self._body: Optional[str] = None
+        self._unformatted: Optional[str] = None
+        self._plain: Optional[str] = None
+        self._word_count: Optional[int] = None
+        self._cleaned: Optional[str] = None
+        self._alnum: Optional[str] = None
+
+    @property
+    def body(self) -> str:
+        """Text without YAML frontmatter and HTML tags."""
+        if self._body is None:
+            self._body = _HTML_TAG.sub('', _FRONTMATTER.sub('', self.text))
+        return self._body
+
+    def _unwrapped(self) -> str:
+        text = self.body
+        for pattern, replacement in _PLAIN_SUBSTITUTIONS:
+            text = pattern.sub(replacement, text)
+        return text
+
+    @property
+    def plain(self) -> str:
+        """Readable plain text with markdown syntax unwrapped and whitespace collapsed."""
+        if self._plain is None:
+            self._plain = _WHITESPACE.sub(' ', self._unwrapped()).strip()
+        return self._plain
+
+    @property
+    def word_count(self) -> int:
+        """Number of words in the plain text."""
+        if self._word_count is None:
+            # Splitting on whitespace gives the same words with or without the collapse
+            text = self._plain if self._plain is not None else self._unwrapped()
+            self._word_count = len(text.split())
+        return self._word_count
+
+    @property
+    def unformatted(self) -> str:
+        """Body with code, link targets and markdown formatting characters removed."""
+        if self._unformatted is None:
+            text = _CODE_BLOCK.sub('', self.body)
+            text = _INLINE_CODE.sub('', text)
+            text = _LINK.sub(r'\1', text)
+            self._unformatted = _MARKDOWN_CHARS.sub('', text)
+        return self._unformatted
+
+    @property
+    def cleaned(self) -> str:
+        """Lowercase unformatted text with whitespace collapsed, punctuation kept."""
+        if self._cleaned is None:
+            self._cleaned = _WHITESPACE.sub(' ', self.unformatted).lower().strip()
+        return self._cleaned
+
+    @property
+    def alnum(self) -> str:
+        """Unformatted text reduced to ASCII letters, digits and single spaces, case kept."""
+        if self._alnum is None:
+            self._alnum = _WHITESPACE.sub(' ', _NON_ALNUM.sub(' ', self.unformatted)).strip()
+        return self._alnum
+
+    @property
+    def alnum_lower(self) -> str:
+        """Lowercase alnum text."""
+        return self.alnum.lower()
+
+
+_memo: 'OrderedDict[str, NormalizedText]' = OrderedDict()
+
+
+def normalize_text(text: str) -> NormalizedText:
+    """Return the (memoized) normalized variants of a markdown text."""
+    normalized = _memo.get(text)
+    if normalized is not None:
+        _memo.move_to_end(text)
+        return normalized
+
+    normalized = NormalizedText(text)
+    _memo[text] = normalized
+    if len(_memo) > MEMO_MAX_ENTRIES:
+        _memo.popitem(last=False)
+    return normalized
@@ -6,22 +6,24 @@ Uses TF-IDF vectorization, K-means clustering, and LSA for topic discovery.
 
 import json
 import os
-import pickle
-import re
 from collections import defaultdict, Counter
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional
 
 import numpy as np
 from scipy import sparse
 from sklearn.cluster import KMeans
 from sklearn.decomposition import TruncatedSVD
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics import silhouette_score
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
+from nltk.tokenize import sent_tokenize
 from nltk.stem import PorterStemmer
-import frontmatter
+
+from cluster_selection import ClusterSelectionCache, select_k_cached
+from corpus_snapshot import load_corpus_snapshot
+from model_artifacts import save_cluster_centers, save_tfidf_vectorizer
+from stemming_tokenizer import CORPUS_TOKENS_FILE_NAME, STEM_TABLE_FILE_NAME, StemmingTokenizer, TokenCache
+from text_normalizer import normalize_text
 
 
 class TopicDiscoverySystem:
@@ -49,6 +51,9 @@ class TopicDiscoverySystem:
                                'parameter', 'return', 'value', 'string', 'number', 'object', 
                                'array', 'boolean', 'null', 'undefined', 'true', 'false',
                                'blog', 'post', 'article', 'tutorial', 'guide', 'introduction'])
+        
+        # Tokenizer for TF-IDF, with a stem table persisted between runs
+        self.tokenizer = StemmingTokenizer(self.stop_words, os.path.join(self.models_folder, STEM_TABLE_FILE_NAME))
     
     def _ensure_nltk_data(self):
         """Ensure required NLTK data is downloaded."""
@@ -74,77 +79,34 @@ class TopicDiscoverySystem:
         """Collect all published blog posts into a corpus."""
         corpus = []
         
-        for root, dirs, files in os.walk(self.blog_folder):
-            dirs.sort()
-            for file in files:
-                if file.endswith('.md'):
-                    file_path = os.path.join(root, file)
-                    try:
-                        post = frontmatter.load(file_path)
-                        if post.metadata.get('published', False):
-                            # Read full content
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                            
-                            corpus.append({
-                                'title': post.metadata.get('title', ''),
-                                'content': post.content,
-                                'full_content': content,
-                                'path': os.path.relpath(file_path, self.blog_folder),
-                                'metadata': post.metadata
-                            })
-                    except Exception as e:
-                        print(f"Error processing {file_path}: {e}")
+        for path, post in load_corpus_snapshot(self.blog_folder, self.models_folder).iter_posts():
+            if post.metadata.get('published', False):
+                corpus.append({
+                    'title': post.title,
+                    'content': post.content,
+                    'full_content': post.text,
+                    'path': path,
+                    'metadata': post.metadata
+                })
         
         print(f"Collected {len(corpus)} published posts for analysis")
         return corpus
     
     def preprocess_text(self, text: str) -> str:
         """Clean and preprocess text for analysis."""
-        # Remove YAML frontmatter
-        text = re.sub(r'^---\n.*?\n---\n', '', text, flags=re.DOTALL)
-        
-        # Remove HTML tags
-        text = re.sub(r'<[^>]*>', '', text)
-        
-        # Remove code blocks
-        text = re.sub(r'```[\s\S]*?```', '', text)
-        text = re.sub(r'`[^`]*`', '', text)
-        
-        # Convert links to text
-        text = re.sub(r'\[([^\]]*)\]\([^)]*\)', r'\1', text)
-        
-        # Remove markdown formatting
-        text = re.sub(r'[#*_~`]', '', text)
-        
-        # Remove special characters, keep alphanumeric and spaces
-        text = re.sub(r'[^a-zA-Z0-9\s]', ' ', text)
-        
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.lower().strip()
+        return normalize_text(text).alnum_lower
     
     def tokenize_and_stem(self, text: str) -> List[str]:
         """Tokenize text and apply stemming."""
-        # Tokenize
-        tokens = word_tokenize(text)
-        
-        # Filter tokens
-        filtered_tokens = []
-        for token in tokens:
-            if (len(token) > 2 and 
-                token.lower() not in self.stop_words and
-                re.match(r'^[a-z0-9]+$', token.lower()) and
-                not token.isdigit()):
-                # Apply stemming
-                stemmed = self.stemmer.stem(token.lower())
-                filtered_tokens.append(stemmed)
-        
-        return filtered_tokens
+        return self.tokenizer.tokenize(text)
     
-    def build_tfidf_vectors(self, corpus: List[Dict]) -> Tuple[sparse.csr_matrix, TfidfVectorizer, List[str]]:
-        """Build TF-IDF vectors for the corpus."""
+    def build_tfidf_vectors(self, corpus: List[Dict], pretokenize: bool = True) -> Tuple[sparse.csr_matrix, TfidfVectorizer, List[str]]:
+        """Build TF-IDF vectors for the corpus.
+        
+        With pretokenize, every document is tokenized and stemmed once up front
+        (or taken from the persisted corpus tokens of an earlier run) and the
+        token lists are fed to the vectorizer.
+        """
         print("Building TF-IDF vectors...")
         
         # Prepare documents
@@ -170,25 +132,35 @@ class TopicDiscoverySystem:
             min_df=2,           # Ignore terms that appear in less than 2 documents
             max_df=0.8,         # Ignore terms that appear in more than 80% of documents
             ngram_range=(1, 2), # Include unigrams and bigrams
-            tokenizer=self.tokenize_and_stem,
-            lowercase=True,
+            tokenizer=self.tokenizer,
+            preprocessor=StemmingTokenizer.preprocess,  # Lowercases text, passes token lists through
             stop_words=None     # We handle stop words in tokenizer
         )
         
+        if pretokenize:
+            corpus_tokens = TokenCache(self.models_folder, self.tokenizer, CORPUS_TOKENS_FILE_NAME)
+            documents = [corpus_tokens.get(document) for document in documents]
+            corpus_tokens.save()
+        
         # Fit and transform documents
         tfidf_matrix = vectorizer.fit_transform(documents)
+        self.tokenizer.save()
         
         print(f"Created TF-IDF matrix with shape: {tfidf_matrix.shape}")
         
         # Save vectorizer
-        vectorizer_path = os.path.join(self.models_folder, 'tfidf_vectorizer.pkl')
-        with open(vectorizer_path, 'wb') as f:
-            pickle.dump(vectorizer, f)
+        save_tfidf_vectorizer(self.models_folder, vectorizer)
         
         return tfidf_matrix, vectorizer, doc_ids
     
-    def find_optimal_clusters(self, tfidf_matrix: sparse.csr_matrix, max_k: int = 15) -> int:
-        """Find optimal number of clusters using silhouette analysis."""
+    def find_optimal_clusters(self, tfidf_matrix: sparse.csr_matrix, max_k: int = 15,
+                              workers: Optional[int] = None) -> int:
+        """Find optimal number of clusters using silhouette analysis.
+        
+        Candidate k values are scored against one shared distance matrix, in
+        `workers` processes when more than one is given, and the result is
+        reused while the TF-IDF matrix is unchanged.
+        """
         print("Finding optimal number of clusters...")
         
         # Limit max_k to reasonable values
@@ -198,40 +170,17 @@ class TopicDiscoverySystem:
         if max_k < 2:
             return 2
         
-        best_score = -1
-        best_k = 5  # Default fallback
-        
-        # Convert to dense for silhouette analysis (if not too large)
+        # Score small matrices on every document, large ones on a fixed sample
         if tfidf_matrix.shape[0] < 1000 and tfidf_matrix.shape[1] < 1000:
-            dense_matrix = tfidf_matrix.toarray()
-            use_dense = True
+            sample_size = None
         else:
-            dense_matrix = tfidf_matrix
-            use_dense = False
+            sample_size = 500
         
-        for k in range(2, max_k + 1):
-            try:
-                kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-                cluster_labels = kmeans.fit_predict(tfidf_matrix)
-                
-                # Calculate silhouette score
-                if use_dense:
-                    score = silhouette_score(dense_matrix, cluster_labels)
-                else:
-                    # For large matrices, sample subset for silhouette analysis
-                    sample_size = min(500, len(cluster_labels))
-                    indices = np.random.choice(len(cluster_labels), sample_size, replace=False)
-                    score = silhouette_score(tfidf_matrix[indices], cluster_labels[indices])
-                
-                print(f"K={k}: silhouette score = {score:.3f}")
-                
-                if score > best_score:
-                    best_score = score
-                    best_k = k
-                    
-            except Exception as e:
-                print(f"Error with k={k}: {e}")
-                continue
+        best_k, best_score, _ = select_k_cached(
+            ClusterSelectionCache(self.models_folder), tfidf_matrix, range(2, max_k + 1),
+            default_k=5,  # Default fallback
+            sample_size=sample_size, workers=workers
+        )
         
         print(f"Optimal number of clusters: {best_k} (score: {best_score:.3f})")
         return best_k
@@ -250,9 +199,7 @@ class TopicDiscoverySystem:
         kmeans.fit(tfidf_matrix)
         
         # Save clustering model
-        clustering_path = os.path.join(self.models_folder, 'topic_clusters.pkl')
-        with open(clustering_path, 'wb') as f:
-            pickle.dump(kmeans, f)
+        save_cluster_centers(self.models_folder, kmeans)
         
         return kmeans
     
@@ -340,8 +287,12 @@ class TopicDiscoverySystem:
         
         return topic_mapping
     
-    def discover_topics(self, min_clusters: int = 3, max_clusters: int = 12) -> Dict[str, Any]:
-        """Main method to discover topics from the corpus."""
+    def discover_topics(self, min_clusters: int = 3, max_clusters: int = 12,
+                        workers: Optional[int] = None) -> Dict[str, Any]:
+        """Main method to discover topics from the corpus.
+        
+        The k search runs in `workers` processes, one per CPU by default.
+        """
         print("Starting topic discovery...")
         
         # Step 1: Collect corpus
@@ -354,7 +305,7 @@ class TopicDiscoverySystem:
         tfidf_matrix, vectorizer, doc_ids = self.build_tfidf_vectors(corpus)
         
         # Step 3: Find optimal number of clusters
-        optimal_k = self.find_optimal_clusters(tfidf_matrix, max_clusters)
+        optimal_k = self.find_optimal_clusters(tfidf_matrix, max_clusters, workers=workers or os.cpu_count())
         optimal_k = max(min_clusters, min(optimal_k, max_clusters))
         
         # Step 4: Perform clustering
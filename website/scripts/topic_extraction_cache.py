@@ -0,0 +1,141 @@
+"""
+Topic Extraction Cache
+Content-addressed on-disk cache for per-post topic extraction results.
+Posts whose raw bytes are unchanged reuse their stored topic data instead of
+re-running the transformer/enhanced extraction models.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Any, Iterable, Optional
+
+# Bump when the shape or semantics of extracted topic data change
+EXTRACTOR_CODE_VERSION = '1'
+
+CACHE_FILE_NAME = 'topic_extraction_cache.json'
+
+# Extractor modules whose source is part of the cache fingerprint
+_EXTRACTOR_SOURCES = ['enhanced_topic_extraction.py', 'transformer_topic_extraction.py', 'text_matching.py']
+
+
+def hash_bytes(data: bytes) -> str:
+    """Return the SHA-256 hex digest of raw bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path: str) -> Optional[str]:
+    """Return the SHA-256 hex digest of a file, or None if it does not exist."""
+    try:
+        with open(path, 'rb') as f:
+            return hash_bytes(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def compute_extraction_fingerprint(config_path: str, model_name: str,
+                                   artifact_paths: Iterable[str] = (),
+                                   code_version: str = EXTRACTOR_CODE_VERSION) -> str:
+    """Fingerprint everything besides post content that influences extraction output."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parts = [
+        f"version:{code_version}",
+        f"model:{model_name}",
+        f"config:{hash_file(config_path)}",
+    ]
+    for source in _EXTRACTOR_SOURCES:
+        parts.append(f"source:{source}:{hash_file(os.path.join(script_dir, source))}")
+    for path in sorted(artifact_paths):
+        parts.append(f"artifact:{os.path.basename(path)}:{hash_file(path)}")
+    return hash_bytes('\n'.join(parts).encode('utf-8'))
+
+
+def _json_default(obj):
+    """Convert numpy scalars/arrays to plain Python values for JSON storage."""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    if hasattr(obj, 'item'):
+        return obj.item()
+    raise TypeError("Type %s not serializable" % type(obj))
+
+
+class TopicExtractionCache:
+    """Persistent cache of topic dicts keyed by post content hash."""
+
+    def __init__(self, models_folder: str, config_path: str, model_name: str,
+                 artifact_paths: Iterable[str] = (), code_version: str = EXTRACTOR_CODE_VERSION):
+        self.cache_path = os.path.join(models_folder, CACHE_FILE_NAME)
+        self.fingerprint = compute_extraction_fingerprint(config_path, model_name, artifact_paths, code_version)
+        self.entries = self._load()
+        self.used_keys = set()
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load cached entries, discarding them if the fingerprint changed."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable topic extraction cache {self.cache_path}: {e}")
+            return {}
+
+        if data.get('fingerprint') != self.fingerprint:
+            print("Topic extraction cache is stale (config, model or extractor changed) - rebuilding")
+            return {}
+        return data.get('entries', {})
+
+    def key_for(self, raw_content: bytes) -> str:
+        """Return the cache key for a post's raw bytes."""
+        return hash_bytes(raw_content)
+
+    def __contains__(self, raw_content: bytes) -> bool:
+        return self.key_for(raw_content) in self.entries
+
+    def peek(self, raw_content: bytes) -> Optional[Dict[str, Any]]:
+        """Return cached topic data without recording a cache hit."""
+        entry = self.entries.get(self.key_for(raw_content))
+        return dict(entry) if entry is not None else None
+
+    def record_lookup(self, raw_content: bytes, hit: bool):
+        """Record the outcome of a peek() lookup made elsewhere, e.g. in a worker process."""
+        if hit:
+            self.used_keys.add(self.key_for(raw_content))
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def put(self, raw_content: bytes, topic_data: Dict[str, Any]):
+        """Store topic data for the given raw post bytes."""
+        key = self.key_for(raw_content)
+        # Round-trip through JSON so in-memory entries match what is persisted
+        self.entries[key] = json.loads(json.dumps(topic_data, default=_json_default))
+        self.used_keys.add(key)
+        self._dirty = True
+
+    def save(self, prune: bool = True):
+        """Persist the cache, optionally dropping entries not used in this run."""
+        if prune:
+            stale_keys = set(self.entries) - self.used_keys
+            for key in stale_keys:
+                del self.entries[key]
+            if stale_keys:
+                self._dirty = True
+
+        if not self._dirty:
+            return
+
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': self.fingerprint, 'entries': self.entries},
+                      f, sort_keys=True, separators=(',', ':'), default=_json_default)
+        os.replace(tmp_path, self.cache_path)
+        self._dirty = False
+
+    def summary(self) -> str:
+        """Return a one-line hit/miss summary."""
+        return f"{self.hits} cached, {self.misses} extracted ({len(self.entries)} entries)"
@@ -6,7 +6,6 @@ Combines static topic categories with transformer-based semantic analysis.
 
 import json
 import os
-import pickle
 import re
 import time
 from collections import defaultdict, Counter
@@ -17,11 +16,18 @@ import torch
 from sentence_transformers import SentenceTransformer
 from sklearn.cluster import KMeans
 from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.metrics import silhouette_score
 import nltk
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
-import frontmatter
+
+from cluster_selection import ClusterSelectionCache, select_k_cached
+from corpus_snapshot import load_corpus_snapshot
+from document_embedding_store import CLASSIFICATION, DISCOVERY, DocumentEmbeddingStore, discovery_text
+from keyword_embedding_cache import KeywordEmbeddingCache
+from model_artifacts import CATEGORY_EMBEDDINGS, artifact_paths, category_source_hash, load_array_artifact, save_array_artifact
+from semantic_batching import categorize_keywords, encode_length_sorted
+from text_matching import EntityMatcher
+from text_normalizer import normalize_text
 
 # Force CPU usage for transformers to avoid CUDA compatibility issues
 os.environ['CUDA_VISIBLE_DEVICES'] = ''
@@ -80,6 +86,7 @@ class UnifiedTopicExtractor:
         
         # Load configurations
         self.static_config = self._load_static_config()
+        self.entity_matcher = EntityMatcher(self.static_config.get('technicalEntities', {}))
         self.dynamic_topics = self._load_dynamic_topics()
         
         # Initialize NLTK components for fallback
@@ -93,6 +100,16 @@ class UnifiedTopicExtractor:
         
         # Load or create category embeddings
         self._initialize_category_embeddings()
+        
+        # Keyword embeddings/categories shared across posts and runs
+        self.keyword_cache = KeywordEmbeddingCache(
+            self.models_folder,
+            model_name,
+            artifact_paths(self.models_folder, CATEGORY_EMBEDDINGS)[1]
+        )
+        
+        # Whole-document embeddings shared by discovery, classification and similarity
+        self.document_store = DocumentEmbeddingStore(self.models_folder, model_name)
     
     def _ensure_nltk_data(self):
         """Ensure required NLTK data is downloaded."""
@@ -129,20 +146,6 @@ class UnifiedTopicExtractor:
     
     def _initialize_category_embeddings(self):
         """Create or load embeddings for static categories."""
-        embeddings_path = os.path.join(self.models_folder, 'category_embeddings.pkl')
-        
-        try:
-            with open(embeddings_path, 'rb') as f:
-                data = pickle.load(f)
-                self.category_embeddings = data['embeddings']
-                self.category_names = data['names']
-                print(f"Loaded category embeddings for {len(self.category_names)} categories")
-                return
-        except FileNotFoundError:
-            pass
-        
-        # Create category embeddings
-        print("Creating category embeddings...")
         topic_categories = self.static_config.get('topicCategories', {})
         
         if not topic_categories:
@@ -151,7 +154,7 @@ class UnifiedTopicExtractor:
             self.category_names = []
             return
         
-        self.category_names = list(topic_categories.keys())
+        category_names = list(topic_categories.keys())
         category_texts = []
         
         for category, terms in topic_categories.items():
@@ -159,7 +162,20 @@ class UnifiedTopicExtractor:
             category_text = f"{category.replace('-', ' ')} {' '.join(terms)}"
             category_texts.append(category_text)
         
-        # Generate embeddings
+        # Reuse the stored embeddings while the model and category descriptions are unchanged
+        artifact = load_array_artifact(self.models_folder, CATEGORY_EMBEDDINGS, expected={
+            'model': self.model_name,
+            'source': category_source_hash(category_texts)
+        })
+        if artifact is not None:
+            self.category_embeddings, header = artifact
+            self.category_names = header['categories']
+            print(f"Loaded category embeddings for {len(self.category_names)} categories")
+            return
+        
+        # Create category embeddings
+        print("Creating category embeddings...")
+        self.category_names = category_names
         self.category_embeddings = self.sentence_model.encode(
             category_texts, 
             convert_to_numpy=True,
@@ -167,11 +183,12 @@ class UnifiedTopicExtractor:
         )
         
         # Save embeddings
-        with open(embeddings_path, 'wb') as f:
-            pickle.dump({
-                'embeddings': self.category_embeddings,
-                'names': self.category_names
-            }, f)
+        save_array_artifact(self.models_folder, CATEGORY_EMBEDDINGS, self.category_embeddings, {
+            'model': self.model_name,
+            'source': category_source_hash(category_texts),
+            'dimension': int(self.category_embeddings.shape[1]),
+            'categories': self.category_names
+        })
         
         print(f"Created and saved embeddings for {len(self.category_names)} categories")
     
@@ -208,37 +225,34 @@ class UnifiedTopicExtractor:
     
     def preprocess_text(self, text: str) -> str:
         """Clean and preprocess text for analysis."""
-        # Remove YAML frontmatter
-        text = re.sub(r'^---\n.*?\n---\n', '', text, flags=re.DOTALL)
-        # Remove HTML tags
-        text = re.sub(r'<[^>]*>', '', text)
-        # Remove code blocks
-        text = re.sub(r'```[\s\S]*?```', '', text)
-        text = re.sub(r'`[^`]*`', '', text)
-        # Convert links to text
-        text = re.sub(r'\[([^\]]*)\]\([^)]*\)', r'\1', text)
-        # Remove markdown formatting
-        text = re.sub(r'[#*_~`]', '', text)
-        # Remove special characters
-        text = re.sub(r'[^a-zA-Z0-9\s]', ' ', text)
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        return normalize_text(text).alnum
+    
+    def _encode_length_sorted(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        """Encode texts in batches of similar length, returning embeddings in input order."""
+        return encode_length_sorted(self.sentence_model, texts, batch_size)
+    
+    def _classification_text(self, content: str, title: str = '') -> str:
+        """Build the preprocessed text used for topic classification."""
+        # Combine title and content with title weighting
+        combined_text = f"{title} {title} {content}"
+        return self.preprocess_text(combined_text)
     
     def classify_topic_semantic(self, content: str, title: str = '') -> Tuple[str, float, List[str]]:
         """Classify topic using semantic similarity to category embeddings."""
         if self.category_embeddings.size == 0:
             return 'general-technology', 0.0, []
         
-        # Combine title and content with title weighting
-        combined_text = f"{title} {title} {content}"
-        processed_text = self.preprocess_text(combined_text)
+        processed_text = self._classification_text(content, title)
         
-        # Generate embedding for the content
-        content_embedding = self.sentence_model.encode([processed_text])
+        # Generate embedding for the content, unless this exact text was embedded before
+        content_embedding = self.document_store.embed(CLASSIFICATION, [processed_text], self.sentence_model.encode)
         
+        return self._classify_embedding(content_embedding[0])
+    
+    def _classify_embedding(self, content_embedding: np.ndarray) -> Tuple[str, float, List[str]]:
+        """Classify a document embedding against the category embeddings."""
         # Calculate similarities to all categories
-        similarities = cosine_similarity(content_embedding, self.category_embeddings)[0]
+        similarities = cosine_similarity([content_embedding], self.category_embeddings)[0]
         
         # Get sorted indices
         sorted_indices = np.argsort(similarities)[::-1]
@@ -256,13 +270,15 @@ class UnifiedTopicExtractor:
         
         return primary_topic, confidence, secondary_topics
     
+    def _keyword_sentences(self, content: str) -> List[str]:
+        """Split preprocessed content into sentences long enough for keyword analysis."""
+        processed_content = self.preprocess_text(content)
+        return [s.strip() for s in processed_content.split('.') if len(s.strip()) > 20]
+    
     def extract_keywords_semantic(self, content: str, max_keywords: int = 15) -> List[Dict]:
         """Extract keywords using transformer-based approach with fallback to traditional TF."""
-        # Preprocess content
-        processed_content = self.preprocess_text(content)
-        
         # Split into sentences for analysis
-        sentences = [s.strip() for s in processed_content.split('.') if len(s.strip()) > 20]
+        sentences = self._keyword_sentences(content)
         
         if not sentences:
             return self._extract_keywords_fallback(content, max_keywords)
@@ -274,6 +290,14 @@ class UnifiedTopicExtractor:
             print(f"Error generating sentence embeddings: {e}")
             return self._extract_keywords_fallback(content, max_keywords)
         
+        sentence_word_freqs, sentence_score = self._keyword_candidates(sentences, sentence_embeddings)
+        categories = self._categorize_keywords_semantic(
+            [word for word_freq in sentence_word_freqs for word in word_freq]
+        )
+        return self._rank_keywords(sentence_word_freqs, sentence_score, categories, max_keywords)
+    
+    def _keyword_candidates(self, sentences: List[str], sentence_embeddings: np.ndarray) -> Tuple[List[Counter], float]:
+        """Pick the most representative sentences and count their candidate keywords."""
         # Extract keywords from high-importance sentences
         # Use centroid approach: sentences close to the document centroid are most representative
         doc_centroid = np.mean(sentence_embeddings, axis=0)
@@ -283,19 +307,29 @@ class UnifiedTopicExtractor:
         top_sentence_indices = np.argsort(sentence_similarities)[-5:]  # Top 5 sentences
         important_sentences = [sentences[i] for i in top_sentence_indices]
         
-        # Extract keywords from important sentences
-        keywords = []
+        # Tokenize important sentences first so all candidate keywords can be
+        # categorized with a single batched encode
+        sentence_word_freqs = []
         for sentence in important_sentences:
             words = [word.lower() for word in word_tokenize(sentence) 
                     if len(word) > 2 and word.lower() not in self.stop_words 
                     and re.match(r'^[a-z0-9-]+$', word.lower())]
-            
-            word_freq = Counter(words)
+            sentence_word_freqs.append(Counter(words))
+        
+        sentence_score = sentence_similarities[top_sentence_indices[0]] if len(top_sentence_indices) > 0 else 1
+        return sentence_word_freqs, sentence_score
+    
+    def _rank_keywords(self, sentence_word_freqs: List[Counter], sentence_score: float,
+                       categories: Dict[str, str], max_keywords: int) -> List[Dict]:
+        """Score, deduplicate and rank candidate keywords."""
+        # Extract keywords from important sentences
+        keywords = []
+        for word_freq in sentence_word_freqs:
             for word, freq in word_freq.items():
-                category = self._categorize_keyword_semantic(word)
+                category = categories[word]
                 keywords.append({
                     'term': word,
-                    'score': freq * sentence_similarities[top_sentence_indices[0]] if len(top_sentence_indices) > 0 else freq,
+                    'score': freq * sentence_score,
                     'category': category,
                     'method': 'transformer-semantic'
                 })
@@ -324,10 +358,11 @@ class UnifiedTopicExtractor:
         
         total_words = len(words)
         keywords = []
+        categories = self._categorize_keywords_semantic(list(frequent_words))
         
         for word, freq in frequent_words.items():
             tf = freq / total_words if total_words > 0 else 0
-            category = self._categorize_keyword_semantic(word)
+            category = categories[word]
             keywords.append({
                 'term': word,
                 'score': tf,
@@ -339,47 +374,47 @@ class UnifiedTopicExtractor:
     
     def _categorize_keyword_semantic(self, keyword: str) -> str:
         """Categorize keyword using semantic similarity if possible."""
-        if self.category_embeddings.size == 0:
-            return 'general'
-        
+        return self._categorize_keywords_semantic([keyword])[keyword]
+    
+    def _categorize_keywords_semantic(self, keywords: List[str]) -> Dict[str, str]:
+        """Categorize many keywords with one batched encode and one similarity matrix."""
+        return categorize_keywords(self.sentence_model, keywords, self.category_embeddings,
+                                   self.category_names, self.keyword_cache)
+    
+    def save_keyword_cache(self):
+        """Persist the keyword embedding cache for the next run."""
         try:
-            # Generate embedding for keyword
-            keyword_embedding = self.sentence_model.encode([keyword])
-            
-            # Find most similar category
-            similarities = cosine_similarity(keyword_embedding, self.category_embeddings)[0]
-            best_category_idx = np.argmax(similarities)
-            
-            # Only assign to category if similarity is above threshold
-            if similarities[best_category_idx] > 0.4:
-                return self.category_names[best_category_idx]
-            
-        except Exception:
-            pass
-        
-        return 'general'
+            self.keyword_cache.save()
+        except OSError as e:
+            print(f"Warning: Could not save keyword embedding cache: {e}")
+    
+    def take_cache_updates(self) -> Dict:
+        """Return the keyword and document embeddings stored since the last call, for merging elsewhere."""
+        return {
+            'keywords': self.keyword_cache.take_updates(),
+            'documents': self.document_store.take_updates()
+        }
+    
+    def merge_cache_updates(self, updates: Dict):
+        """Merge embeddings taken from an extractor in another process."""
+        self.keyword_cache.merge_updates(updates['keywords'])
+        self.document_store.merge_updates(updates['documents'])
+    
+    def save_document_embeddings(self, prune: bool = True):
+        """Persist the document embedding store for the next run."""
+        try:
+            self.document_store.save(prune=prune)
+        except OSError as e:
+            print(f"Warning: Could not save document embedding store: {e}")
     
     def extract_entities_enhanced(self, content: str) -> List[str]:
         """Enhanced entity extraction using transformers for context understanding."""
-        entities = set()
-        
-        # Traditional entity extraction from static config
-        normalized_content = content.lower()
-        technical_entities = self.static_config.get('technicalEntities', {})
-        for entity_list in technical_entities.values():
-            for entity in entity_list:
-                if entity.lower() in normalized_content:
-                    entities.add(entity)
-        
-        # Extract proper nouns and technical terms
-        proper_nouns = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', content)
-        for noun in proper_nouns:
-            if len(noun) > 3 and noun.lower() not in self.stop_words:
-                entities.add(noun)
+        # Traditional entity extraction from static config, then proper nouns
+        entities = self.entity_matcher.extract(content, self.stop_words)
         
         # TODO: Add transformer-based NER when needed
         
-        return list(entities)[:15]
+        return entities
     
     def assess_content_complexity_enhanced(self, content: str, keywords: List[Dict]) -> str:
         """Enhanced complexity assessment using transformer insights."""
@@ -477,38 +512,109 @@ class UnifiedTopicExtractor:
             # Extract keywords using transformer approach
             keywords = self.extract_keywords_semantic(content)
             
-            # Extract entities
-            entities = self.extract_entities_enhanced(content)
-            
-            # Assess complexity
-            complexity = self.assess_content_complexity_enhanced(content, keywords)
-            
-            # Identify target audience
-            target_audience = self.identify_target_audience_enhanced(keywords, complexity)
-            
-            # Related concepts (top keywords)
-            related_concepts = [k['term'] for k in keywords[:8]]
-            
-            result = {
-                'topic-primary': primary_topic,
-                'topic-secondary': secondary_topics,
-                'content-entities': entities,
-                'topic-confidence': round(confidence, 2),
-                'related-concepts': related_concepts,
-                'content-complexity': complexity,
-                'target-audience': target_audience,
-                'classification-method': 'transformer-semantic',
-                'keyword-count': len(keywords),
-                'transformer-keywords': len([k for k in keywords if k.get('method', '').startswith('transformer')])
-            }
-            
-            return result
+            return self._build_topic_result(content, primary_topic, confidence, secondary_topics, keywords)
             
         except Exception as e:
             print(f"Error in unified topic extraction: {e}")
             # Fallback to basic extraction
             return self._extract_topics_fallback(content, title)
     
+    def extract_topics_batch(self, documents: List[Tuple[str, str]], batch_size: int = 32) -> List[Dict[str, Any]]:
+        """Extract topics for many (content, title) documents at once.
+        
+        Documents and keyword sentences of the whole batch are encoded with
+        length-sorted batched encode calls, then the embeddings are fanned back
+        out to one topic dict per document, in input order.
+        """
+        if not documents:
+            return []
+        
+        try:
+            doc_sentences = [self._keyword_sentences(content) for content, _ in documents]
+            flat_sentences = [sentence for sentences in doc_sentences for sentence in sentences]
+            
+            doc_embeddings = None
+            if self.category_embeddings.size > 0:
+                doc_embeddings = self.document_store.embed(
+                    CLASSIFICATION,
+                    [self._classification_text(content, title) for content, title in documents],
+                    lambda texts: self._encode_length_sorted(texts, batch_size)
+                )
+            sentence_embeddings = self._encode_length_sorted(flat_sentences, batch_size)
+        except Exception as e:
+            print(f"Batched encoding failed, extracting documents one at a time: {e}")
+            return [self.extract_topics_unified(content, title) for content, title in documents]
+        
+        # Pick keyword candidates per document, then categorize the whole vocabulary at once
+        candidates = []
+        offset = 0
+        for sentences in doc_sentences:
+            if sentences:
+                embeddings = sentence_embeddings[offset:offset + len(sentences)]
+                offset += len(sentences)
+                try:
+                    candidates.append(self._keyword_candidates(sentences, embeddings))
+                except Exception as e:
+                    print(f"Error selecting keyword candidates: {e}")
+                    candidates.append(None)
+            else:
+                candidates.append(None)
+        categories = self._categorize_keywords_semantic([
+            word
+            for candidate in candidates if candidate is not None
+            for word_freq in candidate[0]
+            for word in word_freq
+        ])
+        
+        results = []
+        for i, (content, title) in enumerate(documents):
+            try:
+                if doc_embeddings is not None:
+                    primary_topic, confidence, secondary_topics = self._classify_embedding(doc_embeddings[i])
+                else:
+                    primary_topic, confidence, secondary_topics = 'general-technology', 0.0, []
+                
+                if candidates[i] is not None:
+                    sentence_word_freqs, sentence_score = candidates[i]
+                    keywords = self._rank_keywords(sentence_word_freqs, sentence_score, categories, 15)
+                else:
+                    keywords = self._extract_keywords_fallback(content, 15)
+                
+                results.append(self._build_topic_result(content, primary_topic, confidence, secondary_topics, keywords))
+            except Exception as e:
+                print(f"Error in unified topic extraction: {e}")
+                results.append(self._extract_topics_fallback(content, title))
+        
+        return results
+    
+    def _build_topic_result(self, content: str, primary_topic: str, confidence: float,
+                            secondary_topics: List[str], keywords: List[Dict]) -> Dict[str, Any]:
+        """Assemble the topic dict from classification and keyword results."""
+        # Extract entities
+        entities = self.extract_entities_enhanced(content)
+        
+        # Assess complexity
+        complexity = self.assess_content_complexity_enhanced(content, keywords)
+        
+        # Identify target audience
+        target_audience = self.identify_target_audience_enhanced(keywords, complexity)
+        
+        # Related concepts (top keywords)
+        related_concepts = [k['term'] for k in keywords[:8]]
+        
+        return {
+            'topic-primary': primary_topic,
+            'topic-secondary': secondary_topics,
+            'content-entities': entities,
+            'topic-confidence': round(confidence, 2),
+            'related-concepts': related_concepts,
+            'content-complexity': complexity,
+            'target-audience': target_audience,
+            'classification-method': 'transformer-semantic',
+            'keyword-count': len(keywords),
+            'transformer-keywords': len([k for k in keywords if k.get('method', '').startswith('transformer')])
+        }
+    
     def _extract_topics_fallback(self, content: str, title: str) -> Dict[str, Any]:
         """Fallback topic extraction when transformer approach fails."""
         print("Using fallback topic extraction method")
@@ -559,8 +665,7 @@ class UnifiedTopicExtractor:
         doc_metadata = []
         
         for post in corpus:
-            combined_text = f"{post['title']} {post['content']}"
-            processed_text = self.preprocess_text(combined_text)
+            processed_text = discovery_text(post['title'], post['content'])
             documents.append(processed_text)
             doc_metadata.append(post)
         
@@ -578,8 +683,9 @@ class UnifiedTopicExtractor:
                 verbose=True
             )
             
-            # Fit the model
-            topics, probs = topic_model.fit_transform(documents)
+            # Fit the model on stored embeddings so only new or changed posts are encoded
+            embeddings = self._embed_discovery_documents(documents, doc_metadata)
+            topics, probs = topic_model.fit_transform(documents, embeddings=embeddings)
             
             # Get topic information
             topic_info = topic_model.get_topic_info()
@@ -627,8 +733,11 @@ class UnifiedTopicExtractor:
             print(f"Error in advanced topic discovery: {e}")
             return self.discover_topics_basic(blog_folder)
     
-    def discover_topics_basic(self, blog_folder: str) -> Dict[str, Any]:
-        """Basic topic discovery using sentence transformers + K-means."""
+    def discover_topics_basic(self, blog_folder: str, workers: Optional[int] = None) -> Dict[str, Any]:
+        """Basic topic discovery using sentence transformers + K-means.
+        
+        The k search runs in `workers` processes, one per CPU by default.
+        """
         print("Starting basic transformer-based topic discovery...")
         
         # Collect corpus
@@ -643,8 +752,7 @@ class UnifiedTopicExtractor:
         doc_metadata = []
         
         for post in corpus:
-            combined_text = f"{post['title']} {post['content']}"
-            processed_text = self.preprocess_text(combined_text)
+            processed_text = discovery_text(post['title'], post['content'])
             
             if len(processed_text.split()) < 10:  # Skip very short posts
                 continue
@@ -655,12 +763,11 @@ class UnifiedTopicExtractor:
         if not documents:
             return {'discoveredTopics': {}, 'topicStats': {}, 'documentAssignments': []}
         
-        # Generate embeddings
-        print(f"Generating embeddings for {len(documents)} documents...")
-        embeddings = self.sentence_model.encode(documents, show_progress_bar=True)
+        # Generate embeddings for new or changed posts
+        embeddings = self._embed_discovery_documents(documents, doc_metadata)
         
         # Determine optimal number of clusters
-        optimal_k = self._find_optimal_clusters_embeddings(embeddings)
+        optimal_k = self._find_optimal_clusters_embeddings(embeddings, workers=workers or os.cpu_count())
         
         # Perform clustering
         print(f"Performing K-means clustering with {optimal_k} clusters...")
@@ -710,52 +817,49 @@ class UnifiedTopicExtractor:
         """Collect published blog posts."""
         corpus = []
         
-        for root, dirs, files in os.walk(blog_folder):
-            dirs.sort()
-            for file in files:
-                if file.endswith('.md'):
-                    file_path = os.path.join(root, file)
-                    try:
-                        post = frontmatter.load(file_path)
-                        if post.metadata.get('published', False):
-                            corpus.append({
-                                'title': post.metadata.get('title', ''),
-                                'content': post.content,
-                                'path': os.path.relpath(file_path, blog_folder),
-                                'metadata': post.metadata
-                            })
-                    except Exception as e:
-                        print(f"Error processing {file_path}: {e}")
+        for path, post in load_corpus_snapshot(blog_folder, self.models_folder).iter_posts():
+            if post.metadata.get('published', False):
+                corpus.append({
+                    'title': post.title,
+                    'content': post.content,
+                    'path': path,
+                    'metadata': post.metadata
+                })
         
         print(f"Collected {len(corpus)} published posts for analysis")
         return corpus
     
-    def _find_optimal_clusters_embeddings(self, embeddings: np.ndarray, max_k: int = 10) -> int:
-        """Find optimal number of clusters for embeddings using silhouette analysis."""
+    def _embed_discovery_documents(self, documents: List[str], doc_metadata: List[Dict]) -> np.ndarray:
+        """Embed preprocessed posts for topic discovery, reusing stored vectors of unchanged posts."""
+        def encode(texts: List[str]) -> np.ndarray:
+            print(f"Generating embeddings for {len(texts)} of {len(documents)} documents...")
+            return self.sentence_model.encode(texts, show_progress_bar=True)
+        
+        embeddings = self.document_store.embed(
+            DISCOVERY, documents, encode, keys=[post['path'] for post in doc_metadata]
+        )
+        self.save_document_embeddings()
+        return embeddings
+    
+    def _find_optimal_clusters_embeddings(self, embeddings: np.ndarray, max_k: int = 10,
+                                          workers: Optional[int] = None) -> int:
+        """Find optimal number of clusters for embeddings using silhouette analysis.
+        
+        Candidates are scored in `workers` processes when more than one is
+        given, and the sweep is skipped when the same embeddings were
+        clustered before.
+        """
         n_samples = len(embeddings)
         max_k = min(max_k, n_samples // 2, 15)
         
         if max_k < 2:
             return min(3, n_samples)
         
-        best_score = -1
-        best_k = min(5, max_k)  # Default fallback
-        
-        for k in range(2, max_k + 1):
-            try:
-                kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-                cluster_labels = kmeans.fit_predict(embeddings)
-                
-                score = silhouette_score(embeddings, cluster_labels)
-                print(f"K={k}: silhouette score = {score:.3f}")
-                
-                if score > best_score:
-                    best_score = score
-                    best_k = k
-                    
-            except Exception as e:
-                print(f"Error with k={k}: {e}")
-                continue
+        best_k, best_score, _ = select_k_cached(
+            ClusterSelectionCache(self.models_folder), embeddings, range(2, max_k + 1),
+            default_k=min(5, max_k),  # Default fallback
+            workers=workers
+        )
         
         print(f"Optimal number of clusters: {best_k} (score: {best_score:.3f})")
         return best_k